@@ -40,5 +40,9 @@ def classFactory(iface):  # pylint: disable=invalid-name
     if plugin_dir not in sys.path:
         sys.path.append(plugin_dir)
 
-    from .digital_sketch_mapping_tool import DigitalSketchMappingTool
-    return DigitalSketchMappingTool(iface)
+    from startup_profiler import profiler
+
+    with profiler.step("classFactory"):
+        with profiler.step("imports"):
+            from .digital_sketch_mapping_tool import DigitalSketchMappingTool
+        return DigitalSketchMappingTool(iface)
@@ -1,12 +1,11 @@
 
 from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt import uic
 from qgis.core import QgsApplication
-import os
 
+from form_loader import load_form
 from keypad_manager import KeypadItem
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "add_or_edit_element.ui"))
+FORM_CLASS = load_form("add_or_edit_element.ui")
 
 class AddOrEditElement(QDialog, FORM_CLASS):
     def __init__(self, item=None, parent=None):
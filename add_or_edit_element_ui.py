@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'add_or_edit_element.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(386, 103)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        Dialog.setWindowIcon(icon)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setContentsMargins(5, 5, 5, 5)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame = QtWidgets.QFrame(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frame.sizePolicy().hasHeightForWidth())
+        self.frame.setSizePolicy(sizePolicy)
+        self.frame.setMinimumSize(QtCore.QSize(0, 41))
+        self.frame.setMaximumSize(QtCore.QSize(16777215, 41))
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setContentsMargins(5, 2, 5, 2)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.elementLabel = QtWidgets.QLabel(self.frame)
+        self.elementLabel.setMinimumSize(QtCore.QSize(0, 40))
+        self.elementLabel.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.elementLabel.setFont(font)
+        self.elementLabel.setObjectName("elementLabel")
+        self.horizontalLayout.addWidget(self.elementLabel)
+        self.elementLineEdit = QtWidgets.QLineEdit(self.frame)
+        self.elementLineEdit.setMinimumSize(QtCore.QSize(0, 40))
+        self.elementLineEdit.setMaximumSize(QtCore.QSize(16777215, 40))
+        self.elementLineEdit.setSizeIncrement(QtCore.QSize(0, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.elementLineEdit.setFont(font)
+        self.elementLineEdit.setObjectName("elementLineEdit")
+        self.horizontalLayout.addWidget(self.elementLineEdit)
+        self.verticalLayout.addWidget(self.frame)
+        self.frame_2 = QtWidgets.QFrame(Dialog)
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout_2.setContentsMargins(5, 2, 5, 2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.discardPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.discardPushButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.discardPushButton.setMaximumSize(QtCore.QSize(125, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.discardPushButton.setFont(font)
+        self.discardPushButton.setObjectName("discardPushButton")
+        self.horizontalLayout_2.addWidget(self.discardPushButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.applyPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.applyPushButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.applyPushButton.setMaximumSize(QtCore.QSize(125, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.applyPushButton.setFont(font)
+        self.applyPushButton.setObjectName("applyPushButton")
+        self.horizontalLayout_2.addWidget(self.applyPushButton)
+        self.verticalLayout.addWidget(self.frame_2)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Add/Edit Element"))
+        self.elementLabel.setText(_translate("Dialog", "Element: "))
+        self.discardPushButton.setText(_translate("Dialog", "Discard"))
+        self.applyPushButton.setText(_translate("Dialog", "Apply"))
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "91666c2bd66485a7ab5b3ba390d501fe29dfc85225043187588015e7efc60458"
@@ -1,44 +1,23 @@
 
 from PyQt5.QtGui import QColor
-from qgis.PyQt.QtWidgets import (QDialog, QCheckBox, QWidget, QListWidgetItem, QHBoxLayout,
-                                 QLabel, QPushButton, QSpacerItem, QSizePolicy)
-from qgis.PyQt import uic
+from qgis.PyQt.QtWidgets import QDialog
 from qgis.core import QgsApplication
-import os
-from qgis.gui import QgsColorButton
 from PyQt5.QtCore import Qt
 
 from add_or_edit_element import AddOrEditElement
 from confirmation import ConfirmationDialog
-from helper import show_delete_confirmation, get_existing_enabled_layers, get_default_auto_update_interval
+from form_loader import load_form
+from keypad_manager import KeypadItem
+from keypad_models import CategoryListModel, ElementListModel, CategoryDelegate, ElementDelegate
+from helper import (show_delete_confirmation, get_existing_enabled_layers, get_default_auto_update_interval,
+                    get_default_stream_tolerance, get_default_frame_rate,
+                    get_default_simplify_tolerance, get_default_grid_precision, get_renderer_modes,
+                    get_default_renderer_mode, get_keypad_modes, get_default_keypad_mode)
 from new_category import NewCategory
 from select_existing_layer import SelectExistingLayerDialog
 
-# Load the UI file dynamically
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "app_settings.ui"))
-
-
-def update_colour(pad, colour):
-    """Update the colour of the keypad category.
-
-    :param pad: Keypad category
-    :type pad: KeypadCategory
-
-    :param colour: New colour
-    :type colour: QColor
-    """
-    pad.colour = colour.name()
-
-
-def get_category_element(text):
-    """Get the category and element from the text.
-
-    :param text: Text to parse
-    :type text: str
-
-    :return: Category and element
-    """
-    return text.split(':')
+# Load the compiled form of the UI file
+FORM_CLASS = load_form("app_settings.ui")
 
 
 class AppSettingsDialog(QDialog, FORM_CLASS):
@@ -63,9 +42,19 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         self.add_bing_imagery = False
         self.setupUi(self)
         self.keypad_manager = keypad_manager
-        self.keypad_manager.load_data()
-        self.categoryListWidget.itemSelectionChanged.connect(self.on_category_item_selected)
-        self.elementListWidget.itemSelectionChanged.connect(self.on_element_item_selected)
+        self.keypad_manager.reload_if_changed()
+        self.category_model = CategoryListModel(self.keypad_manager, self)
+        self.category_delegate = CategoryDelegate(self)
+        self.categoryListView.setModel(self.category_model)
+        self.categoryListView.setItemDelegate(self.category_delegate)
+        self.element_model = ElementListModel(self.keypad_manager, self)
+        self.element_delegate = ElementDelegate(self)
+        self.elementListView.setModel(self.element_model)
+        self.elementListView.setItemDelegate(self.element_delegate)
+        self.categoryListView.selectionModel().currentChanged.connect(self.on_category_item_selected)
+        self.elementListView.selectionModel().currentChanged.connect(self.on_element_item_selected)
+        self.category_delegate.buttonClicked.connect(self.category_button_clicked)
+        self.element_delegate.buttonClicked.connect(self.element_button_clicked)
         self.selected_category = ''
         self.selected_element = ''
         self.folder_location = None
@@ -81,6 +70,18 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         self.new_project = False
         self.update_interval = get_default_auto_update_interval()
         self.rotate_recenter_on_done = False
+        self.stream_tolerance = get_default_stream_tolerance()
+        self.streamToleranceSpinBox.setValue(self.stream_tolerance)
+        self.frame_rate = get_default_frame_rate()
+        self.frameRateSpinBox.setValue(self.frame_rate)
+        self.simplify_tolerance = get_default_simplify_tolerance()
+        self.simplifyToleranceSpinBox.setValue(self.simplify_tolerance)
+        self.grid_precision = get_default_grid_precision()
+        self.gridPrecisionSpinBox.setValue(self.grid_precision)
+        self.renderer_mode = get_default_renderer_mode()
+        self.rendererModeComboBox.setCurrentIndex(get_renderer_modes().index(self.renderer_mode))
+        self.keypad_mode = get_default_keypad_mode()
+        self.keypadModeComboBox.setCurrentIndex(get_keypad_modes().index(self.keypad_mode))
         intervals_list = [5,10,20,30,40,50,60]
         self.autoUpdateComboBox.setCurrentIndex(intervals_list.index(self.update_interval))
 
@@ -111,12 +112,23 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
             self.autoUpdateComboBox.setCurrentIndex(intervals_list.index(self.update_interval))
             self.rotate_recenter_on_done = attributes["rotate_recenter_on_done"]
             self.rorateAndRecenterCheckBox.setChecked(attributes["rotate_recenter_on_done"])
+            self.stream_tolerance = attributes["stream_tolerance"]
+            self.streamToleranceSpinBox.setValue(self.stream_tolerance)
+            self.frame_rate = attributes["frame_rate"]
+            self.frameRateSpinBox.setValue(self.frame_rate)
+            self.simplify_tolerance = attributes["simplify_tolerance"]
+            self.simplifyToleranceSpinBox.setValue(self.simplify_tolerance)
+            self.grid_precision = attributes["grid_precision"]
+            self.gridPrecisionSpinBox.setValue(self.grid_precision)
+            self.renderer_mode = attributes["renderer_mode"]
+            self.rendererModeComboBox.setCurrentIndex(get_renderer_modes().index(self.renderer_mode))
+            self.keypad_mode = attributes["keypad_mode"]
+            self.keypadModeComboBox.setCurrentIndex(get_keypad_modes().index(self.keypad_mode))
 
         if disable_existing:
             self.useExistingLayerCheckBox.setDisabled(True)
 
         self.updated_settings = False
-        self.clear_and_populate_categories()
 
         # Setup button and widget signals
         self.moveDownPadItemPushButton.clicked.connect(lambda :self.move_category("down"))
@@ -138,6 +150,12 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         self.bingImageryCheckBox.stateChanged.connect(lambda state: self.set_add_bing_imagery(state))
         self.rorateAndRecenterCheckBox.stateChanged.connect(self.set_rotate_and_recenter)
         self.autoUpdateComboBox.currentIndexChanged.connect(self.gps_auto_update_interval_updated)
+        self.streamToleranceSpinBox.valueChanged.connect(self.stream_tolerance_updated)
+        self.frameRateSpinBox.valueChanged.connect(self.frame_rate_updated)
+        self.simplifyToleranceSpinBox.valueChanged.connect(self.simplify_tolerance_updated)
+        self.gridPrecisionSpinBox.valueChanged.connect(self.grid_precision_updated)
+        self.rendererModeComboBox.currentIndexChanged.connect(self.renderer_mode_updated)
+        self.keypadModeComboBox.currentIndexChanged.connect(self.keypad_mode_updated)
 
 
     def move_category(self, direction):
@@ -146,8 +164,8 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         :param direction: Direction to move the category, either "up" or "down"
         :type direction: str
         """
-        self.keypad_manager.move_category(self.selected_category,direction)
-        self.clear_and_populate_categories()
+        row = self.category_model.move_category(self.categoryListView.currentIndex().row(), direction)
+        self.categoryListView.setCurrentIndex(self.category_model.index(row))
 
 
     def move_element(self, direction):
@@ -156,20 +174,8 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         :param direction: Direction to move the element, either "up" or "down"
         :type direction: str
         """
-        self.keypad_manager.move_item(self.selected_category, self.selected_element, direction)
-        self.clear_populate_elements_list(self.selected_category)
-
-
-    def checkbox_state_changed(self, checkbox, state):
-        """Handle the state change of a keypad category checkbox.
-
-        :param checkbox: The checkbox widget
-        :type checkbox: QWidget
-
-        :param state: The new state of the checkbox
-        :type state: int
-        """
-        self.keypad_manager.set_category_selection(checkbox.objectName(), state)
+        row = self.element_model.move_element(self.elementListView.currentIndex().row(), direction)
+        self.elementListView.setCurrentIndex(self.element_model.index(row))
 
 
     def add_category(self):
@@ -179,8 +185,7 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         if add_dialog.exec_() == QDialog.Accepted:
             data = add_dialog.get_add_data()
             if data:
-                self.keypad_manager.add_category(data)
-                self.clear_and_populate_categories()
+                self.category_model.add_category(data)
 
 
     def add_element(self):
@@ -193,8 +198,7 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         if add_element.exec_() == QDialog.Accepted:
             data = add_element.get_item()
             if data.item != "":
-                self.keypad_manager.add_item(self.selected_category, data)
-                self.clear_populate_elements_list(self.selected_category)
+                self.element_model.add_element(data)
 
 
     def gps_auto_update_interval_updated(self, index):
@@ -206,6 +210,60 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         self.update_interval = int(self.autoUpdateComboBox.itemText(index))
 
 
+    def stream_tolerance_updated(self, value):
+        """Update the stream tolerance when the spinbox value is changed.
+
+        :param value: Tolerance in screen pixels
+        :type value: int
+        """
+        self.stream_tolerance = value
+
+
+    def frame_rate_updated(self, value):
+        """Update the sketch frame rate when the spinbox value is changed.
+
+        :param value: Rubber band updates per second
+        :type value: int
+        """
+        self.frame_rate = value
+
+
+    def simplify_tolerance_updated(self, value):
+        """Update the save simplification tolerance when the spinbox value is changed.
+
+        :param value: Tolerance in metres
+        :type value: float
+        """
+        self.simplify_tolerance = value
+
+
+    def grid_precision_updated(self, value):
+        """Update the coordinate grid size when the spinbox value is changed.
+
+        :param value: Grid size in metres
+        :type value: float
+        """
+        self.grid_precision = value
+
+
+    def renderer_mode_updated(self, index):
+        """Update the polygon renderer mode when the combobox value is changed.
+
+        :param index: Index of the selected item in the combobox
+        :type index: int
+        """
+        self.renderer_mode = get_renderer_modes()[index]
+
+
+    def keypad_mode_updated(self, index):
+        """Update the keypad mode when the combobox value is changed.
+
+        :param index: Index of the selected item in the combobox
+        :type index: int
+        """
+        self.keypad_mode = get_keypad_modes()[index]
+
+
     def apply_settings(self):
         """Apply the app settings to the project."""
 
@@ -226,7 +284,13 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
             "project_changed" : self.project_changed,
             "add_bing_imagery" : self.add_bing_imagery,
             "update_interval": self.update_interval,
-            "rotate_recenter_on_done": self.rotate_recenter_on_done
+            "rotate_recenter_on_done": self.rotate_recenter_on_done,
+            "stream_tolerance": self.stream_tolerance,
+            "frame_rate": self.frame_rate,
+            "simplify_tolerance": self.simplify_tolerance,
+            "grid_precision": self.grid_precision,
+            "renderer_mode": self.renderer_mode,
+            "keypad_mode": self.keypad_mode
         }
         self.keypad_manager.update_dataset()
         self.accept()
@@ -246,139 +310,58 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         return self.attributes
 
 
-    def clear_and_populate_categories(self):
-        """Clear and populate the keypad categories list widget.
-
-        When initializing the view or when a category is added, updated, or removed, then this function will be called.
-        Create signal handlers for the checkbox, delete button, and colour picker widgets.
-        Added a label such that for selecting a category, clicking on the checkbox is required
-        """
-        self.categoryListWidget.clear()
-        for pad in self.keypad_manager.data:
-            item = QListWidgetItem(self.categoryListWidget)
-            widget = QWidget()
-            layout = QHBoxLayout()
-
-            # Colour Picker (QgsColorButton)
-            colour_picker = QgsColorButton()
-            colour_picker.setObjectName(pad.category)
-            colour_picker.setColor(QColor(pad.colour))
-            colour_picker.setMinimumSize(50, 30)  # Small size
-            colour_picker.setMaximumSize(50, 30)  # Small size
-            colour_picker.colorChanged.connect(lambda colour, p=pad: update_colour(p, colour))
-
-            # Delete Button (QPushButton)
-            delete_button = QPushButton('X')
-            delete_button.setObjectName(pad.category)
-            delete_button.setMinimumSize(30, 30)
-            delete_button.setMaximumSize(30, 30)
-            delete_button.setStyleSheet("background-color: red; color: white; border-radius: 5px;")
-            delete_button.clicked.connect(lambda state, db=delete_button: self.delete_keypad_category(db))
-
-            label = QLabel(pad.category)
-
-            c_box = QCheckBox("")
-            c_box.setObjectName(pad.category)
-            select_state = 2 if pad.selected == True else 0
-            c_box.setCheckState(select_state)
-            c_box.stateChanged.connect(lambda state, cb=c_box: self.checkbox_state_changed(cb, state))
-
-            layout.addWidget(c_box)
-            layout.addWidget(label)
-            layout.addItem(QSpacerItem(30, 30, QSizePolicy.Expanding, QSizePolicy.Minimum))
-            layout.addWidget(colour_picker)
-            layout.addWidget(delete_button)
-            layout.setContentsMargins(2, 2, 2, 2)
-            layout.setSpacing(5)
-            widget.setLayout(layout)
-
-            item.setSizeHint(widget.sizeHint())
-            self.categoryListWidget.setItemWidget(item, widget)
-
-
-    def on_category_item_selected(self):
+    def on_category_item_selected(self, current):
         """Handle the selection of a keypad category item.
-        Populate the keypad elements list widget with the selected category's elements.
+        Populate the keypad elements list with the selected category's elements.
+
+        :param current: Index of the selected category
+        :type current: QModelIndex
         """
-        selected_items = self.categoryListWidget.selectedItems()
-        if not selected_items:
-            return
+        pad = self.category_model.category_at(current.row())
+        self.selected_category = pad.category if pad is not None else ''
+        self.selected_element = ''
+        self.padItemsGroupBox.setTitle(f'Keypad: {self.selected_category}')
+        self.element_model.set_category(self.selected_category)
 
-        item = selected_items[0]  # Get the first selected item
-        widget = self.categoryListWidget.itemWidget(item)  # Get the widget inside
 
-        if not widget:
-            return
+    def on_element_item_selected(self, current):
+        """Handle the selection of a keypad element item.
+
+        :param current: Index of the selected element
+        :type current: QModelIndex
+        """
+        element = self.element_model.item_at(current.row())
+        self.selected_element = element.item if element is not None else ''
 
-        c_box = widget.findChild(QCheckBox)  # Find the checkbox inside the widget
-        if c_box:
-            self.selected_category = c_box.objectName()
-            self.padItemsGroupBox.setTitle(f'Keypad: {self.selected_category}')
-            self.clear_populate_elements_list(self.selected_category)
 
+    def category_button_clicked(self, name, index):
+        """Handle a click on the colour or delete button of a keypad category row.
 
-    def clear_populate_elements_list(self, category_name):
-        """Clear and populate the keypad elements list widget for the selected category.
-        Create signal handlers for delete and edit buttons.
+        :param name: Name of the clicked button, either "colour" or "delete"
+        :type name: str
 
-        :param category_name: Name of the category
-        :type category_name: str
+        :param index: Index of the category
+        :type index: QModelIndex
         """
-        self.elementListWidget.clear()
-        category = next((cat for cat in self.keypad_manager.data if cat.category == category_name), None)
-        if not category:
-            return
+        if name == "colour":
+            self.category_delegate.edit_colour(index, self)
+        elif name == "delete":
+            self.delete_keypad_category(index.row())
+
 
-        # Loop through the selected category list
-        for element in category.items:
-            item = QListWidgetItem(self.elementListWidget)
-            widget = QWidget()
-            layout = QHBoxLayout()
-            label = QLabel(element.item)
-            label.setMinimumSize(50, 30)
-
-            space = QSpacerItem(40, 30, QSizePolicy.Expanding, QSizePolicy.Minimum)
-            obj_name = f'{category.category}:{element.item}'
-
-            # edit Button (QPushButton)
-            edit_button = QPushButton('Edit')
-            edit_button.setObjectName(obj_name)
-            edit_button.setMinimumSize(40, 30)
-            edit_button.setMaximumSize(40, 30)
-            edit_button.setStyleSheet("background-color: blue; color: white; border-radius: 5px;")
-            edit_button.clicked.connect(lambda state, eb=edit_button: self.edit_keypad_item(eb))
-
-            # Delete Button (QPushButton)
-            delete_button = QPushButton('X')
-            delete_button.setObjectName(obj_name)
-            delete_button.setMinimumSize(30, 30)
-            delete_button.setMaximumSize(30, 30)
-            delete_button.setStyleSheet("background-color: red; color: white; border-radius: 5px;")
-            delete_button.clicked.connect(lambda state, db=delete_button: self.delete_keypad_item(db))
-
-            layout.addWidget(label)
-            layout.addItem(space)
-            layout.addWidget(edit_button)
-            layout.addWidget(delete_button)
-            layout.setContentsMargins(2, 2, 2, 2)
-            layout.setSpacing(5)
-            widget.setLayout(layout)
-
-            item.setSizeHint(widget.sizeHint())
-            self.elementListWidget.setItemWidget(item, widget)
-
-
-    def on_element_item_selected(self):
-        """Handle the selection of a keypad element item."""
-        selected_items = self.elementListWidget.selectedItems()
-        if selected_items:
-            item = selected_items[0]  # Get the first selected item
-            widget = self.elementListWidget.itemWidget(item)  # Get the widget inside
-
-            if widget:
-                label = widget.findChild(QLabel)  # Find the checkbox inside the widget
-                if label:
-                    self.selected_element = label.text()
+    def element_button_clicked(self, name, index):
+        """Handle a click on the edit or delete button of a keypad element row.
+
+        :param name: Name of the clicked button, either "edit" or "delete"
+        :type name: str
+
+        :param index: Index of the element
+        :type index: QModelIndex
+        """
+        if name == "edit":
+            self.edit_keypad_item(index.row())
+        elif name == "delete":
+            self.delete_keypad_item(index.row())
 
 
     def colour_changed(self, colour):
@@ -439,45 +422,52 @@ class AppSettingsDialog(QDialog, FORM_CLASS):
         self.projectNameLineEdit.setReadOnly(state)
 
 
-    def delete_keypad_category(self, db):
+    def delete_keypad_category(self, row):
         """Function will be called when the keypad category delete button is clicked.
         Shows a confirmation dialog before deleting the category
 
-        :param db: The button object
-        :type db: QPushButton
+        :param row: Row of the category
+        :type row: int
         """
-        category = db.objectName()
-        if show_delete_confirmation(f'Category: {category}') == QDialog.Accepted:
-            self.elementListWidget.clear()
-            self.keypad_manager.remove_category(category)
-            self.clear_and_populate_categories()
+        pad = self.category_model.category_at(row)
+        if pad is None:
+            return
 
+        if show_delete_confirmation(f'Category: {pad.category}') == QDialog.Accepted:
+            if pad.category == self.selected_category:
+                self.element_model.set_category(None)
+            self.category_model.remove_category(row)
 
-    def edit_keypad_item(self, eb):
+
+    def edit_keypad_item(self, row):
         """Function will be called when the keypad item edit button is clicked.
         Opens a dialog to edit the element name.
 
-        :param eb: The button object
-        :type eb: QPushButton
+        :param row: Row of the element
+        :type row: int
         """
-        cat_element = get_category_element(eb.objectName())
-        edit_element = AddOrEditElement(cat_element[1])
-        if edit_element.exec_() == QDialog.Accepted:
-            self.keypad_manager.update_item(cat_element[0], cat_element[1], edit_element.get_item())
-            self.clear_populate_elements_list(self.selected_category)
+        element = self.element_model.item_at(row)
+        if element is None:
+            return
 
+        edit_element = AddOrEditElement(KeypadItem(element.item_id, element.item))
+        if edit_element.exec_() == QDialog.Accepted and edit_element.get_item().item != "":
+            self.element_model.update_element(row, edit_element.get_item())
 
-    def delete_keypad_item(self, db):
+
+    def delete_keypad_item(self, row):
         """Function will be called when the keypad item delete button is clicked.
         Shows a confirmation dialog before deleting the element.
 
-        :param db: The button object
-        :type db: QPushButton
+        :param row: Row of the element
+        :type row: int
         """
-        cat_element = get_category_element(db.objectName())
-        if show_delete_confirmation(f'Element: {cat_element[1]}') == QDialog.Accepted:
-            self.keypad_manager.remove_item(cat_element[0], cat_element[1])
-            self.clear_populate_elements_list(cat_element[0])
+        element = self.element_model.item_at(row)
+        if element is None:
+            return
+
+        if show_delete_confirmation(f'Element: {element.item}') == QDialog.Accepted:
+            self.element_model.remove_element(row)
 
 
     def create_new_project(self):
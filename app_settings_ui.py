@@ -0,0 +1,641 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'app_settings.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_settingDialog(object):
+    def setupUi(self, settingDialog):
+        settingDialog.setObjectName("settingDialog")
+        settingDialog.resize(743, 680)
+        settingDialog.setMinimumSize(QtCore.QSize(100, 0))
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        settingDialog.setWindowIcon(icon)
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(settingDialog)
+        self.verticalLayout_6.setContentsMargins(6, 6, 6, 6)
+        self.verticalLayout_6.setSpacing(2)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.frame_6 = QtWidgets.QFrame(settingDialog)
+        self.frame_6.setMinimumSize(QtCore.QSize(100, 30))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.frame_6.setFont(font)
+        self.frame_6.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_6.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_6.setObjectName("frame_6")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.frame_6)
+        self.verticalLayout_5.setContentsMargins(1, 1, 1, 1)
+        self.verticalLayout_5.setSpacing(2)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.groupBox_4 = QtWidgets.QGroupBox(self.frame_6)
+        self.groupBox_4.setAutoFillBackground(False)
+        self.groupBox_4.setStyleSheet("QGroupBox#groupBox_4 {\n"
+"    background-color: rgb(226, 226, 231)\n"
+"}")
+        self.groupBox_4.setObjectName("groupBox_4")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.groupBox_4)
+        self.verticalLayout_3.setContentsMargins(4, 4, 4, 4)
+        self.verticalLayout_3.setSpacing(1)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.frame_13 = QtWidgets.QFrame(self.groupBox_4)
+        self.frame_13.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_13.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.frame_13.setObjectName("frame_13")
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout(self.frame_13)
+        self.horizontalLayout_11.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_11.setSpacing(2)
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.useExistingLayerCheckBox = QtWidgets.QCheckBox(self.frame_13)
+        self.useExistingLayerCheckBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.useExistingLayerCheckBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.useExistingLayerCheckBox.setIconSize(QtCore.QSize(20, 20))
+        self.useExistingLayerCheckBox.setObjectName("useExistingLayerCheckBox")
+        self.horizontalLayout_11.addWidget(self.useExistingLayerCheckBox)
+        self.newProjectPushButton = QtWidgets.QPushButton(self.frame_13)
+        self.newProjectPushButton.setMinimumSize(QtCore.QSize(40, 40))
+        self.newProjectPushButton.setMaximumSize(QtCore.QSize(40, 40))
+        self.newProjectPushButton.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("icons/buttons/file-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.newProjectPushButton.setIcon(icon1)
+        self.newProjectPushButton.setIconSize(QtCore.QSize(35, 30))
+        self.newProjectPushButton.setObjectName("newProjectPushButton")
+        self.horizontalLayout_11.addWidget(self.newProjectPushButton)
+        self.verticalLayout_3.addWidget(self.frame_13)
+        self.frame_11 = QtWidgets.QFrame(self.groupBox_4)
+        self.frame_11.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_11.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_11.setObjectName("frame_11")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.frame_11)
+        self.horizontalLayout_5.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_5.setSpacing(2)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label = QtWidgets.QLabel(self.frame_11)
+        self.label.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.label.setObjectName("label")
+        self.horizontalLayout_5.addWidget(self.label)
+        spacerItem = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem)
+        self.projectNameLineEdit = QtWidgets.QLineEdit(self.frame_11)
+        self.projectNameLineEdit.setMinimumSize(QtCore.QSize(175, 30))
+        self.projectNameLineEdit.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.projectNameLineEdit.setAutoFillBackground(False)
+        self.projectNameLineEdit.setStyleSheet("QLineEdit#projectNameLineEdit {\n"
+"    background-color: rgb(255, 255, 255);\n"
+"}\n"
+"QLineEdit#projectNameLineEdit:read-only {\n"
+"    background-color: rgb(240,240,240);\n"
+"}")
+        self.projectNameLineEdit.setReadOnly(False)
+        self.projectNameLineEdit.setObjectName("projectNameLineEdit")
+        self.horizontalLayout_5.addWidget(self.projectNameLineEdit)
+        self.verticalLayout_3.addWidget(self.frame_11)
+        self.frame_12 = QtWidgets.QFrame(self.groupBox_4)
+        self.frame_12.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_12.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_12.setObjectName("frame_12")
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout(self.frame_12)
+        self.horizontalLayout_9.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_9.setSpacing(2)
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.label_2 = QtWidgets.QLabel(self.frame_12)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout_9.addWidget(self.label_2)
+        spacerItem1 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem1)
+        self.folderQgsFileWidget = QgsFileWidget(self.frame_12)
+        self.folderQgsFileWidget.setMinimumSize(QtCore.QSize(0, 30))
+        self.folderQgsFileWidget.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.folderQgsFileWidget.setStorageMode(QgsFileWidget.GetDirectory)
+        self.folderQgsFileWidget.setRelativeStorage(QgsFileWidget.Absolute)
+        self.folderQgsFileWidget.setOptions(QtWidgets.QFileDialog.ShowDirsOnly)
+        self.folderQgsFileWidget.setObjectName("folderQgsFileWidget")
+        self.horizontalLayout_9.addWidget(self.folderQgsFileWidget)
+        self.verticalLayout_3.addWidget(self.frame_12)
+        self.verticalLayout_5.addWidget(self.groupBox_4)
+        self.frame_10 = QtWidgets.QFrame(self.frame_6)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.frame_10.setFont(font)
+        self.frame_10.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_10.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_10.setObjectName("frame_10")
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout(self.frame_10)
+        self.horizontalLayout_8.setContentsMargins(5, 5, 5, 5)
+        self.horizontalLayout_8.setSpacing(0)
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.bingImageryCheckBox = QtWidgets.QCheckBox(self.frame_10)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.bingImageryCheckBox.setFont(font)
+        self.bingImageryCheckBox.setIconSize(QtCore.QSize(20, 20))
+        self.bingImageryCheckBox.setObjectName("bingImageryCheckBox")
+        self.horizontalLayout_8.addWidget(self.bingImageryCheckBox)
+        self.verticalLayout_5.addWidget(self.frame_10)
+        self.groupBox_3 = QtWidgets.QGroupBox(self.frame_6)
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout(self.groupBox_3)
+        self.horizontalLayout_7.setContentsMargins(4, 4, 4, 4)
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.featureColorButton = QgsColorButton(self.groupBox_3)
+        self.featureColorButton.setMinimumSize(QtCore.QSize(24, 30))
+        self.featureColorButton.setColor(QtGui.QColor(61, 198, 23, 122))
+        self.featureColorButton.setAllowOpacity(True)
+        self.featureColorButton.setDefaultColor(QtGui.QColor(61, 198, 23, 122))
+        self.featureColorButton.setObjectName("featureColorButton")
+        self.horizontalLayout_7.addWidget(self.featureColorButton)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_7.addItem(spacerItem2)
+        self.SurveyorLabel = QtWidgets.QLabel(self.groupBox_3)
+        self.SurveyorLabel.setObjectName("SurveyorLabel")
+        self.horizontalLayout_7.addWidget(self.SurveyorLabel)
+        self.surveyourLineEdit = QtWidgets.QLineEdit(self.groupBox_3)
+        self.surveyourLineEdit.setMinimumSize(QtCore.QSize(0, 30))
+        self.surveyourLineEdit.setObjectName("surveyourLineEdit")
+        self.horizontalLayout_7.addWidget(self.surveyourLineEdit)
+        self.typeLabel = QtWidgets.QLabel(self.groupBox_3)
+        self.typeLabel.setObjectName("typeLabel")
+        self.horizontalLayout_7.addWidget(self.typeLabel)
+        self.typeLineEdit = QtWidgets.QLineEdit(self.groupBox_3)
+        self.typeLineEdit.setMinimumSize(QtCore.QSize(0, 30))
+        self.typeLineEdit.setObjectName("typeLineEdit")
+        self.horizontalLayout_7.addWidget(self.typeLineEdit)
+        self.verticalLayout_5.addWidget(self.groupBox_3)
+        self.groupBox_2 = QtWidgets.QGroupBox(self.frame_6)
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout(self.groupBox_2)
+        self.horizontalLayout_6.setContentsMargins(4, 4, 4, 4)
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.mFontButton = QgsFontButton(self.groupBox_2)
+        self.mFontButton.setMinimumSize(QtCore.QSize(125, 30))
+        self.mFontButton.setMaximumSize(QtCore.QSize(125, 30))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        self.mFontButton.setFont(font)
+        self.mFontButton.setMode(QgsFontButton.ModeQFont)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        font.setKerning(False)
+        font.setStyleStrategy(QtGui.QFont.PreferDefault)
+        self.mFontButton.setCurrentFont(font)
+        self.mFontButton.setObjectName("mFontButton")
+        self.horizontalLayout_6.addWidget(self.mFontButton)
+        self.mColorButton = QgsColorButton(self.groupBox_2)
+        self.mColorButton.setMinimumSize(QtCore.QSize(125, 30))
+        self.mColorButton.setMaximumSize(QtCore.QSize(125, 30))
+        self.mColorButton.setColor(QtGui.QColor(0, 0, 0))
+        self.mColorButton.setDefaultColor(QtGui.QColor(0, 0, 0))
+        self.mColorButton.setObjectName("mColorButton")
+        self.horizontalLayout_6.addWidget(self.mColorButton)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem3)
+        self.heightLabel = QtWidgets.QLabel(self.groupBox_2)
+        self.heightLabel.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.heightLabel.setFont(font)
+        self.heightLabel.setObjectName("heightLabel")
+        self.horizontalLayout_6.addWidget(self.heightLabel)
+        self.heightLineEdit = QtWidgets.QLineEdit(self.groupBox_2)
+        self.heightLineEdit.setMinimumSize(QtCore.QSize(100, 30))
+        self.heightLineEdit.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.heightLineEdit.setObjectName("heightLineEdit")
+        self.horizontalLayout_6.addWidget(self.heightLineEdit)
+        self.widthLabel = QtWidgets.QLabel(self.groupBox_2)
+        self.widthLabel.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.widthLabel.setFont(font)
+        self.widthLabel.setObjectName("widthLabel")
+        self.horizontalLayout_6.addWidget(self.widthLabel)
+        self.widthLineEdit = QtWidgets.QLineEdit(self.groupBox_2)
+        self.widthLineEdit.setMinimumSize(QtCore.QSize(100, 30))
+        self.widthLineEdit.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.widthLineEdit.setObjectName("widthLineEdit")
+        self.horizontalLayout_6.addWidget(self.widthLineEdit)
+        self.keypadModeComboBox = QtWidgets.QComboBox(self.groupBox_2)
+        self.keypadModeComboBox.setMinimumSize(QtCore.QSize(125, 30))
+        self.keypadModeComboBox.setMaximumSize(QtCore.QSize(125, 30))
+        self.keypadModeComboBox.setObjectName("keypadModeComboBox")
+        self.keypadModeComboBox.addItem("")
+        self.keypadModeComboBox.addItem("")
+        self.horizontalLayout_6.addWidget(self.keypadModeComboBox)
+        self.verticalLayout_5.addWidget(self.groupBox_2)
+        self.groupBox_5 = QtWidgets.QGroupBox(self.frame_6)
+        self.groupBox_5.setObjectName("groupBox_5")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.groupBox_5)
+        self.verticalLayout_10.setContentsMargins(4, 4, 4, 4)
+        self.verticalLayout_10.setSpacing(2)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.frame_14 = QtWidgets.QFrame(self.groupBox_5)
+        self.frame_14.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_14.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_14.setObjectName("frame_14")
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout(self.frame_14)
+        self.horizontalLayout_10.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.label_3 = QtWidgets.QLabel(self.frame_14)
+        self.label_3.setMinimumSize(QtCore.QSize(200, 0))
+        self.label_3.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_10.addWidget(self.label_3)
+        self.autoUpdateComboBox = QtWidgets.QComboBox(self.frame_14)
+        self.autoUpdateComboBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.autoUpdateComboBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.autoUpdateComboBox.setObjectName("autoUpdateComboBox")
+        self.autoUpdateComboBox.addItem("")
+        self.autoUpdateComboBox.addItem("")
+        self.autoUpdateComboBox.addItem("")
+        self.autoUpdateComboBox.addItem("")
+        self.autoUpdateComboBox.addItem("")
+        self.autoUpdateComboBox.addItem("")
+        self.autoUpdateComboBox.addItem("")
+        self.horizontalLayout_10.addWidget(self.autoUpdateComboBox)
+        self.verticalLayout_10.addWidget(self.frame_14)
+        self.rorateAndRecenterCheckBox = QtWidgets.QCheckBox(self.groupBox_5)
+        self.rorateAndRecenterCheckBox.setObjectName("rorateAndRecenterCheckBox")
+        self.verticalLayout_10.addWidget(self.rorateAndRecenterCheckBox)
+        self.verticalLayout_5.addWidget(self.groupBox_5)
+        self.groupBox_6 = QtWidgets.QGroupBox(self.frame_6)
+        self.groupBox_6.setObjectName("groupBox_6")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout(self.groupBox_6)
+        self.verticalLayout_11.setContentsMargins(4, 4, 4, 4)
+        self.verticalLayout_11.setSpacing(2)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.frame_15 = QtWidgets.QFrame(self.groupBox_6)
+        self.frame_15.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_15.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_15.setObjectName("frame_15")
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout(self.frame_15)
+        self.horizontalLayout_12.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.label_4 = QtWidgets.QLabel(self.frame_15)
+        self.label_4.setMinimumSize(QtCore.QSize(200, 0))
+        self.label_4.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_12.addWidget(self.label_4)
+        self.streamToleranceSpinBox = QtWidgets.QSpinBox(self.frame_15)
+        self.streamToleranceSpinBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.streamToleranceSpinBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.streamToleranceSpinBox.setMaximum(20)
+        self.streamToleranceSpinBox.setProperty("value", 2)
+        self.streamToleranceSpinBox.setObjectName("streamToleranceSpinBox")
+        self.horizontalLayout_12.addWidget(self.streamToleranceSpinBox)
+        self.verticalLayout_11.addWidget(self.frame_15)
+        self.frame_16 = QtWidgets.QFrame(self.groupBox_6)
+        self.frame_16.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_16.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_16.setObjectName("frame_16")
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout(self.frame_16)
+        self.horizontalLayout_13.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.label_5 = QtWidgets.QLabel(self.frame_16)
+        self.label_5.setMinimumSize(QtCore.QSize(200, 0))
+        self.label_5.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_13.addWidget(self.label_5)
+        self.frameRateSpinBox = QtWidgets.QSpinBox(self.frame_16)
+        self.frameRateSpinBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.frameRateSpinBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.frameRateSpinBox.setMinimum(10)
+        self.frameRateSpinBox.setMaximum(240)
+        self.frameRateSpinBox.setProperty("value", 60)
+        self.frameRateSpinBox.setObjectName("frameRateSpinBox")
+        self.horizontalLayout_13.addWidget(self.frameRateSpinBox)
+        self.verticalLayout_11.addWidget(self.frame_16)
+        self.frame_17 = QtWidgets.QFrame(self.groupBox_6)
+        self.frame_17.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_17.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_17.setObjectName("frame_17")
+        self.horizontalLayout_14 = QtWidgets.QHBoxLayout(self.frame_17)
+        self.horizontalLayout_14.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_14.setObjectName("horizontalLayout_14")
+        self.label_6 = QtWidgets.QLabel(self.frame_17)
+        self.label_6.setMinimumSize(QtCore.QSize(200, 0))
+        self.label_6.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_6.setObjectName("label_6")
+        self.horizontalLayout_14.addWidget(self.label_6)
+        self.simplifyToleranceSpinBox = QtWidgets.QDoubleSpinBox(self.frame_17)
+        self.simplifyToleranceSpinBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.simplifyToleranceSpinBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.simplifyToleranceSpinBox.setDecimals(2)
+        self.simplifyToleranceSpinBox.setMaximum(10.0)
+        self.simplifyToleranceSpinBox.setSingleStep(0.1)
+        self.simplifyToleranceSpinBox.setProperty("value", 0.0)
+        self.simplifyToleranceSpinBox.setObjectName("simplifyToleranceSpinBox")
+        self.horizontalLayout_14.addWidget(self.simplifyToleranceSpinBox)
+        self.verticalLayout_11.addWidget(self.frame_17)
+        self.frame_18 = QtWidgets.QFrame(self.groupBox_6)
+        self.frame_18.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_18.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_18.setObjectName("frame_18")
+        self.horizontalLayout_15 = QtWidgets.QHBoxLayout(self.frame_18)
+        self.horizontalLayout_15.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_15.setObjectName("horizontalLayout_15")
+        self.label_7 = QtWidgets.QLabel(self.frame_18)
+        self.label_7.setMinimumSize(QtCore.QSize(200, 0))
+        self.label_7.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_7.setObjectName("label_7")
+        self.horizontalLayout_15.addWidget(self.label_7)
+        self.gridPrecisionSpinBox = QtWidgets.QDoubleSpinBox(self.frame_18)
+        self.gridPrecisionSpinBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.gridPrecisionSpinBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.gridPrecisionSpinBox.setDecimals(3)
+        self.gridPrecisionSpinBox.setMaximum(1.0)
+        self.gridPrecisionSpinBox.setSingleStep(0.01)
+        self.gridPrecisionSpinBox.setProperty("value", 0.01)
+        self.gridPrecisionSpinBox.setObjectName("gridPrecisionSpinBox")
+        self.horizontalLayout_15.addWidget(self.gridPrecisionSpinBox)
+        self.verticalLayout_11.addWidget(self.frame_18)
+        self.frame_19 = QtWidgets.QFrame(self.groupBox_6)
+        self.frame_19.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_19.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_19.setObjectName("frame_19")
+        self.horizontalLayout_16 = QtWidgets.QHBoxLayout(self.frame_19)
+        self.horizontalLayout_16.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_16.setObjectName("horizontalLayout_16")
+        self.label_8 = QtWidgets.QLabel(self.frame_19)
+        self.label_8.setMinimumSize(QtCore.QSize(200, 0))
+        self.label_8.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.label_8.setObjectName("label_8")
+        self.horizontalLayout_16.addWidget(self.label_8)
+        self.rendererModeComboBox = QtWidgets.QComboBox(self.frame_19)
+        self.rendererModeComboBox.setMinimumSize(QtCore.QSize(0, 30))
+        self.rendererModeComboBox.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.rendererModeComboBox.setObjectName("rendererModeComboBox")
+        self.rendererModeComboBox.addItem("")
+        self.rendererModeComboBox.addItem("")
+        self.horizontalLayout_16.addWidget(self.rendererModeComboBox)
+        self.verticalLayout_11.addWidget(self.frame_19)
+        self.verticalLayout_5.addWidget(self.groupBox_6)
+        self.frame = QtWidgets.QFrame(self.frame_6)
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.groupBox = QtWidgets.QGroupBox(self.frame)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.groupBox.setFont(font)
+        self.groupBox.setAutoFillBackground(True)
+        self.groupBox.setObjectName("groupBox")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.groupBox)
+        self.verticalLayout_7.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout_7.setSpacing(1)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.frame_4 = QtWidgets.QFrame(self.groupBox)
+        self.frame_4.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.frame_4)
+        self.verticalLayout_4.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.addCategoryPushButton = QtWidgets.QPushButton(self.frame_4)
+        self.addCategoryPushButton.setMinimumSize(QtCore.QSize(100, 30))
+        self.addCategoryPushButton.setMaximumSize(QtCore.QSize(100, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.addCategoryPushButton.setFont(font)
+        self.addCategoryPushButton.setObjectName("addCategoryPushButton")
+        self.verticalLayout_4.addWidget(self.addCategoryPushButton)
+        self.verticalLayout_7.addWidget(self.frame_4)
+        self.frame_8 = QtWidgets.QFrame(self.groupBox)
+        self.frame_8.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_8.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_8.setObjectName("frame_8")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.frame_8)
+        self.horizontalLayout_3.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_3.setSpacing(1)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.frame_2 = QtWidgets.QFrame(self.frame_8)
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.frame_2)
+        self.verticalLayout.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout.setSpacing(2)
+        self.verticalLayout.setObjectName("verticalLayout")
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem4)
+        self.moveUpPadItemPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.moveUpPadItemPushButton.setMinimumSize(QtCore.QSize(30, 75))
+        self.moveUpPadItemPushButton.setMaximumSize(QtCore.QSize(30, 75))
+        self.moveUpPadItemPushButton.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap("icons/buttons/up_arrow.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.moveUpPadItemPushButton.setIcon(icon2)
+        self.moveUpPadItemPushButton.setIconSize(QtCore.QSize(15, 250))
+        self.moveUpPadItemPushButton.setObjectName("moveUpPadItemPushButton")
+        self.verticalLayout.addWidget(self.moveUpPadItemPushButton)
+        self.moveDownPadItemPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.moveDownPadItemPushButton.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.moveDownPadItemPushButton.sizePolicy().hasHeightForWidth())
+        self.moveDownPadItemPushButton.setSizePolicy(sizePolicy)
+        self.moveDownPadItemPushButton.setMinimumSize(QtCore.QSize(30, 75))
+        self.moveDownPadItemPushButton.setMaximumSize(QtCore.QSize(30, 75))
+        self.moveDownPadItemPushButton.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap("icons/buttons/down_arrow.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.moveDownPadItemPushButton.setIcon(icon3)
+        self.moveDownPadItemPushButton.setIconSize(QtCore.QSize(15, 250))
+        self.moveDownPadItemPushButton.setObjectName("moveDownPadItemPushButton")
+        self.verticalLayout.addWidget(self.moveDownPadItemPushButton)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem5)
+        self.horizontalLayout_3.addWidget(self.frame_2)
+        self.categoryListView = QtWidgets.QListView(self.frame_8)
+        self.categoryListView.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.categoryListView.setLayoutMode(QtWidgets.QListView.SinglePass)
+        self.categoryListView.setObjectName("categoryListView")
+        self.horizontalLayout_3.addWidget(self.categoryListView)
+        self.verticalLayout_7.addWidget(self.frame_8)
+        self.horizontalLayout.addWidget(self.groupBox)
+        self.padItemsGroupBox = QtWidgets.QGroupBox(self.frame)
+        self.padItemsGroupBox.setMinimumSize(QtCore.QSize(100, 0))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.padItemsGroupBox.setFont(font)
+        self.padItemsGroupBox.setFlat(False)
+        self.padItemsGroupBox.setChecked(False)
+        self.padItemsGroupBox.setObjectName("padItemsGroupBox")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.padItemsGroupBox)
+        self.verticalLayout_8.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout_8.setSpacing(1)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.frame_9 = QtWidgets.QFrame(self.padItemsGroupBox)
+        self.frame_9.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_9.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_9.setObjectName("frame_9")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.frame_9)
+        self.verticalLayout_9.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.addElementPushButton = QtWidgets.QPushButton(self.frame_9)
+        self.addElementPushButton.setMinimumSize(QtCore.QSize(100, 30))
+        self.addElementPushButton.setMaximumSize(QtCore.QSize(100, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.addElementPushButton.setFont(font)
+        self.addElementPushButton.setIconSize(QtCore.QSize(25, 25))
+        self.addElementPushButton.setObjectName("addElementPushButton")
+        self.verticalLayout_9.addWidget(self.addElementPushButton)
+        self.verticalLayout_8.addWidget(self.frame_9)
+        self.frame_5 = QtWidgets.QFrame(self.padItemsGroupBox)
+        self.frame_5.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_5.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_5.setObjectName("frame_5")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_5)
+        self.horizontalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_2.setSpacing(1)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.elementListView = QtWidgets.QListView(self.frame_5)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.elementListView.setFont(font)
+        self.elementListView.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.elementListView.setObjectName("elementListView")
+        self.horizontalLayout_2.addWidget(self.elementListView)
+        self.frame_3 = QtWidgets.QFrame(self.frame_5)
+        self.frame_3.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame_3)
+        self.verticalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout_2.setSpacing(2)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        spacerItem6 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem6)
+        self.moveUpNeedleItemPushButton = QtWidgets.QPushButton(self.frame_3)
+        self.moveUpNeedleItemPushButton.setMinimumSize(QtCore.QSize(30, 75))
+        self.moveUpNeedleItemPushButton.setMaximumSize(QtCore.QSize(30, 75))
+        self.moveUpNeedleItemPushButton.setText("")
+        self.moveUpNeedleItemPushButton.setIcon(icon2)
+        self.moveUpNeedleItemPushButton.setIconSize(QtCore.QSize(15, 250))
+        self.moveUpNeedleItemPushButton.setObjectName("moveUpNeedleItemPushButton")
+        self.verticalLayout_2.addWidget(self.moveUpNeedleItemPushButton)
+        self.moveDownNeedleItemPushButton = QtWidgets.QPushButton(self.frame_3)
+        self.moveDownNeedleItemPushButton.setMinimumSize(QtCore.QSize(30, 75))
+        self.moveDownNeedleItemPushButton.setMaximumSize(QtCore.QSize(30, 75))
+        self.moveDownNeedleItemPushButton.setIcon(icon3)
+        self.moveDownNeedleItemPushButton.setIconSize(QtCore.QSize(15, 250))
+        self.moveDownNeedleItemPushButton.setObjectName("moveDownNeedleItemPushButton")
+        self.verticalLayout_2.addWidget(self.moveDownNeedleItemPushButton)
+        spacerItem7 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem7)
+        self.horizontalLayout_2.addWidget(self.frame_3)
+        self.verticalLayout_8.addWidget(self.frame_5)
+        self.horizontalLayout.addWidget(self.padItemsGroupBox)
+        self.verticalLayout_5.addWidget(self.frame)
+        self.frame_7 = QtWidgets.QFrame(self.frame_6)
+        self.frame_7.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_7.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_7.setObjectName("frame_7")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.frame_7)
+        self.horizontalLayout_4.setContentsMargins(10, 2, 10, 2)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.discardPushButton = QtWidgets.QPushButton(self.frame_7)
+        self.discardPushButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.discardPushButton.setMaximumSize(QtCore.QSize(125, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.discardPushButton.setFont(font)
+        self.discardPushButton.setObjectName("discardPushButton")
+        self.horizontalLayout_4.addWidget(self.discardPushButton)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem8)
+        self.applyPushButton = QtWidgets.QPushButton(self.frame_7)
+        self.applyPushButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.applyPushButton.setMaximumSize(QtCore.QSize(125, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.applyPushButton.setFont(font)
+        self.applyPushButton.setObjectName("applyPushButton")
+        self.horizontalLayout_4.addWidget(self.applyPushButton)
+        self.verticalLayout_5.addWidget(self.frame_7)
+        self.verticalLayout_6.addWidget(self.frame_6)
+
+        self.retranslateUi(settingDialog)
+        QtCore.QMetaObject.connectSlotsByName(settingDialog)
+
+    def retranslateUi(self, settingDialog):
+        _translate = QtCore.QCoreApplication.translate
+        settingDialog.setWindowTitle(_translate("settingDialog", "Settings"))
+        self.groupBox_4.setTitle(_translate("settingDialog", "Sketch Name and Location"))
+        self.useExistingLayerCheckBox.setText(_translate("settingDialog", "Use Existing Layers"))
+        self.newProjectPushButton.setToolTip(_translate("settingDialog", "<html><head/><body><p><span style=\" font-size:9pt;\">New Project</span></p></body></html>"))
+        self.label.setText(_translate("settingDialog", "Sketch Name"))
+        self.label_2.setText(_translate("settingDialog", "File Location"))
+        self.folderQgsFileWidget.setDialogTitle(_translate("settingDialog", "Layer\'s Locations"))
+        self.bingImageryCheckBox.setText(_translate("settingDialog", "Add Bing Imagery (requires internet connection)"))
+        self.bingImageryCheckBox.setShortcut(_translate("settingDialog", "Backspace"))
+        self.groupBox_3.setTitle(_translate("settingDialog", "Feature Attributes"))
+        self.featureColorButton.setToolTip(_translate("settingDialog", "<html><head/><body><p><span style=\" font-size:9pt;\">Polygon/Area Fill Colour</span></p></body></html>"))
+        self.SurveyorLabel.setText(_translate("settingDialog", "Surveyor"))
+        self.typeLabel.setText(_translate("settingDialog", "Type"))
+        self.groupBox_2.setTitle(_translate("settingDialog", "Button Settings"))
+        self.heightLabel.setText(_translate("settingDialog", "Height"))
+        self.heightLineEdit.setText(_translate("settingDialog", "26"))
+        self.widthLabel.setText(_translate("settingDialog", "Width"))
+        self.widthLineEdit.setText(_translate("settingDialog", "174"))
+        self.keypadModeComboBox.setToolTip(_translate("settingDialog", "Buttons shows a push button per keypad item. Painted draws the whole keypad as a single widget, for keypads with hundreds of items."))
+        self.keypadModeComboBox.setItemText(0, _translate("settingDialog", "Buttons"))
+        self.keypadModeComboBox.setItemText(1, _translate("settingDialog", "Painted"))
+        self.groupBox_5.setTitle(_translate("settingDialog", "GPS Settings"))
+        self.label_3.setText(_translate("settingDialog", "Auto Update Interval (Seconds)"))
+        self.autoUpdateComboBox.setCurrentText(_translate("settingDialog", "10"))
+        self.autoUpdateComboBox.setItemText(0, _translate("settingDialog", "5"))
+        self.autoUpdateComboBox.setItemText(1, _translate("settingDialog", "10"))
+        self.autoUpdateComboBox.setItemText(2, _translate("settingDialog", "20"))
+        self.autoUpdateComboBox.setItemText(3, _translate("settingDialog", "30"))
+        self.autoUpdateComboBox.setItemText(4, _translate("settingDialog", "40"))
+        self.autoUpdateComboBox.setItemText(5, _translate("settingDialog", "50"))
+        self.autoUpdateComboBox.setItemText(6, _translate("settingDialog", "60"))
+        self.rorateAndRecenterCheckBox.setText(_translate("settingDialog", "Rotate and recenter on Done"))
+        self.groupBox_6.setTitle(_translate("settingDialog", "Sketch Settings"))
+        self.label_4.setToolTip(_translate("settingDialog", "Vertices closer than this distance to the sketched line are dropped while drawing. Set to 0 to keep every vertex."))
+        self.label_4.setText(_translate("settingDialog", "Stream Tolerance (Pixels)"))
+        self.label_5.setToolTip(_translate("settingDialog", "Maximum number of times per second the sketch is redrawn while drawing."))
+        self.label_5.setText(_translate("settingDialog", "Sketch Frame Rate (FPS)"))
+        self.label_6.setToolTip(_translate("settingDialog", "Saved lines and polygons are simplified within this distance, keeping their shape valid. 0, the default, saves every vertex."))
+        self.label_6.setText(_translate("settingDialog", "Save Simplification (m)"))
+        self.label_7.setToolTip(_translate("settingDialog", "Saved coordinates are rounded to a grid of this size. Set to 0 to save full precision."))
+        self.label_7.setText(_translate("settingDialog", "Coordinate Precision (m)"))
+        self.label_8.setToolTip(_translate("settingDialog", "Categorized adds a legend entry for every polygon colour. Data-defined draws each polygon with its own colour attribute, without renderer changes when new colours are used."))
+        self.label_8.setText(_translate("settingDialog", "Polygon Colour Renderer"))
+        self.rendererModeComboBox.setItemText(0, _translate("settingDialog", "Categorized"))
+        self.rendererModeComboBox.setItemText(1, _translate("settingDialog", "Data-defined"))
+        self.groupBox.setTitle(_translate("settingDialog", "Display Keypad(s)"))
+        self.addCategoryPushButton.setText(_translate("settingDialog", "Add Category"))
+        self.padItemsGroupBox.setTitle(_translate("settingDialog", "Keypad:"))
+        self.addElementPushButton.setText(_translate("settingDialog", "Add Element"))
+        self.discardPushButton.setText(_translate("settingDialog", "Discard"))
+        self.applyPushButton.setText(_translate("settingDialog", "Apply"))
+from qgis.gui import QgsColorButton
+from qgis.gui import QgsFileWidget
+from qgis.gui import QgsFontButton
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "f2d190b88fdc42740b6706f2dfd820b4c003b2bfe39fca0f26f5bb4fb8633f11"
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'confirmation.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Confirmation(object):
+    def setupUi(self, Confirmation):
+        Confirmation.setObjectName("Confirmation")
+        Confirmation.resize(347, 111)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        Confirmation.setWindowIcon(icon)
+        self.gridLayout = QtWidgets.QGridLayout(Confirmation)
+        self.gridLayout.setContentsMargins(5, 5, 5, 5)
+        self.gridLayout.setObjectName("gridLayout")
+        self.frame_2 = QtWidgets.QFrame(Confirmation)
+        self.frame_2.setMinimumSize(QtCore.QSize(0, 45))
+        self.frame_2.setMaximumSize(QtCore.QSize(16777215, 45))
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.rejectPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.rejectPushButton.setMinimumSize(QtCore.QSize(100, 40))
+        self.rejectPushButton.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.rejectPushButton.setFont(font)
+        self.rejectPushButton.setObjectName("rejectPushButton")
+        self.horizontalLayout_2.addWidget(self.rejectPushButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.confirmPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.confirmPushButton.setMinimumSize(QtCore.QSize(100, 40))
+        self.confirmPushButton.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.confirmPushButton.setFont(font)
+        self.confirmPushButton.setObjectName("confirmPushButton")
+        self.horizontalLayout_2.addWidget(self.confirmPushButton)
+        self.gridLayout.addWidget(self.frame_2, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(Confirmation)
+        self.frame.setMinimumSize(QtCore.QSize(0, 50))
+        self.frame.setMaximumSize(QtCore.QSize(16777215, 50))
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setContentsMargins(10, 1, 1, 1)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setMinimumSize(QtCore.QSize(30, 30))
+        self.label.setMaximumSize(QtCore.QSize(30, 30))
+        self.label.setText("")
+        self.label.setPixmap(QtGui.QPixmap("icons/buttons/circle-question-solid.svg"))
+        self.label.setScaledContents(True)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.txtLabel = QtWidgets.QLabel(self.frame)
+        self.txtLabel.setMinimumSize(QtCore.QSize(0, 45))
+        self.txtLabel.setMaximumSize(QtCore.QSize(16777215, 45))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txtLabel.setFont(font)
+        self.txtLabel.setObjectName("txtLabel")
+        self.horizontalLayout.addWidget(self.txtLabel)
+        self.gridLayout.addWidget(self.frame, 1, 0, 1, 1)
+
+        self.retranslateUi(Confirmation)
+        QtCore.QMetaObject.connectSlotsByName(Confirmation)
+
+    def retranslateUi(self, Confirmation):
+        _translate = QtCore.QCoreApplication.translate
+        Confirmation.setWindowTitle(_translate("Confirmation", "Confirmation"))
+        self.rejectPushButton.setText(_translate("Confirmation", "Reject"))
+        self.confirmPushButton.setText(_translate("Confirmation", "Confirm"))
+        self.txtLabel.setText(_translate("Confirmation", "<html><head/><body><p>Are you sure you want to create a new project?<br/>This will remove existing digitized layers.</p></body></html>"))
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "a1892c351902a499819f06f2469046a03af976a3f4b69026bc8d9e57454b2680"
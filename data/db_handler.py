@@ -1,94 +1,137 @@
 import os
 import sqlite3
+import threading
+
+from data.db_migrations import migrate
+
+# Pragmas applied to every connection: WAL journaling lets the keypad be read while the settings are written,
+# and with WAL, NORMAL synchronous is still safe against corruption while syncing much less on slow storage.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# The statements are kept as constants such that the same SQL text is used on every call,
+# which the statement cache of the connection looks up to reuse the prepared statement.
+SELECT_KEYPAD = ("SELECT c.cat_id, c.category, c.selected, c.colour, c.sort_order, i.item_id, i.item, i.sort_order "
+                 "FROM categories as c "
+                 "LEFT JOIN items as i on i.category_id = c.cat_id "
+                 "ORDER BY c.sort_order, c.cat_id, i.sort_order, i.item_id")
+INSERT_CATEGORY = "INSERT INTO categories (category, selected, colour, sort_order) VALUES (?, ?, ?, ?)"
+UPDATE_CATEGORY = "UPDATE categories SET category = ?, selected = ?, colour = ?, sort_order = ? WHERE cat_id = ?"
+DELETE_CATEGORY = "DELETE FROM categories WHERE cat_id = ?"
+INSERT_ITEM = "INSERT INTO items (category_id, item, sort_order) VALUES (?, ?, ?)"
+UPDATE_ITEM = "UPDATE items SET item = ?, sort_order = ? WHERE item_id = ?"
+DELETE_ITEM = "DELETE FROM items WHERE item_id = ?"
+SELECT_DATA_VERSION = "PRAGMA data_version"
 
 
 class DbHandler:
-    def __init__(self):
+    def __init__(self, db_path=None):
         """Constructor.
         SQLite database handler.
         Used to retrieve and update the keypad data.
+        Each thread gets one long-lived connection, which is opened on first use and closed by close().
+
+        :param db_path: Path to the database file, keypad_data.sqlite next to this file by default.
+        :type db_path: str, optional
         """
         self.plugin_dir = os.path.dirname(__file__)
-        self.db_path = os.path.join(self.plugin_dir, 'keypad_data.sqlite')
+        self.db_path = db_path if db_path is not None else os.path.join(self.plugin_dir, 'keypad_data.sqlite')
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
 
-    def load_keypad_data(self):
-        """Load the keypad data from the database.
+    def connection(self):
+        """Get the connection of the current thread, opening it on first use.
 
-        :return: Keypad data
+        :return: SQLite connection
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT * FROM categories")
-            keypad_rows = cur.fetchall()
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            # the connection is only used by its thread, check_same_thread is off so that close() can close it
+            conn = sqlite3.connect(self.db_path, cached_statements=64, check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            # databases of an older schema are upgraded in place, before the foreign keys are enforced
+            migrate(conn)
+            conn.execute("PRAGMA foreign_keys = ON")
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close the connections of every thread."""
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
+            conn.close()
+        self.local = threading.local()
 
-            keypad_data = []
-            for cat_id, category, selected, colour in keypad_rows:
-                cur.execute("SELECT item_id, item FROM items WHERE category_id = ?", (cat_id,))
-                items = [{"item_id": row[0] , "item": row[1]} for row in cur.fetchall()]
+    def load_keypad_data(self):
+        """Load the keypad data from the database with a single query.
 
-                keypad_data.append({
+        :return: Keypad data
+        """
+        keypad_data = []
+        category = None
+        # the rows are ordered by category, so the items of a category are consecutive rows
+        rows = self.connection().execute(SELECT_KEYPAD)
+        for cat_id, name, selected, colour, cat_order, item_id, item, item_order in rows:
+            if category is None or category["cat_id"] != cat_id:
+                category = {
                     "cat_id": cat_id,
-                    "category": category,
+                    "category": name,
                     "selected": bool(selected),
                     "colour": colour,
-                    "items": items
-                })
-
-            return keypad_data
+                    "items": [],
+                    "sort_order": cat_order
+                }
+                keypad_data.append(category)
 
+            # a category without items has a single row with NULL item columns
+            if item_id is not None:
+                category["items"].append({"item_id": item_id, "item": item, "sort_order": item_order})
 
-    def reset_and_update(self, data):
-        """Reset and update the keypad data in the database.
+        return keypad_data
 
-        :param data: Keypad data
-        :type data: list of dicts
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cur = conn.cursor()
-            # clearing data
-            cur.execute("DELETE FROM items")
-            cur.execute("DELETE FROM categories")
-
-            # resetting auto-increment id
-            cur.execute("DELETE FROM sqlite_sequence WHERE name='categories'")
-            cur.execute("DELETE FROM sqlite_sequence WHERE name='items'")
-
-            for category in data:
-                cur.execute("""
-                        INSERT INTO categories (category, selected, colour)
-                        VALUES (?, ?, ?)
-                    """, (category.category, int(category.selected), category.colour))
-                category_id = cur.lastrowid
 
-                for item in category.items:
-                    cur.execute("""
-                            INSERT INTO items (category_id, item)
-                            VALUES (?, ?)
-                        """, (category_id, item.item))
+    def apply_changes(self, changes):
+        """Write the changes made to the keypad in one transaction.
+        New categories and items are inserted and get their ID, the others keep their ID and are updated.
 
-            conn.commit()
-
-
-    def get_checked_category_items(self):
-        """Get the checked category items from the database.
-
-        :return: Category items
-        :type: list of dicts
+        :param changes: Changes to the keypad
+        :type changes: KeypadChanges
         """
-        with sqlite3.connect(self.db_path) as conn:
+        conn = self.connection()
+        with conn:
             cur = conn.cursor()
-            query = ("SELECT i.item, c.selected, c.colour FROM items as i "
-                     "INNER JOIN categories as c on i.category_id = c.cat_id "
-                     "WHERE c.selected = 1")
-            cur.execute(query)
-            item_rows = cur.fetchall()
-
-            item_data = []
-            for item, selected, colour in item_rows:
-                item_data.append({
-                    "item": item,
-                    "selected": selected,
-                    "colour": colour
-                })
-
-            return item_data
\ No newline at end of file
+            # the items of a deleted category are deleted by the foreign key
+            cur.executemany(DELETE_CATEGORY, [(cat_id,) for cat_id in changes.deleted_categories])
+            cur.executemany(DELETE_ITEM, [(item_id,) for item_id in changes.deleted_items])
+
+            # the inserted rows need their new ID, so they are inserted one by one
+            new_categories = [c for c in changes.categories if not c.cat_id]
+            cur.executemany(UPDATE_CATEGORY, [(c.category, int(c.selected), c.colour, c.sort_order, c.cat_id)
+                                              for c in changes.categories if c.cat_id])
+            for category in new_categories:
+                cur.execute(INSERT_CATEGORY, (category.category, int(category.selected), category.colour,
+                                              category.sort_order))
+                category.cat_id = cur.lastrowid
+
+            new_items = [(i, c) for i, c in changes.items.items() if not i.item_id]
+            cur.executemany(UPDATE_ITEM, [(i.item, i.sort_order, i.item_id) for i in changes.items if i.item_id])
+            for item, category in new_items:
+                cur.execute(INSERT_ITEM, (category.cat_id, item.item, item.sort_order))
+                item.item_id = cur.lastrowid
+
+
+    def data_version(self):
+        """Get the data version of the database, which changes when another connection commits a change.
+
+        :return: Data version
+        """
+        return self.connection().execute(SELECT_DATA_VERSION).fetchone()[0]
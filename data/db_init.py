@@ -1,6 +1,8 @@
 import os
 import sqlite3
 
+from data.db_migrations import migrate
+
 
 # Default Keypad Data
 data = [
@@ -35,43 +37,25 @@ class DbInit:
 
     def init_db(self):
         """Initialize the database.
-        Create the Categories and Items tables and populate them with the data.
+        Create the Categories and Items tables at the current schema version and populate them with the data.
         """
-        # Step 3: Create and populate a database
         conn = sqlite3.connect(self.db_path)
         cur = conn.cursor()
 
-        cur.execute("DROP TABLE IF EXISTS categories")
         cur.execute("DROP TABLE IF EXISTS items")
-
-        cur.execute("""
-            CREATE TABLE categories (
-                cat_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category TEXT NOT NULL,
-                selected BOOLEAN NOT NULL,
-                colour TEXT NOT NULL
-            )
-        """)
-
-        cur.execute("""
-            CREATE TABLE items (
-                item_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_id INTEGER NOT NULL,
-                item TEXT NOT NULL,
-                FOREIGN KEY(category_id) REFERENCES categories(id)
-            )
-        """)
+        cur.execute("DROP TABLE IF EXISTS categories")
+        cur.execute("PRAGMA user_version = 0")
+        migrate(conn)
 
         # Insert your data
-        for entry in data:
-            cur.execute("INSERT INTO categories (category, selected, colour) VALUES (?, ?, ?)",
-                        (entry["category"], int(entry["selected"]), entry["colour"]))
-            category_id = cur.lastrowid
-            for item in entry["items"]:
-                cur.execute("INSERT INTO items (category_id, item) VALUES (?, ?)",
-                            (category_id, item))
+        with conn:
+            for category_order, entry in enumerate(data):
+                cur.execute("INSERT INTO categories (category, selected, colour, sort_order) VALUES (?, ?, ?, ?)",
+                            (entry["category"], int(entry["selected"]), entry["colour"], category_order))
+                category_id = cur.lastrowid
+                cur.executemany("INSERT INTO items (category_id, item, sort_order) VALUES (?, ?, ?)",
+                                [(category_id, item, item_order) for item_order, item in enumerate(entry["items"])])
 
-        conn.commit()
         conn.close()
 
         print(f"Database saved at: {self.db_path}")
@@ -0,0 +1,147 @@
+# Keypad database schema migrations.
+# The schema version is kept in PRAGMA user_version, migration N upgrades a database from version N - 1 to N.
+# Databases created before versioning have version 0, whatever tables they hold.
+
+
+def create_base_tables(conn):
+    """Version 1: the categories and items tables as created before versioning, for new databases.
+
+    :param conn: SQLite connection
+    :type conn: sqlite3.Connection
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            cat_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            selected BOOLEAN NOT NULL,
+            colour TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS items (
+            item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category_id INTEGER NOT NULL,
+            item TEXT NOT NULL
+        )
+    """)
+
+
+def add_sort_order_and_foreign_key(conn):
+    """Version 2: rebuild the tables with a sort_order column and the items foreign key on categories(cat_id).
+    The sort order is a REAL such that a moved row gets a value between its new neighbours and is the only row
+    updated. Rows keep their IDs and their current order, and items of deleted categories are dropped.
+
+    :param conn: SQLite connection
+    :type conn: sqlite3.Connection
+    """
+    conn.execute("""
+        CREATE TABLE categories_new (
+            cat_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            selected BOOLEAN NOT NULL,
+            colour TEXT NOT NULL,
+            sort_order REAL NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE items_new (
+            item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category_id INTEGER NOT NULL REFERENCES categories(cat_id) ON DELETE CASCADE,
+            item TEXT NOT NULL,
+            sort_order REAL NOT NULL
+        )
+    """)
+
+    # the order was given by the IDs, or by a sort_order column in databases that already have one
+    category_order = "sort_order" if has_column(conn, "categories", "sort_order") else "cat_id"
+    item_order = "sort_order" if has_column(conn, "items", "sort_order") else "item_id"
+    conn.execute(f"INSERT INTO categories_new (cat_id, category, selected, colour, sort_order) "
+                 f"SELECT cat_id, category, selected, colour, {category_order} FROM categories")
+    conn.execute(f"INSERT INTO items_new (item_id, category_id, item, sort_order) "
+                 f"SELECT item_id, category_id, item, {item_order} FROM items "
+                 f"WHERE category_id IN (SELECT cat_id FROM categories)")
+
+    conn.execute("DROP TABLE items")
+    conn.execute("DROP TABLE categories")
+    conn.execute("ALTER TABLE categories_new RENAME TO categories")
+    conn.execute("ALTER TABLE items_new RENAME TO items")
+
+
+def create_indexes(conn):
+    """Version 3: indexes for loading the keypad in order and for the items foreign key.
+
+    :param conn: SQLite connection
+    :type conn: sqlite3.Connection
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_items_category_id")
+    conn.execute("CREATE INDEX idx_categories_sort_order ON categories (sort_order)")
+    conn.execute("CREATE INDEX idx_items_category_sort_order ON items (category_id, sort_order)")
+
+
+MIGRATIONS = [
+    create_base_tables,
+    add_sort_order_and_foreign_key,
+    create_indexes,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(conn):
+    """Get the schema version of a database.
+
+    :param conn: SQLite connection
+    :type conn: sqlite3.Connection
+
+    :return: Schema version, 0 for databases created before versioning
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """Upgrade a database to the current schema version.
+    Each migration runs in its own transaction with the new version, so an interrupted upgrade leaves the
+    database at the last completed version. The write lock is taken before the version is read again, such
+    that two processes opening the database at the same time do not both migrate it.
+    Foreign keys must not be enforced on the connection while the tables are rebuilt.
+
+    :param conn: SQLite connection
+    :type conn: sqlite3.Connection
+
+    :return: Schema version before the upgrade
+    """
+    initial_version = get_schema_version(conn)
+    if initial_version >= SCHEMA_VERSION:
+        return initial_version
+
+    while True:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = get_schema_version(conn)
+            if version >= SCHEMA_VERSION:
+                conn.execute("COMMIT")
+                return initial_version
+
+            MIGRATIONS[version](conn)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def has_column(conn, table, column):
+    """Checks if a table has a column.
+
+    :param conn: SQLite connection
+    :type conn: sqlite3.Connection
+
+    :param table: Table name
+    :type table: str
+
+    :param column: Column name
+    :type column: str
+
+    :return: True if the table has the column, False otherwise
+    """
+    return column in (row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
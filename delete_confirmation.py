@@ -1,10 +1,10 @@
 
 from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt import uic
-import os
 
-# Load the UI file dynamically
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "delete_confirmation.ui"))
+from form_loader import load_form
+
+# Load the compiled form of the UI file
+FORM_CLASS = load_form("delete_confirmation.ui")
 
 class DeleteConfirmationDialog(QDialog, FORM_CLASS):
     def __init__(self, text, parent=None):
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'delete_confirmation.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_DeleteConfirmation(object):
+    def setupUi(self, DeleteConfirmation):
+        DeleteConfirmation.setObjectName("DeleteConfirmation")
+        DeleteConfirmation.resize(466, 101)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        DeleteConfirmation.setWindowIcon(icon)
+        self.gridLayout = QtWidgets.QGridLayout(DeleteConfirmation)
+        self.gridLayout.setContentsMargins(5, 5, 5, 5)
+        self.gridLayout.setObjectName("gridLayout")
+        self.frame_2 = QtWidgets.QFrame(DeleteConfirmation)
+        self.frame_2.setMinimumSize(QtCore.QSize(0, 45))
+        self.frame_2.setMaximumSize(QtCore.QSize(16777215, 45))
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.rejectPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.rejectPushButton.setMinimumSize(QtCore.QSize(100, 40))
+        self.rejectPushButton.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.rejectPushButton.setFont(font)
+        self.rejectPushButton.setObjectName("rejectPushButton")
+        self.horizontalLayout_2.addWidget(self.rejectPushButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.confirmPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.confirmPushButton.setMinimumSize(QtCore.QSize(100, 40))
+        self.confirmPushButton.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.confirmPushButton.setFont(font)
+        self.confirmPushButton.setObjectName("confirmPushButton")
+        self.horizontalLayout_2.addWidget(self.confirmPushButton)
+        self.gridLayout.addWidget(self.frame_2, 2, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(DeleteConfirmation)
+        self.frame.setMinimumSize(QtCore.QSize(0, 35))
+        self.frame.setMaximumSize(QtCore.QSize(16777215, 40))
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setContentsMargins(10, 1, 1, 1)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setMinimumSize(QtCore.QSize(30, 30))
+        self.label.setMaximumSize(QtCore.QSize(30, 30))
+        self.label.setText("")
+        self.label.setPixmap(QtGui.QPixmap("icons/buttons/triangle-exclamation-duotone-light.svg"))
+        self.label.setScaledContents(True)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.txtLabel = QtWidgets.QLabel(self.frame)
+        self.txtLabel.setMinimumSize(QtCore.QSize(0, 30))
+        self.txtLabel.setMaximumSize(QtCore.QSize(16777215, 35))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txtLabel.setFont(font)
+        self.txtLabel.setText("")
+        self.txtLabel.setObjectName("txtLabel")
+        self.horizontalLayout.addWidget(self.txtLabel)
+        self.gridLayout.addWidget(self.frame, 1, 0, 1, 1)
+
+        self.retranslateUi(DeleteConfirmation)
+        QtCore.QMetaObject.connectSlotsByName(DeleteConfirmation)
+
+    def retranslateUi(self, DeleteConfirmation):
+        _translate = QtCore.QCoreApplication.translate
+        DeleteConfirmation.setWindowTitle(_translate("DeleteConfirmation", "Delete Confirmation"))
+        self.rejectPushButton.setText(_translate("DeleteConfirmation", "Reject"))
+        self.confirmPushButton.setText(_translate("DeleteConfirmation", "Confirm"))
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "0b70c24148f05e2c51a61850142a7d6312156a489a3b8d6edc42e43b90d30331"
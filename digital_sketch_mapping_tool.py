@@ -24,34 +24,36 @@
 from collections import deque
 
 from PyQt5.QtWidgets import QRadioButton
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt, QMargins, QTimer
-from qgis.PyQt.QtGui import QIcon, QColor
-from qgis.PyQt.QtWidgets import (QAction, QPushButton, QDialog, QWidget, QHBoxLayout,
-                                 QSpacerItem, QSizePolicy, QToolButton)
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt, QTimer, QResource
+from qgis.PyQt.QtGui import QIcon
+from qgis.PyQt.QtWidgets import QAction, QPushButton, QDialog, QWidget, QToolButton
 from qgis.core import (QgsApplication, QgsCoordinateReferenceSystem, QgsVectorLayer,
-                       QgsProject, QgsRasterLayer, QgsPointXY, QgsCoordinateTransform, QgsRectangle)
+                       QgsProject, QgsRasterLayer, QgsPointXY, QgsRectangle)
 from datetime import datetime
 
 from custom_zoom_tool import CustomZoomTool
-from help import HelpDialog
-from helper import (create_geopackage_file, split_array_to_chunks, adjust_color, show_delete_confirmation,
+from helper import (create_geopackage_file, show_delete_confirmation,
                     get_existing_layers, get_bing_layer, get_existing_enabled_layers, get_default_button_height,
                     get_default_button_width, get_default_button_font, get_default_button_font_colour,
-                    get_default_auto_update_interval)
+                    get_default_auto_update_interval, get_default_stream_tolerance,
+                    get_default_frame_rate, get_coordinate_transform, clear_transform_cache,
+                    get_default_simplify_tolerance, get_default_grid_precision, get_default_renderer_mode,
+                    get_default_keypad_mode)
 
-from qgis.core import (QgsSymbol, QgsRendererCategory, QgsCategorizedSymbolRenderer,
-                       Qgis, QgsCoordinateReferenceSystem)
+from qgis.core import Qgis, QgsCoordinateReferenceSystem
 
 from data.db_init import DbInit
-from select_existing_layer import SelectExistingLayerDialog
 from stream_digitizing_tool import StreamDigitizingTool
 from multi_line_tool import MultiLineDigitizingTool
+from sketch_journal import SketchJournal
+from sketch_writer import SketchWriter
+from style_cache import StyleCache
+from symbology_manager import SymbologyManager
 from feature_identify_tool import FeatureIdentifyTool
-from .app_settings import AppSettingsDialog
 from keypad_manager import KeypadManager
-
-# Initialize Qt resources from file resources.py
-from .resources import *
+from keypad_view import KeypadView
+from painted_keypad import PaintedKeypadView
+from startup_profiler import profiler
 
 # Import the code for the DockWidget
 from .digital_sketch_mapping_tool_dockwidget import DigitalSketchMappingToolDockWidget
@@ -65,45 +67,35 @@ except ImportError:
 _plugin_name_ = "digital_sketch_mapping_tool"
 _plugin_directory_ = os.path.dirname(__file__)
 
-def apply_symbology(layer, iface):
-    categories = []
-
-    unique_colors = {f["colour"] for f in layer.getFeatures() if f["colour"]}
-
-    for hex_color in unique_colors:
-        if not hex_color.startswith("#"):  # Ensure valid hex format
-            continue
+def register_resources():
+    """Register the Qt resources of the plugin (icons).
+    The compiled binary bundle resources.rcc is registered from disk, where Qt maps it into memory, which is
+    cheaper than importing the generated resources.py module. The module is imported if the bundle cannot be
+    registered.
 
-        symbol = QgsSymbol.defaultSymbol(layer.geometryType())
-        symbol.setColor(QColor(hex_color))  # Convert hex to QColor
-        category = QgsRendererCategory(hex_color, symbol, hex_color)
-        categories.append(category)
+    :return: Path of the registered bundle, None if the resources were registered from resources.py
+    """
+    rcc_path = os.path.join(_plugin_directory_, "resources.rcc")
+    if os.path.exists(rcc_path) and QResource.registerResource(rcc_path):
+        return rcc_path
 
-    renderer = QgsCategorizedSymbolRenderer("colour", categories)
-    layer.setRenderer(renderer)
-    layer.triggerRepaint()
-    iface.mapCanvas().refresh()
-
-
-def delete_keypad_items(attr_box)    :
-    if not attr_box.isEmpty():
-        count = attr_box.count()
-        if count > 0 and attr_box.itemAt(count - 1).spacerItem() is not None:
-            attr_box.takeAt(count - 1)  # Remove the existing spacer
-        while attr_box.count():
-            item = attr_box.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+    QgsApplication.messageLog().logMessage(f"could not register {rcc_path}, loading resources.py",
+                                           "DigitalSketchPlugin")
+    from . import resources
+    return None
 
 
 def load_help():
+    # dialogs are imported when first opened, so that loading the plugin does not load their forms
+    from help import HelpDialog
+
     HelpDialog().exec_()
 
 
 class DigitalSketchMappingTool:
     """QGIS Plugin Implementation."""
 
+    @profiler.timed("__init__")
     def __init__(self, iface):
         """Constructor.
 
@@ -114,6 +106,7 @@ class DigitalSketchMappingTool:
         """
         # initialize plugin directory
         self.plugin_dir = os.path.dirname(__file__)
+        self.resource_path = register_resources()
 
         # defining and initialising global variables/placeholders for the application
         self.iface = iface
@@ -131,10 +124,14 @@ class DigitalSketchMappingTool:
         self.line_layer = None
         self.polygon_layer = None
         self.plugin_name = _plugin_name_
-        self.keypad_manager = KeypadManager()
+        with profiler.step("KeypadManager"):
+            self.keypad_manager = KeypadManager()
         self.pressed_btn = None
         self.attributes = None
-        self.layers_saved = 0
+        self.sketch_journal = SketchJournal(os.path.join(self.plugin_dir, "data", "sketch_journal.bin"))
+        self.sketch_writer = SketchWriter(self.sketch_journal)
+        self.symbology_manager = SymbologyManager(self.iface)
+        self.style_cache = StyleCache()
         self.selected_attribute = None
         self.highlight = None
         self.vertex_marker = None
@@ -145,11 +142,14 @@ class DigitalSketchMappingTool:
         self.point_tool = None
         self.point_style = os.path.join(self.plugin_dir, "styles", "geolink_points_010525.qml")
         self.polygon_style = os.path.join(self.plugin_dir, "styles", "geolink_polygons_010525.qml")
+        self.polygon_data_defined_style = os.path.join(self.plugin_dir, "styles", "geolink_polygons_data_defined.qml")
+        self.renderer_mode = get_default_renderer_mode()
         self.line_style = os.path.join(self.plugin_dir, "styles", "geolink_lines_010525.qml")
         self.clicked_buttons = set()
         self.text_changed = False
         self.project_crs = None
-        self.feature_identify_tool = FeatureIdentifyTool(self.iface, self)
+        with profiler.step("FeatureIdentifyTool"):
+            self.feature_identify_tool = FeatureIdentifyTool(self.iface, self)
         self.bing_maps_url = (
             "https://t0.tiles.virtualearth.net/tiles/a{q}.jpeg?g=685&mkt=en-us&n=z"
         )
@@ -179,9 +179,10 @@ class DigitalSketchMappingTool:
             'DigitalSketchMappingTool_{}.qm'.format(locale))
 
         if os.path.exists(locale_path):
-            self.translator = QTranslator()
-            self.translator.load(locale_path)
-            QCoreApplication.installTranslator(self.translator)
+            with profiler.step("translator"):
+                self.translator = QTranslator()
+                self.translator.load(locale_path)
+                QCoreApplication.installTranslator(self.translator)
 
         # Declare instance attributes
         self.actions = []
@@ -190,7 +191,11 @@ class DigitalSketchMappingTool:
         self.toolbar.setObjectName(u'DigitalSketchMappingTool')
 
         self.pluginIsActive = False
-        self.digital_sketch_widget = DigitalSketchMappingToolDockWidget()
+        with profiler.step("dock widget"):
+            self.digital_sketch_widget = DigitalSketchMappingToolDockWidget()
+        self.keypad_view = KeypadView(self.digital_sketch_widget.categoryAttrVerticalLayout, self.button_clicked)
+        self.painted_keypad_view = PaintedKeypadView(self.digital_sketch_widget.categoryAttrVerticalLayout,
+                                                     self.button_clicked)
         self.digital_sketch_widget.visibilityChanged.connect(self.widget_opened)
 
 
@@ -284,11 +289,16 @@ class DigitalSketchMappingTool:
         return action
 
 
+    @profiler.timed("initGui", finish=True)
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
         self.init_database_if_not_exists()
 
+        self.sketch_writer.featuresWritten.connect(self.sketch_features_written)
+        self.sketch_writer.writeFailed.connect(self.sketch_write_failed)
+        self.replay_sketch_journal()
+
         icon_path = ':/plugins/digital_sketch_mapping_tool/icon.png'
 
         action = self.add_action(
@@ -332,6 +342,8 @@ class DigitalSketchMappingTool:
         self.digital_sketch_widget.autoUpdateSlider.valueChanged.connect(self.auto_update_toggled)
 
         QgsProject.instance().layerRemoved.connect(self.layer_removed)
+        QgsProject.instance().crsChanged.connect(clear_transform_cache)
+        QgsProject.instance().transformContextChanged.connect(clear_transform_cache)
 
 
     def widget_opened(self, visible):
@@ -398,8 +410,7 @@ class DigitalSketchMappingTool:
         gps_point = QgsPointXY(position.x(), position.y())
         gps_point_map = gps_point
         if map_crs.authid() != "EPSG:4326":
-            transformer = QgsCoordinateTransform(QgsCoordinateReferenceSystem("EPSG:4326"), map_crs,
-                                                 QgsProject.instance())
+            transformer = get_coordinate_transform(QgsCoordinateReferenceSystem("EPSG:4326"), map_crs)
             gps_point_map = transformer.transform(gps_point)
 
         """Getting the position of the GPS in respective of the device coordinates.
@@ -417,6 +428,7 @@ class DigitalSketchMappingTool:
         self.canvas.refresh()
 
 
+    @profiler.timed("init_database_if_not_exists")
     def init_database_if_not_exists(self):
         """check if the SQLite database exists if not create the database"""
         if os.path.exists(self.db_path):
@@ -461,6 +473,8 @@ class DigitalSketchMappingTool:
         """Check if there are any existing sketch layers in the project."""
         layer_groups = get_existing_enabled_layers()
         if len(layer_groups['points']) > 0 and len(layer_groups['polygons']) > 0 and len(layer_groups['lines']) > 0:
+            from select_existing_layer import SelectExistingLayerDialog
+
             layer_selection = SelectExistingLayerDialog(layer_groups)
             if layer_selection.exec_() == QDialog.Accepted:
                 self.set_layer_from_existing(layer_selection.get_layer_selection())
@@ -545,23 +559,33 @@ class DigitalSketchMappingTool:
     def populate_categories(self):
         """Populate the categories based on the selected keypad categories.
         Before this, check if there are any existing-selected categories. If so, clear the placeholder variables.
-        Populate the new keypad elements.
+        Populate the new keypad elements, reusing the buttons of the items that are already shown.
         """
         if self.feature_string != "":
             self.clear_current_btn_selection()
             self.update_code_line_edit("")
 
         items = self.keypad_manager.get_checked_category_items()
-        attr_box = self.digital_sketch_widget.categoryAttrVerticalLayout
-        delete_keypad_items(attr_box)
+        height = self.attributes["height"] if self.attributes is not None else get_default_button_height()
+        width = self.attributes["width"] if self.attributes is not None else get_default_button_width()
+        font = self.attributes["font"] if self.attributes is not None else get_default_button_font()
+        font_colour = self.attributes["colour"] if self.attributes is not None else get_default_button_font_colour()
+        self.get_keypad_view().populate(items, height, width, font, font_colour)
 
-        if len(items) > 2:
-            chunks = split_array_to_chunks(items)
-            for chunk in chunks:
-                attr_box.addWidget(self.populate_buttons_from_list(chunk))
-        else:
-            attr_box.addWidget(self.populate_buttons_from_list(items))
-        attr_box.addStretch()
+
+    def get_keypad_view(self):
+        """Get the keypad view of the keypad mode selected in the settings.
+        The keypad of the other mode is removed.
+
+        :return: KeypadView or PaintedKeypadView
+        """
+        keypad_mode = self.attributes["keypad_mode"] if self.attributes is not None else get_default_keypad_mode()
+        if keypad_mode == 'painted':
+            self.keypad_view.clear()
+            return self.painted_keypad_view
+
+        self.painted_keypad_view.clear()
+        return self.keypad_view
 
 
     def button_clicked(self, button_name, btn):
@@ -630,8 +654,6 @@ class DigitalSketchMappingTool:
         if self.digitizing_tool is not None:
             if self.digitizing_tool.features_to_save():
                 self.save_layers(False)
-            else:
-                self.iterate_and_commit_layers(False)
             self.iface.mapCanvas().unsetMapTool(self.digitizing_tool)
 
 
@@ -653,9 +675,6 @@ class DigitalSketchMappingTool:
         if tool:
             self.setup_stream_digitizing(layer, tool)
 
-        # Connect to feature added signal
-        layer.featureAdded.connect(lambda fid: self.process_layer_after_adding(fid, layer, layer_type))
-
 
     def auto_update_toggled(self, value):
         """Handle the auto-update toggled event.
@@ -780,28 +799,21 @@ class DigitalSketchMappingTool:
             self.update_auto_update_disabled_flag(False)
             self.change_gps_settings(True)
 
-        self.iterate_and_commit_layers(show_message)
-
+        if show_message:
+            self.show_saved_message()
 
-    def iterate_and_commit_layers(self, show_message):
-        """This function will iterate over sketch layers and see if they are editable if so commit changes.
-        If show_message is True, then will show a success message on the Message Bar
 
-        :param show_message: Should the commit changes message be shown or not.
-        :type show_message: bool
+    def show_saved_message(self):
+        """Show on the Message Bar whether the sketches are saved.
+        The sketch layers are never put in edit mode, the background writer owns the writes to the GeoPackage,
+        so there is no edit buffer to commit here. Failed writes are reported by sketch_write_failed.
         """
-        layers = [
-            (self.point_layer, "Point"),
-            (self.line_layer, "Line"),
-            (self.polygon_layer, "Polygon")
-        ]
-
-        for layer, name in layers:
-            if layer.isEditable():
-                layer.commitChanges()  # Save the changes
-                if show_message:
-                    self.iface.messageBar().pushMessage("Success", f"Changes committed successfully to {name} layer!",
-                                                        level=Qgis.Success)
+        if self.sketch_writer.is_busy():
+            self.iface.messageBar().pushMessage("Info", "Saving the sketches to the sketch layers.",
+                                                level=Qgis.Info, duration=5)
+        else:
+            self.iface.messageBar().pushMessage("Success", "Sketches saved successfully to the sketch layers!",
+                                                level=Qgis.Success)
 
 
     def layer_removed(self, layer_id):
@@ -814,8 +826,8 @@ class DigitalSketchMappingTool:
         if not self.sketch_layers_set or 'sketch_' not in layer_id:
             return
 
-        attr_box = self.digital_sketch_widget.categoryAttrVerticalLayout
-        delete_keypad_items(attr_box)
+        self.keypad_view.clear()
+        self.painted_keypad_view.clear()
         self.check_for_current_selection()
         self.reset_selection_digitize_tool()
 
@@ -923,10 +935,16 @@ class DigitalSketchMappingTool:
         :param disable_existing: Boolean to indicate if it is to disable existing layers checkbox
         :type disable_existing: bool
         """
+        from .app_settings import AppSettingsDialog
+
         settings_dialog = AppSettingsDialog(self.keypad_manager, self.attributes, disable_existing)
         if settings_dialog.exec_() == QDialog.Accepted:
             self.attributes = settings_dialog.get_attributes()
             self.selected_colour = self.attributes['feature_colour']
+            self.update_digitizing_tools_settings()
+            if self.renderer_mode != self.attributes['renderer_mode']:
+                self.renderer_mode = self.attributes['renderer_mode']
+                self.update_polygon_renderer()
 
             if self.attributes['new_project']:
                 self.reset_selection_digitize_tool()
@@ -950,6 +968,9 @@ class DigitalSketchMappingTool:
             if self.attributes['add_bing_imagery'] and not bool(bing_layer):
                 self.load_bing_maps()
 
+        else:
+            self.keypad_manager.discard_changes()
+
 
     def done_digitizing(self):
         """Handle the Done Digitizing button click."""
@@ -967,12 +988,12 @@ class DigitalSketchMappingTool:
             self.clear_current_btn_selection()
             self.clicked_buttons.clear()
             self.text_changed = False
-            code_attr = self.feature_string if not self.text_changed else self.get_code_txt()
-            surveyor = self.attributes['surveyor'] if self.attributes is not None else ""
-            type_txt = self.attributes['type_txt'] if self.attributes is not None else ""
-            attributes = dict(colour=self.selected_colour, code=code_attr, surveyor=surveyor,
-                              type_txt=type_txt)
-            self.digitizing_tool.save_feature(attributes)
+            self.digitizing_tool.save_feature(self.get_feature_attributes())
+            # the code is cleared as soon as the sketch is handed to the writer, keypad taps made while it is being
+            # written belong to the next sketch, and the code is kept if the sketch could not be saved
+            if not self.digitizing_tool.features_to_save():
+                self.feature_string = ""
+                self.update_code_line_edit("")
             if self.attributes['rotate_recenter_on_done']:
                 connections = QgsApplication.gpsConnectionRegistry().connectionList()
                 if not connections or len(connections) == 0:
@@ -984,6 +1005,18 @@ class DigitalSketchMappingTool:
 
 
 
+    def get_feature_attributes(self):
+        """Get the attributes the sketched features are saved with.
+        Also used by the digitizing tools to journal each finished stroke.
+
+        :return: Dictionary of the colour, code, surveyor and type attributes
+        """
+        code_attr = self.feature_string if not self.text_changed else self.get_code_txt()
+        surveyor = self.attributes['surveyor'] if self.attributes is not None else ""
+        type_txt = self.attributes['type_txt'] if self.attributes is not None else ""
+        return dict(colour=self.selected_colour, code=code_attr, surveyor=surveyor, type_txt=type_txt)
+
+
     def code_text_changed(self):
         """Handle the code text changed event.
         This would clear the existing keypad button selection.
@@ -1062,9 +1095,7 @@ class DigitalSketchMappingTool:
         :type fid: int
         """
         self.feature_identify_tool.remove_highlight()
-        layer.startEditing()
-        layer.deleteFeature(fid)
-        layer.commitChanges()
+        self.sketch_writer.delete_features(layer, [fid])
         self.selected_attribute = None
 
 
@@ -1081,7 +1112,6 @@ class DigitalSketchMappingTool:
         self.change_gps_settings(True)
         self.iface.mapCanvas().refresh()
         self.iface.setActiveLayer(layer)
-        layer.startEditing()
         self.digitizing_tool = tool
         self.iface.mapCanvas().setMapTool(self.digitizing_tool)
 
@@ -1128,33 +1158,87 @@ class DigitalSketchMappingTool:
             self.digitizing_tool = None
 
 
-    def process_layer_after_adding(self, fid, layer, layer_type):
-        """Process the layer after adding a new feature
+    def process_features_after_adding(self, features, layer, layer_type):
+        """Process the layer once after a batch of new features is committed
 
-        :param fid: ID of the added feature
-        :type fid: int
+        :param features: Committed features, with their final feature IDs
+        :type features: list of QgsFeature
 
-        :param layer: Layer of the added feature
+        :param layer: Layer of the added features
         :type layer: QgsVectorLayer
 
         :param: layer_type: type of the layer i.e. line, polygon or point.
         :type layer_type: str
         """
-        feature = layer.getFeature(fid)
-        code = feature.attribute("Code")
-        self.layers_saved += 1
-        already_exist = {"type": layer_type, "fid": fid, "code": code} in self.created_layers_stack
-        if fid > 0 and not already_exist:
-            self.created_layers_stack.append({"type": layer.name(), "fid": fid, "code": code})
-
-        # for polygon layers update the fill colour
-        if layer_type == 'polygons':
-            apply_symbology(layer, self.iface)
-
-        if self.layers_saved == self.digitizing_tool.number_of_items_to_update:
-            self.layers_saved = 0
-            self.feature_string = ""
-            self.update_code_line_edit("")
+        layer_name = layer.name()
+        for feature in features:
+            if feature.id() > 0:
+                self.created_layers_stack.append({"type": layer_name, "fid": feature.id(), "code": feature.attribute("Code")})
+
+        # for categorized polygon layers add the fill colours of the batch to the renderer,
+        # the data-defined renderer reads the colour attribute directly
+        if layer_type == 'polygons' and self.renderer_mode == 'categorized':
+            self.symbology_manager.add_features(layer, features)
+
+
+    def get_sketch_layer_type(self, layer):
+        """Get the type of a sketch layer.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :return: type of the layer i.e. lines, polygons or points, None if the layer is not a sketch layer
+        """
+        if layer is self.point_layer:
+            return 'points'
+        elif layer is self.polygon_layer:
+            return 'polygons'
+        elif layer is self.line_layer:
+            return 'lines'
+        return None
+
+
+    def sketch_features_written(self, layer, features):
+        """Process the features once the writer has saved them to the GeoPackage.
+
+        :param layer: Layer of the saved features
+        :type layer: QgsVectorLayer
+
+        :param features: Saved features, with their final feature IDs
+        :type features: list of QgsFeature
+        """
+        layer_type = self.get_sketch_layer_type(layer)
+        if layer_type is not None:
+            self.process_features_after_adding(features, layer, layer_type)
+
+
+    def replay_sketch_journal(self):
+        """Open the sketch journal and write the features left unsaved by the previous session to the sketch layers."""
+        try:
+            self.sketch_journal.open()
+            # the settings are not set yet when the plugin starts, the strokes are saved with the default optimization
+            count = self.sketch_writer.replay_journal(get_default_simplify_tolerance(), get_default_grid_precision())
+            if count > 0:
+                self.iface.messageBar().pushMessage("Info", f"Recovering {count} unsaved sketch feature(s).",
+                                                    level=Qgis.Info, duration=5)
+        except Exception as e:
+            QgsApplication.messageLog().logMessage(f"error: {e}", "DigitalSketchPlugin")
+
+
+    def sketch_write_failed(self, layer, error):
+        """Show an error message when the writer could not save the features.
+
+        :param layer: Layer the features were saved to
+        :type layer: QgsVectorLayer
+
+        :param error: Error message
+        :type error: str
+        """
+        QgsApplication.messageLog().logMessage(f"error: {error}", "DigitalSketchPlugin")
+        layer_name = layer.name() if layer is not None else "sketch"
+        self.iface.messageBar().pushMessage("Error", f"Could not save the sketch to {layer_name} layer: {error}. "
+                                                     "It will be recovered on the next start.",
+                                            level=Qgis.Critical, duration=5)
 
 
     def create_geopackage_file(self, project_name):
@@ -1218,62 +1302,6 @@ class DigitalSketchMappingTool:
             self.digital_sketch_widget.selectPushButton.setChecked(False)
 
 
-    def populate_buttons_from_list(self, items):
-        """Populate the keypad buttons from the list.
-        Set the button's style using the attributes defined in the settings window or using the default style
-        Setting up the clicked signal.
-
-        :param items: List of items
-        :type items: list
-
-        :return: QWidget
-        """
-        margin = QMargins(1,1,1,1)
-        layout = QHBoxLayout()
-        layout.setContentsMargins(margin)
-        height = self.attributes["height"] if self.attributes is not None else get_default_button_height()
-        width = self.attributes["width"] if self.attributes is not None else get_default_button_width()
-        font = self.attributes["font"] if self.attributes is not None else get_default_button_font()
-        font_colour = self.attributes["colour"] if self.attributes is not None else get_default_button_font_colour()
-        widget = QWidget()
-        widget.setMinimumHeight(height + 1)
-        widget.setMaximumHeight(height + 1)
-
-        # generate keypad items from the selected category.
-        for i in items:
-            light_colour = adjust_color(i["colour"], 30)
-            btn = QPushButton(i["item"])
-            btn.setMinimumHeight(height)
-            btn.setMaximumHeight(height)
-            btn.setMinimumWidth(width)
-            btn.setMaximumWidth(width)
-            btn.setFont(font)
-            btn.setCheckable(True)
-            btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {i["colour"]};
-                                color: {font_colour};
-                                border-radius: 5px;
-                                padding: 2px 2px;
-                            }}
-                            QPushButton:hover {{
-                                background-color: {light_colour};
-                            }}
-                            QPushButton:checked {{
-                                border: 2px solid black
-                            }}
-                            """)
-            layout.addWidget(btn)
-            btn.clicked.connect(lambda checked, btn_name=i["item"], clicked_btn=btn: self.button_clicked(btn_name, clicked_btn))
-            layout.setContentsMargins(1, 1, 1, 1)
-            layout.setSpacing(2)
-
-        layout.addItem(QSpacerItem(40, 30, QSizePolicy.Expanding, QSizePolicy.Minimum))
-        layout.insertStretch(-1, 100)
-        widget.setLayout(layout)
-        return widget
-
-
     def update_code_line_edit(self, value):
         """Update the code line edit with the given value.
 
@@ -1294,33 +1322,63 @@ class DigitalSketchMappingTool:
     def set_style_and_digitizing_tool(self):
         """Sets the styles of sketch layers."""
         if self.point_layer is not None:
-            self.point_layer.loadNamedStyle(self.point_style)
-            self.point_tool = StreamDigitizingTool(self.iface, self.point_layer, 'points')
+            self.style_cache.apply_style(self.point_layer, self.point_style)
+            self.point_tool = StreamDigitizingTool(self.iface, self.point_layer, 'points', self.sketch_writer,
+                                                   self.get_feature_attributes)
 
         if self.polygon_layer is not None:
-            self.polygon_layer.loadNamedStyle(self.polygon_style)
-            self.polygon_tool = StreamDigitizingTool(self.iface, self.polygon_layer, 'polygons')
+            self.style_cache.apply_style(self.polygon_layer, self.get_polygon_style())
+            self.symbology_manager.forget(self.polygon_layer)
+            self.polygon_tool = StreamDigitizingTool(self.iface, self.polygon_layer, 'polygons', self.sketch_writer,
+                                                     self.get_feature_attributes)
 
         if self.line_layer is not None:
-            self.line_layer.loadNamedStyle(self.line_style)
-            self.multiline_tool = MultiLineDigitizingTool(self.iface, self.line_layer)
+            self.style_cache.apply_style(self.line_layer, self.line_style)
+            self.multiline_tool = MultiLineDigitizingTool(self.iface, self.line_layer, self.sketch_writer,
+                                                          self.get_feature_attributes)
 
+        self.update_digitizing_tools_settings()
         self.canvas.refresh()
 
 
-    def update_selected_layer_style(self):
-        """Updated the selected features layer style"""
-        layer_type = self.selected_attribute["type"]
+    def get_polygon_style(self):
+        """Get the style of the polygon layer for the renderer mode selected in the settings.
 
-        layer = None
-        if "lines" in layer_type:
-            layer = self.line_layer
-        elif "points" in layer_type:
-            layer = self.point_layer
-        elif "polygons" in layer_type:
-            layer = self.polygon_layer
+        :return: Path to the polygon QML style
+        """
+        if self.renderer_mode == 'data_defined':
+            return self.polygon_data_defined_style
+        return self.polygon_style
+
+
+    def update_polygon_renderer(self):
+        """Load the polygon style of the selected renderer mode.
+        For the categorized renderer, the categories are rebuilt from the colours of the layer.
+        """
+        if self.polygon_layer is None:
+            return
+
+        self.style_cache.apply_style(self.polygon_layer, self.get_polygon_style())
+        self.symbology_manager.forget(self.polygon_layer)
+        if self.renderer_mode == 'categorized':
+            self.symbology_manager.apply(self.polygon_layer)
+        else:
+            self.polygon_layer.triggerRepaint()
 
-        layer.startEditing()
+
+    def update_digitizing_tools_settings(self):
+        """Pass the sketch settings defined in the settings window, or the defaults, to the digitizing tools."""
+        tolerance = self.attributes["stream_tolerance"] if self.attributes is not None else get_default_stream_tolerance()
+        frame_rate = self.attributes["frame_rate"] if self.attributes is not None else get_default_frame_rate()
+        simplify_tolerance = (self.attributes["simplify_tolerance"] if self.attributes is not None
+                              else get_default_simplify_tolerance())
+        grid_precision = self.attributes["grid_precision"] if self.attributes is not None else get_default_grid_precision()
+
+        for tool in (self.point_tool, self.polygon_tool, self.multiline_tool):
+            if tool is not None:
+                tool.set_stream_tolerance(tolerance)
+                tool.set_frame_rate(frame_rate)
+                tool.set_save_optimization(simplify_tolerance, grid_precision)
 
 
     def update_auto_update_disabled_flag(self, state):
@@ -1354,6 +1412,16 @@ class DigitalSketchMappingTool:
 
         #print "** UNLOAD DigitalSketchMappingTool"
 
+        # make sure the finished sketches are written before the plugin goes away
+        if self.sketch_writer.flush():
+            self.sketch_journal.close()
+        else:
+            # the running write still commits its batch to the journal when it finishes, so the journal is left open
+            QgsApplication.messageLog().logMessage("error: saving the sketch features timed out, they will be "
+                                                   "recovered on the next start", "DigitalSketchPlugin")
+        self.style_cache.clear()
+        self.keypad_manager.close()
+
         for action in self.actions:
             self.iface.removePluginMenu(self.tr(u'&Digital Sketch Mapping Tool'), action)
             self.iface.removeToolBarIcon(action)
@@ -1368,6 +1436,17 @@ class DigitalSketchMappingTool:
 
         self.actions.clear()
 
+        try:
+            QgsProject.instance().crsChanged.disconnect(clear_transform_cache)
+            QgsProject.instance().transformContextChanged.disconnect(clear_transform_cache)
+        except Exception as e:
+            QgsApplication.messageLog().logMessage(f"error: {e}", "DigitalSketchPlugin")
+        clear_transform_cache()
+
+        if self.resource_path is not None:
+            QResource.unregisterResource(self.resource_path)
+            self.resource_path = None
+
 
     def run(self):
         """Run method that loads and starts the plugin"""
@@ -1387,3 +1466,7 @@ class DigitalSketchMappingTool:
             # show the dockwidget
             self.iface.addDockWidget(Qt.RightDockWidgetArea, self.digital_sketch_widget)
             self.digital_sketch_widget.show()
+
+            # pick up keypad changes saved by another QGIS process while the plugin was hidden
+            if self.keypad_manager.reload_if_changed() and self.sketch_layers_set:
+                self.populate_categories()
@@ -22,13 +22,12 @@
  ***************************************************************************/
 """
 
-import os
-
-from qgis.PyQt import QtGui, QtWidgets, uic
+from qgis.PyQt import QtGui, QtWidgets
 from qgis.PyQt.QtCore import pyqtSignal
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'digital_sketch_mapping_tool_dockwidget_base.ui'))
+from form_loader import load_form
+
+FORM_CLASS = load_form('digital_sketch_mapping_tool_dockwidget_base.ui')
 
 
 class DigitalSketchMappingToolDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
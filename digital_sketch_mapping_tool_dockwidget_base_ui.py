@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'digital_sketch_mapping_tool_dockwidget_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_AppTesterDockWidgetBase(object):
+    def setupUi(self, AppTesterDockWidgetBase):
+        AppTesterDockWidgetBase.setObjectName("AppTesterDockWidgetBase")
+        AppTesterDockWidgetBase.resize(409, 737)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.dockWidgetContents)
+        self.horizontalLayout_5.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_5.setSpacing(2)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.frame_4 = QtWidgets.QFrame(self.dockWidgetContents)
+        self.frame_4.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.frame_4)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(1)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame_2 = QtWidgets.QFrame(self.frame_4)
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout_6.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_6.setSpacing(1)
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.zoomInPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.zoomInPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.zoomInPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.zoomInPushButton.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/buttons/magnifying-glass-plus-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.zoomInPushButton.setIcon(icon)
+        self.zoomInPushButton.setIconSize(QtCore.QSize(27, 27))
+        self.zoomInPushButton.setObjectName("zoomInPushButton")
+        self.horizontalLayout_6.addWidget(self.zoomInPushButton)
+        self.zoomOutPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.zoomOutPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.zoomOutPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.zoomOutPushButton.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("icons/buttons/magnifying-glass-minus-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.zoomOutPushButton.setIcon(icon1)
+        self.zoomOutPushButton.setIconSize(QtCore.QSize(27, 27))
+        self.zoomOutPushButton.setObjectName("zoomOutPushButton")
+        self.horizontalLayout_6.addWidget(self.zoomOutPushButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem)
+        self.polygonPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.polygonPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.polygonPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.polygonPushButton.setStyleSheet("")
+        self.polygonPushButton.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap("icons/buttons/draw-polygon-sharp-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.polygonPushButton.setIcon(icon2)
+        self.polygonPushButton.setIconSize(QtCore.QSize(38, 38))
+        self.polygonPushButton.setCheckable(True)
+        self.polygonPushButton.setObjectName("polygonPushButton")
+        self.horizontalLayout_6.addWidget(self.polygonPushButton)
+        self.pointPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.pointPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.pointPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.pointPushButton.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap("icons/buttons/location-dot-sharp-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pointPushButton.setIcon(icon3)
+        self.pointPushButton.setIconSize(QtCore.QSize(32, 32))
+        self.pointPushButton.setCheckable(True)
+        self.pointPushButton.setObjectName("pointPushButton")
+        self.horizontalLayout_6.addWidget(self.pointPushButton)
+        self.linePushButton = QtWidgets.QPushButton(self.frame_2)
+        self.linePushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.linePushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.linePushButton.setText("")
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap("icons/buttons/waveform-lines-sharp-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.linePushButton.setIcon(icon4)
+        self.linePushButton.setIconSize(QtCore.QSize(37, 37))
+        self.linePushButton.setCheckable(True)
+        self.linePushButton.setObjectName("linePushButton")
+        self.horizontalLayout_6.addWidget(self.linePushButton)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem1)
+        self.saveAndPanPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.saveAndPanPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.saveAndPanPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.saveAndPanPushButton.setText("")
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap("icons/buttons/save-and-pan.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.saveAndPanPushButton.setIcon(icon5)
+        self.saveAndPanPushButton.setIconSize(QtCore.QSize(38, 38))
+        self.saveAndPanPushButton.setCheckable(True)
+        self.saveAndPanPushButton.setObjectName("saveAndPanPushButton")
+        self.horizontalLayout_6.addWidget(self.saveAndPanPushButton)
+        self.selectPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.selectPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.selectPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.selectPushButton.setText("")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap("icons/buttons/arrow-trash-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.selectPushButton.setIcon(icon6)
+        self.selectPushButton.setIconSize(QtCore.QSize(35, 35))
+        self.selectPushButton.setCheckable(True)
+        self.selectPushButton.setObjectName("selectPushButton")
+        self.horizontalLayout_6.addWidget(self.selectPushButton)
+        self.verticalLayout.addWidget(self.frame_2)
+        self.scrollArea = QtWidgets.QScrollArea(self.frame_4)
+        self.scrollArea.setMinimumSize(QtCore.QSize(0, 0))
+        self.scrollArea.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 405, 553))
+        self.scrollAreaWidgetContents.setMinimumSize(QtCore.QSize(0, 0))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.categoryAttrVerticalLayout = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents)
+        self.categoryAttrVerticalLayout.setContentsMargins(2, 2, 2, 2)
+        self.categoryAttrVerticalLayout.setObjectName("categoryAttrVerticalLayout")
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.verticalLayout.addWidget(self.scrollArea)
+        self.frame = QtWidgets.QFrame(self.frame_4)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.frame.setFont(font)
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout_4.setContentsMargins(1, 1, 1, 1)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setMinimumSize(QtCore.QSize(0, 40))
+        self.label.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.horizontalLayout_4.addWidget(self.label)
+        self.codeLineEdit = QtWidgets.QLineEdit(self.frame)
+        self.codeLineEdit.setMinimumSize(QtCore.QSize(0, 40))
+        self.codeLineEdit.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.codeLineEdit.setFont(font)
+        self.codeLineEdit.setObjectName("codeLineEdit")
+        self.horizontalLayout_4.addWidget(self.codeLineEdit)
+        self.donePushButton = QtWidgets.QPushButton(self.frame)
+        self.donePushButton.setMinimumSize(QtCore.QSize(75, 40))
+        self.donePushButton.setMaximumSize(QtCore.QSize(75, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.donePushButton.setFont(font)
+        self.donePushButton.setObjectName("donePushButton")
+        self.horizontalLayout_4.addWidget(self.donePushButton)
+        self.verticalLayout.addWidget(self.frame)
+        self.btnFrame = QtWidgets.QFrame(self.frame_4)
+        self.btnFrame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.btnFrame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.btnFrame.setObjectName("btnFrame")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.btnFrame)
+        self.horizontalLayout_2.setContentsMargins(1, 4, 1, 1)
+        self.horizontalLayout_2.setSpacing(2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.settingPushButton = QtWidgets.QPushButton(self.btnFrame)
+        self.settingPushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.settingPushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.settingPushButton.setText("")
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap("icons/buttons/gears-sharp-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.settingPushButton.setIcon(icon7)
+        self.settingPushButton.setIconSize(QtCore.QSize(30, 37))
+        self.settingPushButton.setChecked(False)
+        self.settingPushButton.setObjectName("settingPushButton")
+        self.horizontalLayout_2.addWidget(self.settingPushButton)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem2)
+        self.frame_3 = QtWidgets.QFrame(self.btnFrame)
+        self.frame_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.frame_3.setObjectName("frame_3")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame_3)
+        self.horizontalLayout.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout.setSpacing(1)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.centerAndRotatePushButton = QtWidgets.QPushButton(self.frame_3)
+        self.centerAndRotatePushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.centerAndRotatePushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.centerAndRotatePushButton.setText("")
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap("icons/buttons/gps-plane-icon.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.centerAndRotatePushButton.setIcon(icon8)
+        self.centerAndRotatePushButton.setIconSize(QtCore.QSize(40, 40))
+        self.centerAndRotatePushButton.setObjectName("centerAndRotatePushButton")
+        self.horizontalLayout.addWidget(self.centerAndRotatePushButton)
+        self.label_2 = QtWidgets.QLabel(self.frame_3)
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout.addWidget(self.label_2)
+        spacerItem3 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem3)
+        self.autoUpdateSlider = QtWidgets.QSlider(self.frame_3)
+        self.autoUpdateSlider.setMinimumSize(QtCore.QSize(60, 30))
+        self.autoUpdateSlider.setMaximumSize(QtCore.QSize(60, 30))
+        self.autoUpdateSlider.setStyleSheet("QSlider::groove:horizontal {\n"
+"    border: 1px solid #444;\n"
+"    background: darkgreen;\n"
+"    height: 10px;\n"
+"    width: 50px;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"QSlider::sub-page:horizontal {\n"
+"    background: darkgreen;\n"
+"    border: 1px solid #444;\n"
+"    height: 10px;\n"
+"    width: 50px;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"QSlider::add-page:horizontal {\n"
+"    background: white;\n"
+"    border: 1px solid #444;\n"
+"    height: 10px;\n"
+"    width: 50px;\n"
+"    border-radius: 4px;\n"
+"}\n"
+"QSlider::handle:horizontal {\n"
+"    background: white;\n"
+"    border: 1px solid #888;\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"    margin: -6px 0;\n"
+"    border-radius: 2px;\n"
+"}\n"
+"/* Red style when disabled */\n"
+"QSlider::groove:horizontal:disabled,\n"
+"QSlider::sub-page:horizontal:disabled {\n"
+"    background: red;\n"
+"}")
+        self.autoUpdateSlider.setMaximum(1)
+        self.autoUpdateSlider.setPageStep(1)
+        self.autoUpdateSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.autoUpdateSlider.setObjectName("autoUpdateSlider")
+        self.horizontalLayout.addWidget(self.autoUpdateSlider)
+        self.horizontalLayout_2.addWidget(self.frame_3)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem4)
+        self.deletePushButton = QtWidgets.QPushButton(self.btnFrame)
+        self.deletePushButton.setMinimumSize(QtCore.QSize(50, 50))
+        self.deletePushButton.setMaximumSize(QtCore.QSize(50, 50))
+        self.deletePushButton.setText("")
+        icon9 = QtGui.QIcon()
+        icon9.addPixmap(QtGui.QPixmap("icons/buttons/trash-undo-sharp-duotone-thin.svg"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.deletePushButton.setIcon(icon9)
+        self.deletePushButton.setIconSize(QtCore.QSize(35, 35))
+        self.deletePushButton.setObjectName("deletePushButton")
+        self.horizontalLayout_2.addWidget(self.deletePushButton)
+        self.verticalLayout.addWidget(self.btnFrame)
+        self.horizontalLayout_5.addWidget(self.frame_4)
+        AppTesterDockWidgetBase.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(AppTesterDockWidgetBase)
+        QtCore.QMetaObject.connectSlotsByName(AppTesterDockWidgetBase)
+
+    def retranslateUi(self, AppTesterDockWidgetBase):
+        _translate = QtCore.QCoreApplication.translate
+        AppTesterDockWidgetBase.setWindowTitle(_translate("AppTesterDockWidgetBase", "Digital Sketch Mapping Tool"))
+        self.zoomInPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Zoom Out</span></p></body></html>"))
+        self.zoomOutPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Zoom In</span></p></body></html>"))
+        self.polygonPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Polygon Feature</span></p></body></html>"))
+        self.pointPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Point Feature</span></p></body></html>"))
+        self.linePushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Line Feature</span></p></body></html>"))
+        self.saveAndPanPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Save Layers &amp; Pan</span></p></body></html>"))
+        self.selectPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Select Feature</span></p></body></html>"))
+        self.label.setText(_translate("AppTesterDockWidgetBase", "Code"))
+        self.donePushButton.setText(_translate("AppTesterDockWidgetBase", "Done"))
+        self.settingPushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Settings</span></p></body></html>"))
+        self.centerAndRotatePushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Rotate &amp; Re-center</span></p></body></html>"))
+        self.label_2.setText(_translate("AppTesterDockWidgetBase", "Auto Update"))
+        self.deletePushButton.setToolTip(_translate("AppTesterDockWidgetBase", "<html><head/><body><p><span style=\" font-size:9pt;\">Delete Last Layer</span></p></body></html>"))
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "5e298d9f0b2b0125d40ad5220483459cd0555297672f1ee83289e21c4bba732a"
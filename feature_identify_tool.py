@@ -53,7 +53,6 @@ class FeatureIdentifyTool(QgsMapTool):
             self.remove_highlight()
             self.highlight_feature(layer, feature)
             self.tool.selected_attribute = dict(type=layer.name(), fid=fid, code=code)
-            self.tool.update_selected_layer_style()
         else:
             self.remove_highlight()
             self.iface.messageBar().pushMessage("Info", "Selected feature does not belong to sketch layers.",
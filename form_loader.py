@@ -0,0 +1,121 @@
+import hashlib
+import importlib.util
+import os
+
+from qgis.core import QgsApplication
+
+_plugin_directory_ = os.path.dirname(__file__)
+# UI files whose fallback to the UI file has been logged
+_reported_fallbacks_ = set()
+
+
+def get_compiled_form_path(ui_file):
+    """Get the path of the compiled form module of a UI file, e.g. app_settings.ui -> app_settings_ui.py
+
+    :param ui_file: UI file name, relative to the plugin directory
+    :type ui_file: str
+
+    :return: Path of the compiled form module
+    """
+    return os.path.join(_plugin_directory_, f"{os.path.splitext(ui_file)[0]}_ui.py")
+
+
+def get_ui_hash(ui_file):
+    """Get the hash of a UI file, as recorded in its compiled form by scripts/compile_forms.py.
+    Line endings are normalized, such that a checkout converting them does not outdate the forms.
+
+    :param ui_file: UI file name, relative to the plugin directory
+    :type ui_file: str
+
+    :return: SHA-256 hex digest
+    """
+    with open(os.path.join(_plugin_directory_, ui_file), "rb") as ui:
+        return hashlib.sha256(ui.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def is_compiled_form_outdated(module, ui_file):
+    """Checks if a compiled form was compiled from another version of the UI file.
+    The hash of the UI file is compared rather than the file times, which are arbitrary after a clone or an install.
+
+    :param module: Compiled form module
+    :type module: module
+
+    :param ui_file: UI file name, relative to the plugin directory
+    :type ui_file: str
+
+    :return: True if the form has to be compiled, False otherwise
+    """
+    return getattr(module, "UI_HASH", None) != get_ui_hash(ui_file)
+
+
+def load_form(ui_file):
+    """Load the form class of a UI file.
+    The form compiled ahead of time with scripts/compile_forms.py is used when it is up to date, otherwise the
+    UI file is parsed with uic.loadUiType, which is much slower.
+
+    :param ui_file: UI file name, relative to the plugin directory
+    :type ui_file: str
+
+    :return: Form class to mix into the dialog class
+    """
+    try:
+        module = load_compiled_form(ui_file)
+        if not is_compiled_form_outdated(module, ui_file):
+            return get_form_class(module)
+        report_fallback(ui_file, f"compiled form of {ui_file} is outdated, run scripts/compile_forms.py")
+    except FileNotFoundError:
+        report_fallback(ui_file, f"compiled form of {ui_file} is missing, run scripts/compile_forms.py")
+    except Exception as e:
+        report_fallback(ui_file, f"error: {e}")
+
+    from qgis.PyQt import uic
+    form_class, _ = uic.loadUiType(os.path.join(_plugin_directory_, ui_file))
+    return form_class
+
+
+def report_fallback(ui_file, message):
+    """Log why a UI file is parsed instead of using its compiled form, once per UI file.
+
+    :param ui_file: UI file name, relative to the plugin directory
+    :type ui_file: str
+
+    :param message: Message to log
+    :type message: str
+    """
+    if ui_file in _reported_fallbacks_:
+        return
+    _reported_fallbacks_.add(ui_file)
+    QgsApplication.messageLog().logMessage(message, "DigitalSketchPlugin")
+
+
+def load_compiled_form(ui_file):
+    """Load the compiled form module of a UI file.
+
+    :param ui_file: UI file name, relative to the plugin directory
+    :type ui_file: str
+
+    :return: Compiled form module
+    """
+    compiled_path = get_compiled_form_path(ui_file)
+    if not os.path.exists(compiled_path):
+        raise FileNotFoundError(compiled_path)
+
+    module_name = f"digital_sketch_forms.{os.path.splitext(os.path.basename(compiled_path))[0]}"
+    spec = importlib.util.spec_from_file_location(module_name, compiled_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_form_class(module):
+    """Get the form class of a compiled form module.
+
+    :param module: Compiled form module
+    :type module: module
+
+    :return: Form class, the Ui_ class generated by pyuic5
+    """
+    form_class = next((value for name, value in vars(module).items() if name.startswith("Ui_")), None)
+    if form_class is None:
+        raise ImportError(f"no form class in {module.__file__}")
+    return form_class
@@ -0,0 +1,79 @@
+from qgis.PyQt.QtCore import QTimer
+
+
+class ThrottledRubberBand:
+    """Buffers the vertices added to a rubber band while sketching and pushes them to the rubber band
+    at most once per display frame from a single timer. The timer only runs while a stroke is active.
+    """
+
+    def __init__(self, frame_rate):
+        """Constructor.
+
+        :param frame_rate: Maximum number of rubber band updates per second
+        :type frame_rate: int
+        """
+        self.rubber_band = None
+        self.pending_points = []
+        self.moved_point = None
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.flush)
+        self.set_frame_rate(frame_rate)
+
+    def set_frame_rate(self, frame_rate):
+        """Set the maximum number of rubber band updates per second.
+
+        :param frame_rate: Maximum number of rubber band updates per second
+        :type frame_rate: int
+        """
+        self.timer.setInterval(max(1, round(1000 / max(1, frame_rate))))
+
+    def start(self, rubber_band):
+        """Start buffering the vertices for the given rubber band.
+
+        :param rubber_band: Rubber band of the active stroke
+        :type rubber_band: QgsRubberBand
+        """
+        self.stop()
+        self.rubber_band = rubber_band
+        self.timer.start()
+
+    def add_point(self, point):
+        """Buffer a vertex to be added to the rubber band on the next frame.
+
+        :param point: Vertex in map coordinates
+        :type point: QgsPointXY
+        """
+        self.pending_points.append(point)
+
+    def move_last_point(self, point):
+        """Move the last vertex of the rubber band on the next frame.
+
+        :param point: Vertex in map coordinates
+        :type point: QgsPointXY
+        """
+        if self.pending_points:
+            self.pending_points[-1] = point
+        else:
+            self.moved_point = point
+
+    def flush(self):
+        """Push the buffered vertices to the rubber band with a single canvas item update."""
+        if self.rubber_band is None:
+            return
+
+        if self.moved_point is not None:
+            self.rubber_band.movePoint(self.moved_point)
+            self.moved_point = None
+
+        if self.pending_points:
+            last_point = self.pending_points.pop()
+            for point in self.pending_points:
+                self.rubber_band.addPoint(point, False)
+            self.rubber_band.addPoint(last_point, True)
+            self.pending_points = []
+
+    def stop(self):
+        """Push any buffered vertices and stop the timer."""
+        self.flush()
+        self.timer.stop()
+        self.rubber_band = None
@@ -1,10 +1,11 @@
 
 from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt import uic
 from qgis.PyQt.QtCore import QUrl
 import os
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "help.ui"))
+from form_loader import load_form
+
+FORM_CLASS = load_form("help.ui")
 
 class HelpDialog(QDialog, FORM_CLASS):
     def __init__(self, parent=None):
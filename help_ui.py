@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'help.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Help(object):
+    def setupUi(self, Help):
+        Help.setObjectName("Help")
+        Help.resize(527, 664)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        Help.setWindowIcon(icon)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(Help)
+        self.verticalLayout_2.setContentsMargins(2, 2, 2, 4)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setContentsMargins(-1, -1, -1, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.helpTextBrowser = QtWidgets.QTextBrowser(Help)
+        self.helpTextBrowser.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.helpTextBrowser.setAutoFormatting(QtWidgets.QTextEdit.AutoAll)
+        self.helpTextBrowser.setReadOnly(True)
+        self.helpTextBrowser.setSource(QtCore.QUrl(None))
+        self.helpTextBrowser.setObjectName("helpTextBrowser")
+        self.verticalLayout.addWidget(self.helpTextBrowser)
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+
+        self.retranslateUi(Help)
+        QtCore.QMetaObject.connectSlotsByName(Help)
+
+    def retranslateUi(self, Help):
+        _translate = QtCore.QCoreApplication.translate
+        Help.setWindowTitle(_translate("Help", "Digital Sketch Mapping Tool Help"))
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "55b3f95a08003c85bebbcf825791af9127d317fed05bf76fa41140111bb92b43"
@@ -1,6 +1,6 @@
 import datetime
 
-from delete_confirmation import DeleteConfirmationDialog
+from functools import lru_cache
 
 try:
     from osgeo import ogr
@@ -14,8 +14,20 @@ except ImportError:
 
 import platform
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from qgis.PyQt.QtGui import QColor, QFont
-from qgis.core import QgsCoordinateTransform, QgsProject, QgsApplication, QgsLayerTreeGroup, QgsLayerTreeLayer, Qgis
+from qgis.core import (QgsCoordinateTransform, QgsProject, QgsApplication, QgsLayerTreeGroup, QgsLayerTreeLayer, Qgis,
+                       QgsUnitTypes)
+
+# Coordinate transforms keyed by (source CRS, destination CRS), holding the transform context they were built with
+_transform_cache = {}
+
+# Predefined QColor names with their RGB values, see get_named_colours
+_named_colours = None
 
 def create_geopackage_file(path, iface, crs=None):
     """Create a new GeoPackage file with the given path and CRS
@@ -79,6 +91,42 @@ def setup_layer_attr(layer):
     layer.CreateField(ogr.FieldDefn("Date_", ogr.OFTString))
     layer.CreateField(ogr.FieldDefn("Time_", ogr.OFTString))
 
+def get_named_colours():
+    """Get the predefined QColor names with their RGB values, built once per session
+
+    :return: Tuple of the colour names and their RGB values, as a NumPy array if NumPy is available.
+    """
+    global _named_colours
+    if _named_colours is None:
+        names = QColor.colorNames()
+        rgb = [QColor(name).getRgb()[:3] for name in names]
+        _named_colours = (names, np.array(rgb, dtype=np.int32).reshape(-1, 3) if np is not None else rgb)
+    return _named_colours
+
+@lru_cache(maxsize=4096)
+def find_closest_color_name(red, green, blue):
+    """Find the closest predefined QColor name to an RGB value, memoized per RGB value
+
+    :param red: Red component of the color.
+
+    :param green: Green component of the color.
+
+    :param blue: Blue component of the color.
+
+    :return: Closest color name as a string, None if there are no predefined colors.
+    """
+    names, rgb = get_named_colours()
+    if not names:
+        return None
+
+    # the squared Euclidean distance in RGB space picks the same color as the distance itself
+    if np is not None:
+        distances = ((rgb - np.array([red, green, blue], dtype=np.int32)) ** 2).sum(axis=1)
+        return names[int(distances.argmin())]
+
+    return names[min(range(len(names)),
+                     key=lambda i: (rgb[i][0] - red) ** 2 + (rgb[i][1] - green) ** 2 + (rgb[i][2] - blue) ** 2)]
+
 def get_closest_color_name(color):
     """Find the closest color name from the predefined QColor name
 
@@ -87,20 +135,7 @@ def get_closest_color_name(color):
 
     :return: Closest color name as a string. If no match is found, return the hex value of the color.
     """
-    min_distance = float('inf')
-    closest_color_name = None
-    for name in QColor.colorNames():
-        named_color = QColor(name)
-        distance = (
-                           (color.red() - named_color.red()) ** 2 +
-                           (color.green() - named_color.green()) ** 2 +
-                           (color.blue() - named_color.blue()) ** 2
-                   ) ** 0.5  # Euclidean distance in RGB space
-
-        if distance < min_distance:
-            min_distance = distance
-            closest_color_name = name
-
+    closest_color_name = find_closest_color_name(color.red(), color.green(), color.blue())
     return closest_color_name if closest_color_name else color.name()  # Return hex if no match
 
 def split_array_to_chunks(items_list, chunk_size=2):
@@ -117,11 +152,13 @@ def split_array_to_chunks(items_list, chunk_size=2):
     return [items_list[i:i + chunk_size] for i in range(0, len(items_list), chunk_size)]
 
 
+@lru_cache(maxsize=256)
 def adjust_color(hex_color, percent=30):
     """Adjusts a HEX color's brightness by a given percentage.
 
     Positive `percent` lightens the color.
     Negative `percent` darkens the color.
+    Results are cached per color and percentage.
 
     :param hex_color: Hex color string to adjust.
     :type hex_color: str
@@ -167,17 +204,7 @@ def update_feature_attributes(feature, layer_type, attributes):
 
     :return: Updated feature with updated attributes.
     """
-    geom = feature.geometry()
-    lat = 0
-    lon = 0
-    if layer_type == 'points':
-        point = geom.asPoint()
-        lat, lon = point.y(), point.x()
-    else:
-        centroid = geom.centroid()
-        if centroid is not None:
-            centroid_as_point = centroid.asPoint()
-            lat, lon = centroid_as_point.y(), centroid_as_point.x()
+    lat, lon = get_feature_location(feature.geometry(), layer_type)
     colour_attr = attributes['colour'] if layer_type == 'polygons' else ''
     feature.setAttribute('colour', colour_attr)
     feature.setAttribute('shape', layer_type)
@@ -191,6 +218,27 @@ def update_feature_attributes(feature, layer_type, attributes):
 
     return feature
 
+def get_feature_location(geom, layer_type):
+    """Get the location saved in the LAT and LON attributes of a feature
+
+    :param geom: Geometry of the feature.
+
+    :param layer_type: Type of layer the feature belongs to.
+
+    :return: Tuple of latitude and longitude, the point itself for points, the centroid otherwise.
+    """
+    lat = 0
+    lon = 0
+    if layer_type == 'points':
+        point = geom.asPoint()
+        lat, lon = point.y(), point.x()
+    else:
+        centroid = geom.centroid()
+        if centroid is not None:
+            centroid_as_point = centroid.asPoint()
+            lat, lon = centroid_as_point.y(), centroid_as_point.x()
+    return lat, lon
+
 def show_delete_confirmation(text):
     """Show a confirmation dialog for deleting a Keypad category or element
 
@@ -198,9 +246,40 @@ def show_delete_confirmation(text):
 
     :return: Result of the confirmation dialog. True if the user confirms the deletion, False otherwise.
     """
+    from delete_confirmation import DeleteConfirmationDialog
+
     delete_confirmation =  DeleteConfirmationDialog(text)
     return delete_confirmation.exec_()
 
+def get_coordinate_transform(source_crs, destination_crs, transform_context=None):
+    """Get a coordinate transform between two CRSs.
+    Transforms are cached per source and destination CRS and reused while the transform context is unchanged,
+    so the transform setup is only paid once.
+
+    :param source_crs: CRS to transform from.
+
+    :param destination_crs: CRS to transform to.
+
+    :param transform_context: Transform context to use. Defaults to the project transform context.
+
+    :return: Coordinate transform.
+    """
+    if transform_context is None:
+        transform_context = QgsProject.instance().transformContext()
+
+    key = (source_crs.authid() or source_crs.toWkt(), destination_crs.authid() or destination_crs.toWkt())
+    cached = _transform_cache.get(key)
+    if cached is not None and cached[0] == transform_context:
+        return cached[1]
+
+    transform = QgsCoordinateTransform(source_crs, destination_crs, transform_context)
+    _transform_cache[key] = (transform_context, transform)
+    return transform
+
+def clear_transform_cache(*args):
+    """Clear the cached coordinate transforms. Called when the project CRS or transform context changes."""
+    _transform_cache.clear()
+
 def reproject_to_destination_crs(geometry, source_crs, destination_crs):
     """Reproject a geometry to a destination CRS
 
@@ -212,12 +291,67 @@ def reproject_to_destination_crs(geometry, source_crs, destination_crs):
 
     :return: Reprojected geometry if no errors occurred, None otherwise.
     """
-    transform = QgsCoordinateTransform(source_crs, destination_crs, QgsProject.instance())
-    try:
-        geometry.transform(transform)
-    except Exception as e:
-        QgsApplication.messageLog().logMessage(f'Geometry transform failed: {e}', 'DigitalSketchPlugin')
-        return None
+    return reproject_geometries([geometry], source_crs, destination_crs)[0]
+
+def reproject_geometries(geometries, source_crs, destination_crs):
+    """Reproject a batch of geometries to a destination CRS using one transform
+
+    :param geometries: Geometries to reproject.
+
+    :param source_crs: CRS of the geometries.
+
+    :param destination_crs: Destination CRS to reproject the geometries to.
+
+    :return: List of reprojected geometries, None for a geometry that failed to transform.
+    """
+    transform = get_coordinate_transform(source_crs, destination_crs)
+    reprojected = []
+    for geometry in geometries:
+        try:
+            geometry.transform(transform)
+        except Exception as e:
+            QgsApplication.messageLog().logMessage(f'Geometry transform failed: {e}', 'DigitalSketchPlugin')
+            geometry = None
+        reprojected.append(geometry)
+
+    return reprojected
+
+def metres_to_map_units(distance, crs):
+    """Convert a distance in metres to the map units of a CRS
+
+    :param distance: Distance in metres.
+
+    :param crs: CRS to convert the distance to, degrees are approximated at the equator.
+
+    :return: Distance in the map units of the CRS.
+    """
+    return distance * QgsUnitTypes.fromUnitToUnitFactor(QgsUnitTypes.DistanceMeters, crs.mapUnits())
+
+def optimize_geometry(geometry, crs, simplify_tolerance, grid_precision):
+    """Simplify a sketched geometry and snap its coordinates to a grid before it is saved.
+    The simplification is topology preserving, so polygons do not self intersect or collapse.
+    If a step fails or collapses the geometry, the geometry of the previous step is kept.
+
+    :param geometry: Geometry to optimize, in the layer CRS.
+
+    :param crs: CRS of the layer.
+
+    :param simplify_tolerance: Simplification tolerance in metres, 0 disables the simplification.
+
+    :param grid_precision: Size of the coordinate grid in metres, 0 keeps full precision.
+
+    :return: Optimized geometry.
+    """
+    if simplify_tolerance > 0:
+        simplified = geometry.simplify(metres_to_map_units(simplify_tolerance, crs))
+        if not simplified.isEmpty():
+            geometry = simplified
+
+    if grid_precision > 0:
+        grid_size = metres_to_map_units(grid_precision, crs)
+        snapped = geometry.snappedToGrid(grid_size, grid_size)
+        if not snapped.isEmpty():
+            geometry = snapped
 
     return geometry
 
@@ -329,4 +463,69 @@ def get_default_auto_update_interval():
     return: Default auto-update interval in seconds.
     """
 
-    return 10
\ No newline at end of file
+    return 10
+
+def get_default_stream_tolerance():
+    """Get the default tolerance used to drop redundant vertices while streaming
+
+    return: Default stream tolerance in screen pixels.
+    """
+
+    return 2
+
+def get_default_frame_rate():
+    """Get the default maximum number of rubber band updates per second while sketching
+
+    return: Default frame rate in updates per second.
+    """
+
+    return 60
+
+def get_default_simplify_tolerance():
+    """Get the default tolerance used to simplify sketched lines and polygons when they are saved.
+    Simplification changes the sketched shapes, so it is off unless it is set in the settings.
+
+    return: Default simplification tolerance in metres.
+    """
+
+    return 0
+
+def get_default_grid_precision():
+    """Get the default size of the grid the saved coordinates are snapped to
+
+    return: Default grid size in metres.
+    """
+
+    return 0.01
+
+def get_renderer_modes():
+    """Get the renderer modes of the polygon layer, in the order they are listed in the settings
+
+    return: List of renderer modes.
+    """
+
+    return ['categorized', 'data_defined']
+
+def get_default_renderer_mode():
+    """Get the default renderer mode of the polygon layer
+
+    return: Default renderer mode, a categorized renderer with one category per colour.
+    """
+
+    return 'categorized'
+
+def get_keypad_modes():
+    """Get the keypad modes, in the order they are listed in the settings
+
+    return: List of keypad modes.
+    """
+
+    return ['buttons', 'painted']
+
+def get_default_keypad_mode():
+    """Get the default keypad mode
+
+    return: Default keypad mode, a push button per keypad item.
+    """
+
+    return 'buttons'
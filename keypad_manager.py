@@ -1,10 +1,11 @@
-import copy
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
 
 from data.db_handler import DbHandler
 
 class Keypad:
-    def __init__(self, cat_id: int, category: str, selected: bool, colour: str, items: list):
+    __slots__ = ('cat_id', 'category', 'selected', 'colour', 'items', 'sort_order')
+
+    def __init__(self, cat_id: int, category: str, selected: bool, colour: str, items: list, sort_order: float = 0):
         """Initializes a new Keypad Category object.
 
         :param cat_id: The category ID.
@@ -21,12 +22,16 @@ class Keypad:
 
         :param items: A list of items in the category.
         :type items: list[dict]
+
+        :param sort_order: The position of the category in the keypad.
+        :type sort_order: float
         """
         self.cat_id = cat_id
         self.category = category
         self.selected = selected
         self.colour = colour
         self.items = [KeypadItem(**data) for data in items]
+        self.sort_order = sort_order
 
     def __repr__(self):
         """Returns a string representation of the Keypad Category object.
@@ -36,7 +41,9 @@ class Keypad:
         return f"Category(cat_id={self.cat_id}, category='{self.category}', selected={self.selected}, colour='{self.colour}', items={self.items})"
 
 class KeypadItem:
-    def __init__(self, item_id, item):
+    __slots__ = ('item_id', 'item', 'sort_order')
+
+    def __init__(self, item_id, item, sort_order=0):
         """Initializes a new Keypad Item object.
 
         :param item_id: The item ID.
@@ -44,9 +51,13 @@ class KeypadItem:
 
         :param item: The item name.
         :type item: str
+
+        :param sort_order: The position of the item in its category.
+        :type sort_order: float
         """
         self.item_id = item_id
         self.item = item
+        self.sort_order = sort_order
 
     def __repr__(self):
         """Returns a string representation of the Keypad Item object.
@@ -55,25 +66,143 @@ class KeypadItem:
         """
         return f"Item(item_id={self.item_id}, item='{self.item}')"
 
-class KeypadManager:
+class KeypadChanges:
+    def __init__(self):
+        """Initializes the changes made to the keypad since it was loaded or saved.
+        Categories and items without an ID are new and are inserted, the others are updated.
+        """
+        self.categories = set()
+        self.items = {}
+        self.deleted_categories = set()
+        self.deleted_items = set()
+
+    def is_empty(self):
+        """Checks if there are no changes to save.
+
+        :return: True if nothing changed, False otherwise.
+        """
+        return not (self.categories or self.items or self.deleted_categories or self.deleted_items)
+
+    def category_changed(self, category):
+        """Records a new or updated category.
+
+        :param category: The category object.
+        :type category: Keypad
+        """
+        self.categories.add(category)
+
+    def item_changed(self, category, item):
+        """Records a new or updated item.
+
+        :param category: The category of the item.
+        :type category: Keypad
+
+        :param item: The item object.
+        :type item: KeypadItem
+        """
+        self.items[item] = category
+
+    def category_removed(self, category):
+        """Records a removed category, which also removes its items.
+
+        :param category: The category object.
+        :type category: Keypad
+        """
+        self.categories.discard(category)
+        for item in category.items:
+            self.items.pop(item, None)
+        if category.cat_id:
+            self.deleted_categories.add(category.cat_id)
+
+    def item_removed(self, item):
+        """Records a removed item.
+
+        :param item: The item object.
+        :type item: KeypadItem
+        """
+        self.items.pop(item, None)
+        if item.item_id:
+            self.deleted_items.add(item.item_id)
+
+class KeypadManager(QObject):
+    # emitted whenever the keypad data changes, clears the checked items cache
+    keypadChanged = pyqtSignal()
+
     def __init__(self):
         """Initializes a new KeypadManager object.
         Create a DbHandler object to handle database operations.
+        The changes to the keypad data are recorded as they are made, such that only those are written.
+
+        The keypad data held in memory is authoritative, the checked items are computed from it and cached
+        until the data changes. The data is only read again when another connection, e.g. another QGIS
+        process, changed the database, which SQLite reports through PRAGMA data_version. That is checked by
+        reload_if_changed when the settings dialog is opened or the plugin is shown, never when the keypad is
+        populated.
         """
+        super().__init__()
         self.data = []
+        self.loaded = False
+        self.data_version = None
+        self.checked_items = None
+        self.changes = KeypadChanges()
         self.db_handler = DbHandler()
+        self.keypadChanged.connect(self.invalidate)
 
 
     def load_data(self):
-        """Loads the keypad data from the database."""
+        """Loads the keypad data from the database, dropping the unsaved changes."""
         self.data = [Keypad(**data) for data in self.db_handler.load_keypad_data()]
+        self.changes = KeypadChanges()
+        self.data_version = self.db_handler.data_version()
+        self.loaded = True
+        self.keypadChanged.emit()
+
+
+    def discard_changes(self):
+        """Drops the unsaved changes, e.g. when the settings dialog is closed without applying them."""
+        if not self.changes.is_empty():
+            self.load_data()
+
+
+    def ensure_loaded(self):
+        """Loads the keypad data on first use, without checking the database for changes afterwards."""
+        if not self.loaded:
+            self.load_data()
+
+
+    def reload_if_changed(self):
+        """Loads the keypad data if it was not loaded yet, or if another connection changed the database.
+        This queries the database, so it is only called at defined points rather than on every keypad update.
+
+        :return: True if the data was loaded, False if the data in memory is current.
+        """
+        if self.loaded and self.db_handler.data_version() == self.data_version:
+            return False
+        self.load_data()
+        return True
+
+
+    def invalidate(self):
+        """Clears the checked items cache."""
+        self.checked_items = None
 
 
     def update_dataset(self):
         """Updates the keypad data in the database.
-        Once the apply setting is called, the data is updated in the database.
+        Once the apply setting is called, the recorded changes are written to the database.
+        Nothing is written if nothing changed.
         """
-        self.db_handler.reset_and_update(self.data)
+        if self.changes.is_empty():
+            return
+
+        self.db_handler.apply_changes(self.changes)
+        self.changes = KeypadChanges()
+        self.data_version = self.db_handler.data_version()
+
+
+    def close(self):
+        """Closes the database connections, called when the plugin is unloaded."""
+        self.db_handler.close()
 
 
     def get_selected_categories(self):
@@ -89,8 +218,14 @@ class KeypadManager:
 
         :param data: The category data to add.
         """
-        if any(cat.category != data.category for cat in self.data):
+        if self.get_category_by_name(data.category) is None:
+            data.sort_order = next_sort_order(self.data)
             self.data.append(data)
+            self.changes.category_changed(data)
+            for sort_order, item in enumerate(data.items):
+                item.sort_order = sort_order
+                self.changes.item_changed(data, item)
+            self.keypadChanged.emit()
 
 
     def add_item(self, category_name, data):
@@ -101,11 +236,14 @@ class KeypadManager:
         :type category_name: str
 
         :param data: The item data to add.
-        :type data: dict
+        :type data: KeypadItem
         """
         category = self.get_category_by_name(category_name)
         if category:
+            data.sort_order = next_sort_order(category.items)
             category.items.append(data)
+            self.changes.item_changed(category, data)
+            self.keypadChanged.emit()
 
 
     def move_category(self, category_name, direction):
@@ -122,9 +260,14 @@ class KeypadManager:
             print(f"Category '{category_name}' not found.")
             return
         if direction == "up" and index > 0:
-            self.data[index], self.data[index - 1] = self.data[index - 1], self.data[index]
+            other = index - 1
         elif direction == "down" and index < len(self.data) - 1:
-            self.data[index], self.data[index + 1] = self.data[index + 1], self.data[index]
+            other = index + 1
+        else:
+            return
+        for category in move(self.data, index, other):
+            self.changes.category_changed(category)
+        self.keypadChanged.emit()
 
 
     def move_item(self, category_name, item, direction):
@@ -144,14 +287,19 @@ class KeypadManager:
             print(f"Category '{category_name}' not found.")
             return
         items = category.items
-        index = items.index(item) if item in items else None
+        index = next((i for i, element in enumerate(items) if element.item == item), None)
         if index is None:
             print(f"Item '{item}' not found in '{category_name}'.")
             return
         if direction == "up" and index > 0:
-            items[index], items[index - 1] = items[index - 1], items[index]
+            other = index - 1
         elif direction == "down" and index < len(items) - 1:
-            items[index], items[index + 1] = items[index + 1], items[index]
+            other = index + 1
+        else:
+            return
+        for item in move(items, index, other):
+            self.changes.item_changed(category, item)
+        self.keypadChanged.emit()
 
 
     def remove_category(self, category_name):
@@ -160,7 +308,11 @@ class KeypadManager:
         :param category_name: The name of the category to remove.
         :type category_name: str
         """
-        self.data = [cat for cat in self.data if cat.category != category_name]
+        category = self.get_category_by_name(category_name)
+        if category:
+            self.changes.category_removed(category)
+            self.data = [cat for cat in self.data if cat is not category]
+            self.keypadChanged.emit()
 
 
     def remove_item(self, category_name, item):
@@ -175,7 +327,10 @@ class KeypadManager:
         """
         category = self.get_category_by_name(category_name)
         if category:
+            for removed in (i for i in category.items if i.item == item):
+                self.changes.item_removed(removed)
             category.items = [i for i in category.items if i.item != item]
+            self.keypadChanged.emit()
 
 
     def set_category_selection(self, category_name, state):
@@ -191,7 +346,10 @@ class KeypadManager:
         category = self.get_category_by_name(category_name)
         if category:
             selection = state == Qt.Checked
-            category.selected = selection
+            if category.selected != selection:
+                category.selected = selection
+                self.changes.category_changed(category)
+                self.keypadChanged.emit()
 
 
     def set_category_colour(self, category_name, colour):
@@ -205,8 +363,10 @@ class KeypadManager:
         :type colour: str
         """
         category = self.get_category_by_name(category_name)
-        if category:
+        if category and category.colour != colour:
             category.colour = colour
+            self.changes.category_changed(category)
+            self.keypadChanged.emit()
 
     def update_item(self, category_name, old_name, new_name):
         """update an item name from a category.
@@ -222,8 +382,18 @@ class KeypadManager:
         :type new_name: KeypadItem
         """
         category = self.get_category_by_name(category_name)
-        if category:
-            category.items = [new_name.item if i == old_name else i for i in category.items]
+        if category is None:
+            return
+
+        for index, item in enumerate(category.items):
+            if item.item == old_name:
+                # the updated item replaces the old one in the same row of the database
+                new_name.item_id = item.item_id
+                new_name.sort_order = item.sort_order
+                self.changes.items.pop(item, None)
+                category.items[index] = new_name
+                self.changes.item_changed(category, new_name)
+                self.keypadChanged.emit()
 
     def get_category_by_name(self, category_name):
         """Get a category by name.
@@ -240,8 +410,63 @@ class KeypadManager:
             self.set_category_selection(cat.category, 0)
 
     def get_checked_category_items(self):
-        """Get the checked category items.
+        """Get the checked category items from memory.
+        The keypad data is loaded on first use, the database is not accessed afterwards.
 
         :return: List of checked category items.
         """
-        return self.db_handler.get_checked_category_items()
+        self.ensure_loaded()
+        if self.checked_items is None:
+            self.checked_items = [{"item": item.item, "selected": category.selected, "colour": category.colour}
+                                  for category in self.data if category.selected
+                                  for item in category.items]
+        return self.checked_items
+
+
+def next_sort_order(rows):
+    """Get the sort order after the last category or item.
+
+    :param rows: Categories or items
+    :type rows: list
+
+    :return: Sort order
+    """
+    return max((row.sort_order for row in rows), default=-1) + 1
+
+
+def move(rows, index, other):
+    """Move a category or item to another position.
+    The moved row gets a sort order between its new neighbours, such that it is the only row to update.
+    If there is no room left between the neighbours, the rows are numbered again.
+
+    :param rows: Categories or items
+    :type rows: list
+
+    :param index: Index of the row to move
+    :type index: int
+
+    :param other: Index to move the row to
+    :type other: int
+
+    :return: The rows whose sort order changed
+    """
+    moved = rows.pop(index)
+    rows.insert(other, moved)
+    before = rows[other - 1].sort_order if other > 0 else None
+    after = rows[other + 1].sort_order if other + 1 < len(rows) else None
+
+    if before is None and after is None:
+        return []
+    if before is None:
+        sort_order = after - 1
+    elif after is None:
+        sort_order = before + 1
+    else:
+        sort_order = (before + after) / 2
+        if not before < sort_order < after:
+            for position, row in enumerate(rows):
+                row.sort_order = float(position)
+            return list(rows)
+
+    moved.sort_order = sort_order
+    return [moved]
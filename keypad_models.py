@@ -0,0 +1,411 @@
+from qgis.PyQt.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, pyqtSignal
+from qgis.PyQt.QtGui import QColor
+from qgis.PyQt.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+from qgis.gui import QgsColorDialog
+
+# Role holding the colour of a keypad category
+ColourRole = Qt.UserRole + 1
+
+
+class CategoryListModel(QAbstractListModel):
+    """List model of the keypad categories of a KeypadManager, with the selection state as check state."""
+
+    def __init__(self, keypad_manager, parent=None):
+        """Constructor.
+
+        :param keypad_manager: Keypad categories and items
+        :type keypad_manager: KeypadManager
+
+        :param parent: Parent object
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.keypad_manager = keypad_manager
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keypad_manager.data)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        pad = self.keypad_manager.data[index.row()]
+        if role == Qt.DisplayRole:
+            return pad.category
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if pad.selected else Qt.Unchecked
+        if role == ColourRole:
+            return QColor(pad.colour)
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+
+        pad = self.keypad_manager.data[index.row()]
+        if role == Qt.CheckStateRole:
+            self.keypad_manager.set_category_selection(pad.category, value)
+        elif role == ColourRole:
+            self.keypad_manager.set_category_colour(pad.category, QColor(value).name())
+        else:
+            return False
+
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def category_at(self, row):
+        """Get the category of a row.
+
+        :param row: Row of the category
+        :type row: int
+
+        :return: Keypad category, None if the row is out of range
+        """
+        return self.keypad_manager.data[row] if 0 <= row < len(self.keypad_manager.data) else None
+
+    def reset(self):
+        """Reload the view from the keypad manager data."""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def add_category(self, data):
+        """Add a category at the end of the list, if there is no category with the same name.
+
+        :param data: Keypad category
+        :type data: Keypad
+        """
+        if self.keypad_manager.get_category_by_name(data.category) is not None:
+            return
+
+        row = len(self.keypad_manager.data)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.keypad_manager.add_category(data)
+        self.endInsertRows()
+
+    def remove_category(self, row):
+        """Remove the category of a row.
+
+        :param row: Row of the category
+        :type row: int
+        """
+        pad = self.category_at(row)
+        if pad is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.keypad_manager.remove_category(pad.category)
+        self.endRemoveRows()
+
+    def move_category(self, row, direction):
+        """Move the category of a row up or down by one row.
+
+        :param row: Row of the category
+        :type row: int
+
+        :param direction: Direction to move the category, either "up" or "down"
+        :type direction: str
+
+        :return: New row of the category
+        """
+        target = move_target(row, direction, len(self.keypad_manager.data))
+        if target == row:
+            return row
+
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), target + 1 if target > row else target)
+        self.keypad_manager.move_category(self.keypad_manager.data[row].category, direction)
+        self.endMoveRows()
+        return target
+
+
+class ElementListModel(QAbstractListModel):
+    """List model of the keypad items of one keypad category."""
+
+    def __init__(self, keypad_manager, parent=None):
+        """Constructor.
+
+        :param keypad_manager: Keypad categories and items
+        :type keypad_manager: KeypadManager
+
+        :param parent: Parent object
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.keypad_manager = keypad_manager
+        self.category = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self.category is None else len(self.category.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or self.category is None:
+            return None
+
+        if role == Qt.DisplayRole:
+            return self.category.items[index.row()].item
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def set_category(self, category_name):
+        """Show the items of a category.
+
+        :param category_name: Name of the category, None to show no items
+        :type category_name: str
+        """
+        self.beginResetModel()
+        self.category = self.keypad_manager.get_category_by_name(category_name) if category_name else None
+        self.endResetModel()
+
+    def item_at(self, row):
+        """Get the item of a row.
+
+        :param row: Row of the item
+        :type row: int
+
+        :return: Keypad item, None if the row is out of range
+        """
+        if self.category is None or not 0 <= row < len(self.category.items):
+            return None
+        return self.category.items[row]
+
+    def add_element(self, data):
+        """Add an item at the end of the category.
+
+        :param data: Keypad item
+        :type data: KeypadItem
+        """
+        if self.category is None:
+            return
+
+        row = len(self.category.items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.keypad_manager.add_item(self.category.category, data)
+        self.endInsertRows()
+
+    def update_element(self, row, data):
+        """Replace the item of a row.
+
+        :param row: Row of the item
+        :type row: int
+
+        :param data: Updated keypad item
+        :type data: KeypadItem
+        """
+        element = self.item_at(row)
+        if element is None:
+            return
+
+        self.keypad_manager.update_item(self.category.category, element.item, data)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def remove_element(self, row):
+        """Remove the item of a row.
+
+        :param row: Row of the item
+        :type row: int
+        """
+        element = self.item_at(row)
+        if element is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.keypad_manager.remove_item(self.category.category, element.item)
+        # the manager replaces the item list when removing
+        self.category = self.keypad_manager.get_category_by_name(self.category.category)
+        self.endRemoveRows()
+
+    def move_element(self, row, direction):
+        """Move the item of a row up or down by one row.
+
+        :param row: Row of the item
+        :type row: int
+
+        :param direction: Direction to move the item, either "up" or "down"
+        :type direction: str
+
+        :return: New row of the item
+        """
+        if self.category is None:
+            return row
+
+        target = move_target(row, direction, len(self.category.items))
+        if target == row:
+            return row
+
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), target + 1 if target > row else target)
+        self.keypad_manager.move_item(self.category.category, self.category.items[row].item, direction)
+        self.endMoveRows()
+        return target
+
+
+def move_target(row, direction, count):
+    """Get the row a row moves to.
+
+    :param row: Row to move
+    :type row: int
+
+    :param direction: Direction to move the row, either "up" or "down"
+    :type direction: str
+
+    :param count: Number of rows
+    :type count: int
+
+    :return: Target row, the same row if the row cannot move in the direction
+    """
+    if not 0 <= row < count:
+        return row
+    if direction == "up" and row > 0:
+        return row - 1
+    if direction == "down" and row < count - 1:
+        return row + 1
+    return row
+
+
+def paint_row_button(painter, rect, text, background):
+    """Paint a button inside a list row.
+
+    :param painter: Painter of the row
+    :type painter: QPainter
+
+    :param rect: Button rectangle
+    :type rect: QRect
+
+    :param text: Button text
+    :type text: str
+
+    :param background: Button colour
+    :type background: QColor
+    """
+    painter.save()
+    painter.setRenderHint(painter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(background)
+    painter.drawRoundedRect(rect, 5, 5)
+    painter.setPen(Qt.white)
+    painter.drawText(rect, Qt.AlignCenter, text)
+    painter.restore()
+
+
+class KeypadRowDelegate(QStyledItemDelegate):
+    """Base delegate painting action buttons at the right of each list row and reporting clicks on them.
+    The buttons are painted, no widgets are created for the rows.
+    """
+
+    row_height = 34
+    button_spacing = 5
+
+    # (name, text, width, colour) of the buttons, from left to right
+    buttons = []
+
+    buttonClicked = pyqtSignal(str, QModelIndex)
+
+    def button_rects(self, rect):
+        """Get the rectangles of the row buttons.
+
+        :param rect: Row rectangle
+        :type rect: QRect
+
+        :return: Dictionary of the button name to its rectangle
+        """
+        rects = {}
+        right = rect.right() - 2
+        for name, _, width, _ in reversed(self.buttons):
+            rects[name] = QRect(right - width + 1, rect.top() + 2, width, rect.height() - 4)
+            right -= width + self.button_spacing
+        return rects
+
+    def buttons_width(self):
+        """Get the width taken by the row buttons.
+
+        :return: Width in pixels
+        """
+        return sum(width + self.button_spacing for _, _, width, _ in self.buttons) + 2
+
+    def paint(self, painter, option, index):
+        """Paint the row with the item text and check box, then the buttons."""
+        text_option = QStyleOptionViewItem(option)
+        text_option.rect.adjust(0, 0, -self.buttons_width(), 0)
+        super().paint(painter, text_option, index)
+
+        rects = self.button_rects(option.rect)
+        for name, text, _, colour in self.buttons:
+            self.paint_button(painter, rects[name], name, text, colour, index)
+
+    def paint_button(self, painter, rect, name, text, colour, index):
+        """Paint one row button.
+
+        :param painter: Painter of the row
+        :type painter: QPainter
+
+        :param rect: Button rectangle
+        :type rect: QRect
+
+        :param name: Button name
+        :type name: str
+
+        :param text: Button text
+        :type text: str
+
+        :param colour: Button colour
+        :type colour: QColor
+
+        :param index: Index of the row
+        :type index: QModelIndex
+        """
+        paint_row_button(painter, rect, text, colour)
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        return QSize(size.width() + self.buttons_width(), max(size.height(), self.row_height))
+
+    def editorEvent(self, event, model, option, index):
+        """Report a click on a row button, other events are handled by the base delegate, e.g. the check box."""
+        if event.type() == event.MouseButtonRelease and event.button() == Qt.LeftButton:
+            for name, rect in self.button_rects(option.rect).items():
+                if rect.contains(event.pos()):
+                    self.buttonClicked.emit(name, QModelIndex(index))
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
+class CategoryDelegate(KeypadRowDelegate):
+    """Delegate of the keypad category list, painting the category colour and the delete button.
+    Clicking the colour opens a colour dialog for that row only.
+    """
+
+    buttons = [
+        ("colour", "", 50, None),
+        ("delete", "X", 30, QColor("red")),
+    ]
+
+    def paint_button(self, painter, rect, name, text, colour, index):
+        if name == "colour":
+            colour = index.data(ColourRole)
+        super().paint_button(painter, rect, name, text, colour, index)
+
+    def edit_colour(self, index, parent=None):
+        """Open a colour dialog for the category of a row and update the category colour.
+
+        :param index: Index of the row
+        :type index: QModelIndex
+
+        :param parent: Parent widget of the dialog
+        :type parent: QWidget, optional
+        """
+        colour = QgsColorDialog.getColor(index.data(ColourRole), parent)
+        if colour.isValid():
+            index.model().setData(index, colour, ColourRole)
+
+
+class ElementDelegate(KeypadRowDelegate):
+    """Delegate of the keypad element list, painting the edit and delete buttons."""
+
+    buttons = [
+        ("edit", "Edit", 40, QColor("blue")),
+        ("delete", "X", 30, QColor("red")),
+    ]
@@ -0,0 +1,211 @@
+from collections import defaultdict, deque
+
+from qgis.PyQt.QtCore import QMargins
+from qgis.PyQt.QtWidgets import QPushButton, QWidget, QHBoxLayout, QSpacerItem, QSizePolicy
+
+from helper import split_array_to_chunks, adjust_color
+
+
+class KeypadView:
+    """Keypad buttons of the dock widget, laid out in rows in the category attribute layout.
+    When the keypad is populated, the new item list is compared with the current buttons: buttons and rows
+    are reused, and only the buttons of new items are created and the buttons of removed items deleted.
+
+    The button colours come from one stylesheet set on the keypad container, with a rule per distinct
+    category colour that matches the keypad_colour property of the buttons.
+    """
+
+    def __init__(self, attr_box, on_click):
+        """Constructor.
+
+        :param attr_box: Layout holding the keypad rows
+        :type attr_box: QVBoxLayout
+
+        :param on_click: Called with the item name and the button when a keypad button is clicked
+        :type on_click: callable
+        """
+        self.attr_box = attr_box
+        self.on_click = on_click
+        self.rows = []
+        self.row_buttons = []
+        self.style = None
+        self.stylesheet_key = None
+        self.has_stretch = False
+
+    def populate(self, items, height, width, font, font_colour):
+        """Show the keypad items, reusing the existing buttons.
+
+        :param items: Keypad items, dictionaries with the item name and the category colour
+        :type items: list of dict
+
+        :param height: Button height
+        :type height: int
+
+        :param width: Button width
+        :type width: int
+
+        :param font: Button font
+        :type font: QFont
+
+        :param font_colour: Button font colour
+        :type font_colour: str
+        """
+        parent = self.attr_box.parentWidget()
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+
+        style = (height, width, font.toString())
+        restyle = style != self.style
+        self.style = style
+        self.update_stylesheet(items, font_colour)
+
+        # pool the current buttons by item, such that a reused button keeps its name and colour
+        pool = defaultdict(deque)
+        for buttons in self.row_buttons:
+            for btn in buttons:
+                pool[(btn.text(), btn.property("keypad_colour"))].append(btn)
+
+        chunks = split_array_to_chunks(items) if len(items) > 2 else [items]
+        self.set_row_count(len(chunks))
+
+        for index, chunk in enumerate(chunks):
+            widget, layout = self.rows[index]
+            widget.setMinimumHeight(height + 1)
+            widget.setMaximumHeight(height + 1)
+
+            buttons = []
+            for i in chunk:
+                reusable = pool.get((i["item"], i["colour"]))
+                if reusable:
+                    btn = reusable.popleft()
+                    btn.setChecked(False)
+                    if restyle:
+                        self.style_button(btn, height, width, font)
+                else:
+                    btn = self.create_button(i, height, width, font)
+                buttons.append(btn)
+
+            if buttons != self.row_buttons[index]:
+                for btn in self.row_buttons[index]:
+                    layout.removeWidget(btn)
+                for position, btn in enumerate(buttons):
+                    layout.insertWidget(position, btn)
+                self.row_buttons[index] = buttons
+
+        # delete the buttons of the items that are no longer shown
+        for reusable in pool.values():
+            for btn in reusable:
+                btn.deleteLater()
+
+        if parent is not None:
+            parent.setUpdatesEnabled(True)
+
+    def set_row_count(self, count):
+        """Add or remove keypad rows until there are the given number of rows.
+        The buttons of removed rows are kept in the button pool until the rows are populated.
+
+        :param count: Number of rows
+        :type count: int
+        """
+        if not self.has_stretch:
+            self.attr_box.addStretch()
+            self.has_stretch = True
+
+        while len(self.rows) < count:
+            layout = QHBoxLayout()
+            layout.setContentsMargins(QMargins(1, 1, 1, 1))
+            layout.setSpacing(2)
+            layout.addItem(QSpacerItem(40, 30, QSizePolicy.Expanding, QSizePolicy.Minimum))
+            layout.insertStretch(-1, 100)
+            widget = QWidget()
+            widget.setLayout(layout)
+            self.attr_box.insertWidget(self.attr_box.count() - 1, widget)
+            self.rows.append((widget, layout))
+            self.row_buttons.append([])
+
+        while len(self.rows) > count:
+            widget, layout = self.rows.pop()
+            for btn in self.row_buttons.pop():
+                layout.removeWidget(btn)
+                btn.setParent(None)
+            self.attr_box.removeWidget(widget)
+            widget.deleteLater()
+
+    def update_stylesheet(self, items, font_colour):
+        """Set the keypad stylesheet on the container, if the category colours or the font colour changed.
+
+        :param items: Keypad items, dictionaries with the item name and the category colour
+        :type items: list of dict
+
+        :param font_colour: Button font colour
+        :type font_colour: str
+        """
+        colours = tuple(sorted({i["colour"] for i in items}))
+        if (colours, font_colour) == self.stylesheet_key:
+            return
+
+        container = self.attr_box.parentWidget()
+        if container is None:
+            return
+
+        self.stylesheet_key = (colours, font_colour)
+        rules = [f"""
+            QPushButton[keypad_colour] {{
+                color: {font_colour};
+                border-radius: 5px;
+                padding: 2px 2px;
+            }}
+            QPushButton[keypad_colour]:checked {{
+                border: 2px solid black
+            }}"""]
+        for colour in colours:
+            rules.append(f"""
+            QPushButton[keypad_colour="{colour}"] {{
+                background-color: {colour};
+            }}
+            QPushButton[keypad_colour="{colour}"]:hover {{
+                background-color: {adjust_color(colour, 30)};
+            }}""")
+        container.setStyleSheet("".join(rules))
+
+    def create_button(self, item, height, width, font):
+        """Create a keypad button for an item.
+        The category colour is set as the keypad_colour property, which the keypad stylesheet matches.
+
+        :param item: Keypad item, a dictionary with the item name and the category colour
+        :type item: dict
+
+        :return: QPushButton
+        """
+        btn = QPushButton(item["item"])
+        btn.setCheckable(True)
+        btn.setProperty("keypad_colour", item["colour"])
+        self.style_button(btn, height, width, font)
+        btn.clicked.connect(lambda checked, btn_name=item["item"], clicked_btn=btn: self.on_click(btn_name, clicked_btn))
+        return btn
+
+    def style_button(self, btn, height, width, font):
+        """Set the size and font of a keypad button.
+
+        :param btn: Keypad button
+        :type btn: QPushButton
+        """
+        btn.setMinimumHeight(height)
+        btn.setMaximumHeight(height)
+        btn.setMinimumWidth(width)
+        btn.setMaximumWidth(width)
+        btn.setFont(font)
+
+    def clear(self):
+        """Remove every keypad row and button."""
+        if not self.has_stretch:
+            return
+
+        for buttons in self.row_buttons:
+            for btn in buttons:
+                btn.deleteLater()
+        self.row_buttons = [[] for _ in self.rows]
+        self.set_row_count(0)
+        self.attr_box.takeAt(self.attr_box.count() - 1)
+        self.has_stretch = False
+        self.style = None
@@ -1,13 +1,16 @@
 from qgis.gui import QgsMapTool, QgsRubberBand
-from qgis.core import (QgsWkbTypes, QgsPointXY, QgsFeature, QgsGeometry, QgsMultiLineString, QgsLineString, QgsProject,
-                       QgsApplication)
+from qgis.core import QgsWkbTypes, QgsPointXY, QgsFeature, QgsGeometry, QgsMultiLineString, QgsProject, Qgis
 from PyQt5.QtCore import Qt
 
-from helper import update_feature_attributes, reproject_to_destination_crs
+from frame_throttle import ThrottledRubberBand
+from helper import (update_feature_attributes, reproject_to_destination_crs, get_default_stream_tolerance,
+                    get_default_frame_rate, get_default_simplify_tolerance, get_default_grid_precision, optimize_geometry)
+from stream_simplifier import StreamSimplifier
+from stroke_buffer import StrokeBuffer
 
 
 class MultiLineDigitizingTool(QgsMapTool):
-    def __init__(self, iface, layer):
+    def __init__(self, iface, layer, writer, get_attributes):
         """Constructor
 
         :param iface: QGIS interface
@@ -15,17 +18,69 @@ class MultiLineDigitizingTool(QgsMapTool):
 
         :param layer: QGIS multi line layer
         :type layer: QgsVectorLayer
+
+        :param writer: Background writer saving the finished features to the layer
+        :type writer: SketchWriter
+
+        :param get_attributes: Returns the attributes the feature would be saved with now, for the journal
+        :type get_attributes: callable
         """
         super().__init__(iface.mapCanvas())
         self.iface = iface
-        self.number_of_items_to_update = 1
         self.layer = layer
+        self.writer = writer
+        self.get_attributes = get_attributes
         self.stylus_down = False
-        self.current_line = []
-        self.multi_line_segments = []  # Stores all individual lines
-        self.rubber_band = QgsRubberBand(self.iface.mapCanvas(), QgsWkbTypes.LineGeometry) # QgsWkbTypes.LineGeometry
-        self.rubber_band.setColor(Qt.red)
-        self.rubber_band.setWidth(4)
+        self.stream_tolerance = get_default_stream_tolerance()
+        self.simplify_tolerance = get_default_simplify_tolerance()
+        self.grid_precision = get_default_grid_precision()
+        self.simplifier = StreamSimplifier()
+        self.throttle = ThrottledRubberBand(get_default_frame_rate())
+        self.current_line = StrokeBuffer()
+        self.multi_line = QgsMultiLineString()  # Finished segments, built once per segment
+        self.pending_strokes = []  # Journal IDs of the finished segments, None for a segment that was not journaled
+        # Finished segments are drawn by one rubber band that only grows on stylus up,
+        # the active stroke has its own rubber band so each move only appends a single vertex.
+        self.rubber_band = self.create_rubber_band()
+        self.stroke_rubber_band = self.create_rubber_band()
+
+    def create_rubber_band(self):
+        """Creates a line rubber band with the sketch style
+
+        :return: QgsRubberBand
+        """
+        rubber_band = QgsRubberBand(self.iface.mapCanvas(), QgsWkbTypes.LineGeometry)
+        rubber_band.setColor(Qt.red)
+        rubber_band.setWidth(4)
+        return rubber_band
+
+    def set_stream_tolerance(self, tolerance):
+        """Set the tolerance used to drop redundant vertices while streaming.
+
+        :param tolerance: Tolerance in screen pixels, 0 keeps every vertex.
+        :type tolerance: int
+        """
+        self.stream_tolerance = tolerance
+
+    def set_frame_rate(self, frame_rate):
+        """Set the maximum number of rubber band updates per second while streaming.
+
+        :param frame_rate: Rubber band updates per second
+        :type frame_rate: int
+        """
+        self.throttle.set_frame_rate(frame_rate)
+
+    def set_save_optimization(self, simplify_tolerance, grid_precision):
+        """Set the simplification and coordinate precision applied to the geometries when they are saved.
+
+        :param simplify_tolerance: Simplification tolerance in metres, 0 disables the simplification.
+        :type simplify_tolerance: float
+
+        :param grid_precision: Size of the coordinate grid in metres, 0 keeps full precision.
+        :type grid_precision: float
+        """
+        self.simplify_tolerance = simplify_tolerance
+        self.grid_precision = grid_precision
 
     def canvasPressEvent(self, event):
         """Start a new line segment on stylus down
@@ -35,18 +90,43 @@ class MultiLineDigitizingTool(QgsMapTool):
         """
         if event.button() == Qt.LeftButton:
             self.stylus_down = True
-            self.current_line = [self.toMapCoordinates(event.pos())]  # Start a new line
+            point = self.toMapCoordinates(event.pos())
+            self.current_line = StrokeBuffer(point.x(), point.y())  # Start a new line
+            self.simplifier.tolerance = self.stream_tolerance * self.canvas().mapUnitsPerPixel()
+            self.simplifier.start(point.x(), point.y())
+            self.stroke_rubber_band.reset(QgsWkbTypes.LineGeometry)
+            self.stroke_rubber_band.addPoint(point, True)
+            self.throttle.start(self.stroke_rubber_band)
 
     def canvasMoveEvent(self, event):
-        """Continue adding points to the current line
+        """Continue adding points to the current line.
+        Vertices within the stream tolerance are dropped, or replace the last vertex, as they arrive.
+        The rubber band is updated by the frame throttle rather than on every move.
 
         :param event: The mouse event object containing details about the movement interaction on the map canvas
         :type event: QgsMapMouseEvent
         """
-        if self.stylus_down:
-            point = self.toMapCoordinates(event.pos())
-            self.current_line.append(point)
-            self.update_rubber_band()
+        if not self.stylus_down:
+            return
+
+        point = self.toMapCoordinates(event.pos())
+        self.apply_stream_action(self.simplifier.push(point.x(), point.y()), point)
+
+    def apply_stream_action(self, action, point):
+        """Apply the simplifier decision for a streamed vertex to the current line and the rubber band.
+
+        :param action: Simplifier action, StreamSimplifier.APPEND, REPLACE or DROP
+        :type action: int
+
+        :param point: Streamed vertex in map coordinates
+        :type point: QgsPointXY
+        """
+        if action == StreamSimplifier.REPLACE:
+            self.current_line.replace_last(point.x(), point.y())
+            self.throttle.move_last_point(point)
+        elif action == StreamSimplifier.APPEND:
+            self.current_line.append(point.x(), point.y())
+            self.throttle.add_point(point)
 
     def canvasReleaseEvent(self, event):
         """Store the completed line segment on stylus up
@@ -56,33 +136,62 @@ class MultiLineDigitizingTool(QgsMapTool):
         """
         if event.button() == Qt.LeftButton:
             self.stylus_down = False
+            action, tail = self.simplifier.finish()
+            if action != StreamSimplifier.DROP:
+                self.apply_stream_action(action, QgsPointXY(*tail))
+            self.throttle.stop()
+
             if len(self.current_line) > 1:  # Ensure it's a valid line
-                self.multi_line_segments.append(self.current_line)  # Store as a new segment
-                self.update_rubber_band()
+                line = self.current_line.to_line_string()
+                self.add_segment(line)
+                self.pending_strokes.append(self.journal_stroke(line))
+            self.current_line = StrokeBuffer()
+            self.stroke_rubber_band.reset(QgsWkbTypes.LineGeometry)
+
+    def add_segment(self, line):
+        """Adds a finished segment to the pre-built multi line and appends it as a new part of the rubber band.
+        The existing parts are left untouched, so the cost does not grow with the number of segments.
+
+        :param line: The finished line segment
+        :type line: QgsLineString
+        """
+        self.multi_line.addGeometry(line.clone())
+        self.rubber_band.addGeometry(QgsGeometry(line))
 
-    def update_rubber_band(self):
-        """Converts the lines to multi lines Updates the rubber band to display all drawn lines"""
-        multi_line = self.get_multiline_string()
+    def journal_stroke(self, line):
+        """Record a finished segment in the sketch journal, with the attributes it would be saved with now,
+        such that it is recovered on the next start if QGIS closes before it is saved.
+        The segment is journaled in map coordinates, it is only reprojected and optimized if it is replayed.
+        A recovered segment is saved as a line of its own.
 
-        if self.current_line:
-            multi_line.addGeometry(QgsLineString(self.current_line))
+        :param line: The finished line segment, in map coordinates
+        :type line: QgsLineString
 
-        self.rubber_band.setToGeometry(QgsGeometry(multi_line), None)
+        :return: Journal ID of the segment, None if it could not be journaled
+        """
+        segment = QgsMultiLineString()
+        segment.addGeometry(line.clone())
+
+        feature = QgsFeature(self.layer.fields())
+        feature.setGeometry(QgsGeometry(segment))
+        return self.writer.journal_stroke(self.layer, update_feature_attributes(feature, '', self.get_attributes()),
+                                          QgsProject.instance().crs())
 
     def features_to_save(self):
         """Checks if there are any lines to save
 
         :return: True if there are lines to save, False otherwise
         """
-        return len(self.multi_line_segments) > 0
+        return self.multi_line.numGeometries() > 0
 
 
     def save_feature(self, attributes):
         """Saves the drawn MultiLineString to the layer.
         If the map CRS is different to the layer, then reproject the geometry.
-        If the layer is not editable, make the layer editable if there is a valid feature to save, then commit the changes.
+        The geometry is simplified and snapped to the coordinate grid of the layer CRS.
+        The feature is handed to the writer, which writes it to the GeoPackage in the background.
         """
-        if not self.multi_line_segments:
+        if not self.features_to_save():
             return
 
         canvas_crs = QgsProject.instance().crs()
@@ -92,36 +201,36 @@ class MultiLineDigitizingTool(QgsMapTool):
 
         if canvas_crs != layer_crs:
             multi_line = reproject_to_destination_crs(multi_line, canvas_crs, layer_crs)
+            if multi_line is None:
+                # keep the segments, such that the sketch is not lost and can be saved again
+                self.iface.messageBar().pushMessage("Warning", "Geometry is None.", level=Qgis.Warning, duration=5)
+                return
 
         feature = QgsFeature(self.layer.fields())
-        feature.setGeometry(QgsGeometry(multi_line))
-
-        if not self.layer.isEditable():
-            self.layer.startEditing()
+        feature.setGeometry(optimize_geometry(QgsGeometry(multi_line), layer_crs, self.simplify_tolerance,
+                                              self.grid_precision))
 
-        if self.layer.addFeature(update_feature_attributes(feature, '', attributes)):
-            self.layer.commitChanges()
-
-        else:
-            self.layer.rollBack()
+        self.writer.add_features(self.layer, [update_feature_attributes(feature, '', attributes)],
+                                 [stroke for stroke in self.pending_strokes if stroke is not None])
 
         # Reset state
-        self.multi_line_segments = []
-        self.layer.startEditing()
-        self.rubber_band.reset(QgsWkbTypes.LineGeometry)
+        self.reset_segments()
 
     def get_multiline_string(self):
-        """Converts the list of line segments to a QgsMultiLineString
+        """Returns a copy of the finished line segments as a QgsMultiLineString
 
         :return: QgsMultiLineString
         """
-        multi_line = QgsMultiLineString()
-        for line in self.multi_line_segments:
-            multi_line.addGeometry(QgsLineString(line))
+        return self.multi_line.clone()
 
-        return multi_line
+    def reset_segments(self):
+        """Clears the stored line segments and both rubber bands."""
+        self.multi_line = QgsMultiLineString()
+        self.pending_strokes = []
+        self.rubber_band.reset(QgsWkbTypes.LineGeometry)
+        self.stroke_rubber_band.reset(QgsWkbTypes.LineGeometry)
 
     def remove_feature(self):
         """Remove the last unsaved line segment from the list and reset the rubber band."""
-        self.multi_line_segments = []
-        self.rubber_band.reset(QgsWkbTypes.LineGeometry)
\ No newline at end of file
+        self.writer.discard_strokes([stroke for stroke in self.pending_strokes if stroke is not None])
+        self.reset_segments()
\ No newline at end of file
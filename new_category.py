@@ -1,12 +1,11 @@
 
 from qgis.PyQt.QtWidgets import QDialog, QDialogButtonBox
-from qgis.PyQt import uic
 from qgis.core import QgsApplication
-import os
 
+from form_loader import load_form
 from keypad_manager import Keypad, KeypadItem
 
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "new_category.ui"))
+FORM_CLASS = load_form("new_category.ui")
 
 class NewCategory(QDialog, FORM_CLASS):
     """New category dialog."""
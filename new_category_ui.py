@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'new_category.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(697, 204)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        Dialog.setWindowIcon(icon)
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout_4.setContentsMargins(5, 5, 5, 5)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.frame = QtWidgets.QFrame(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frame.sizePolicy().hasHeightForWidth())
+        self.frame.setSizePolicy(sizePolicy)
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.frame)
+        self.verticalLayout.setContentsMargins(2, 2, 2, 2)
+        self.verticalLayout.setSpacing(1)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frame_2 = QtWidgets.QFrame(self.frame)
+        self.frame_2.setMaximumSize(QtCore.QSize(16777215, 50))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.frame_2.setFont(font)
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout_3.setContentsMargins(-1, 2, 2, 0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.label = QtWidgets.QLabel(self.frame_2)
+        self.label.setMinimumSize(QtCore.QSize(0, 40))
+        self.label.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.horizontalLayout_3.addWidget(self.label)
+        self.categoryLineEdit = QtWidgets.QLineEdit(self.frame_2)
+        self.categoryLineEdit.setMinimumSize(QtCore.QSize(0, 40))
+        self.categoryLineEdit.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.categoryLineEdit.setFont(font)
+        self.categoryLineEdit.setObjectName("categoryLineEdit")
+        self.horizontalLayout_3.addWidget(self.categoryLineEdit)
+        self.label_2 = QtWidgets.QLabel(self.frame_2)
+        self.label_2.setMinimumSize(QtCore.QSize(0, 40))
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 40))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.horizontalLayout_3.addWidget(self.label_2)
+        self.mColorButton = QgsColorButton(self.frame_2)
+        self.mColorButton.setMinimumSize(QtCore.QSize(24, 40))
+        self.mColorButton.setMaximumSize(QtCore.QSize(16777215, 40))
+        self.mColorButton.setColor(QtGui.QColor(84, 140, 161))
+        self.mColorButton.setObjectName("mColorButton")
+        self.horizontalLayout_3.addWidget(self.mColorButton)
+        self.verticalLayout.addWidget(self.frame_2)
+        self.frame_3 = QtWidgets.QFrame(self.frame)
+        self.frame_3.setMaximumSize(QtCore.QSize(16777215, 90))
+        self.frame_3.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.frame_3)
+        self.verticalLayout_3.setContentsMargins(-1, 2, 2, 2)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.label_3 = QtWidgets.QLabel(self.frame_3)
+        self.label_3.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.label_3.setFont(font)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_3.addWidget(self.label_3)
+        self.frame_4 = QtWidgets.QFrame(self.frame_3)
+        self.frame_4.setMaximumSize(QtCore.QSize(16777215, 55))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.frame_4.setFont(font)
+        self.frame_4.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_4)
+        self.horizontalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_4 = QtWidgets.QLabel(self.frame_4)
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 50))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_4.setFont(font)
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_2.addWidget(self.label_4)
+        self.elementsTextEdit = QtWidgets.QTextEdit(self.frame_4)
+        self.elementsTextEdit.setMaximumSize(QtCore.QSize(16777215, 50))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.elementsTextEdit.setFont(font)
+        self.elementsTextEdit.setObjectName("elementsTextEdit")
+        self.horizontalLayout_2.addWidget(self.elementsTextEdit)
+        self.verticalLayout_3.addWidget(self.frame_4)
+        self.verticalLayout.addWidget(self.frame_3)
+        self.frame_5 = QtWidgets.QFrame(self.frame)
+        self.frame_5.setMinimumSize(QtCore.QSize(0, 43))
+        self.frame_5.setMaximumSize(QtCore.QSize(16777215, 43))
+        self.frame_5.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_5.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_5.setObjectName("frame_5")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.frame_5)
+        self.horizontalLayout_4.setContentsMargins(10, 0, 10, 0)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.discardPushButton = QtWidgets.QPushButton(self.frame_5)
+        self.discardPushButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.discardPushButton.setMaximumSize(QtCore.QSize(125, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.discardPushButton.setFont(font)
+        self.discardPushButton.setObjectName("discardPushButton")
+        self.horizontalLayout_4.addWidget(self.discardPushButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem)
+        self.applyPushButton = QtWidgets.QPushButton(self.frame_5)
+        self.applyPushButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.applyPushButton.setMaximumSize(QtCore.QSize(125, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.applyPushButton.setFont(font)
+        self.applyPushButton.setObjectName("applyPushButton")
+        self.horizontalLayout_4.addWidget(self.applyPushButton)
+        self.verticalLayout.addWidget(self.frame_5)
+        self.verticalLayout_4.addWidget(self.frame)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "New Category"))
+        self.label.setText(_translate("Dialog", "Category: "))
+        self.label_2.setText(_translate("Dialog", "Colour"))
+        self.label_3.setText(_translate("Dialog", "If multiple: add as a comma seperated list (e.g.: val1,val2,...)"))
+        self.label_4.setText(_translate("Dialog", "Element(s): "))
+        self.discardPushButton.setText(_translate("Dialog", "Discard"))
+        self.applyPushButton.setText(_translate("Dialog", "Apply"))
+from qgis.gui import QgsColorButton
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "f5da3d0bc208a86d322cfaf02aa3651bb38343115ef364db8acbf42d2c1ff4a5"
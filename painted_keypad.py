@@ -0,0 +1,279 @@
+from array import array
+
+from qgis.PyQt.QtCore import Qt, QRect, QRectF
+from qgis.PyQt.QtGui import QPainter, QColor, QPen
+from qgis.PyQt.QtWidgets import QWidget, QSizePolicy
+
+from helper import adjust_color
+
+
+class KeypadCell:
+    """Handle of a painted keypad item, passed to the keypad click handler in place of a QPushButton."""
+
+    __slots__ = ('keypad', 'index')
+
+    def __init__(self, keypad, index):
+        """Constructor.
+
+        :param keypad: Painted keypad
+        :type keypad: PaintedKeypad
+
+        :param index: Index of the item
+        :type index: int
+        """
+        self.keypad = keypad
+        self.index = index
+
+    def setChecked(self, checked):
+        """Check or uncheck the item, like QPushButton.setChecked.
+
+        :param checked: Checked state
+        :type checked: bool
+        """
+        self.keypad.set_checked(self.index, checked)
+
+    def __eq__(self, other):
+        return isinstance(other, KeypadCell) and other.keypad is self.keypad and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.keypad), self.index))
+
+
+class PaintedKeypad(QWidget):
+    """Keypad painted as a single widget.
+    The items are kept in packed arrays, painted with QPainter and hit tested on click, and the cells are
+    reflowed into as many columns as fit the widget width without creating any child widgets.
+    """
+
+    margin = 1
+    spacing = 2
+
+    def __init__(self, on_click, parent=None):
+        """Constructor.
+
+        :param on_click: Called with the item name and a KeypadCell when an item is clicked
+        :type on_click: callable
+
+        :param parent: Parent widget
+        :type parent: QWidget, optional
+        """
+        super().__init__(parent)
+        self.on_click = on_click
+        self.names = []
+        self.colours = []
+        self.light_colours = []
+        self.colour_index = array('H')
+        self.checked = bytearray()
+        self.cell_width = 174
+        self.cell_height = 26
+        self.font_colour = QColor("#000000")
+        self.columns = 1
+        self.hover = -1
+        self.pressed = -1
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def set_items(self, items, height, width, font, font_colour):
+        """Set the keypad items and the cell style.
+
+        :param items: Keypad items, dictionaries with the item name and the category colour
+        :type items: list of dict
+
+        :param height: Cell height
+        :type height: int
+
+        :param width: Cell width
+        :type width: int
+
+        :param font: Cell font
+        :type font: QFont
+
+        :param font_colour: Cell font colour
+        :type font_colour: str
+        """
+        colour_indexes = {}
+        self.names = [i["item"] for i in items]
+        self.colour_index = array('H', (colour_indexes.setdefault(i["colour"], len(colour_indexes)) for i in items))
+        self.colours = [QColor(colour) for colour in colour_indexes]
+        self.light_colours = [QColor(adjust_color(colour, 30)) for colour in colour_indexes]
+        self.checked = bytearray(len(items))
+        self.cell_height = height
+        self.cell_width = width
+        self.font_colour = QColor(font_colour)
+        self.setFont(font)
+        self.hover = -1
+        self.pressed = -1
+        self.reflow(force=True)
+        self.update()
+
+    def set_checked(self, index, checked):
+        """Set the checked state of an item.
+
+        :param index: Index of the item
+        :type index: int
+
+        :param checked: Checked state
+        :type checked: bool
+        """
+        if 0 <= index < len(self.checked) and self.checked[index] != checked:
+            self.checked[index] = 1 if checked else 0
+            self.update(self.cell_rect(index))
+
+    def reflow(self, force=False):
+        """Update the number of columns for the widget width, and the widget height for the number of rows.
+
+        :param force: Update the height even if the number of columns did not change
+        :type force: bool
+        """
+        available = self.width() - 2 * self.margin + self.spacing
+        columns = max(1, available // (self.cell_width + self.spacing))
+        if columns == self.columns and not force:
+            return
+
+        self.columns = columns
+        rows = (len(self.names) + columns - 1) // columns
+        self.setFixedHeight(2 * self.margin + rows * (self.cell_height + self.spacing))
+        self.update()
+
+    def cell_rect(self, index):
+        """Get the rectangle of an item cell.
+
+        :param index: Index of the item
+        :type index: int
+
+        :return: QRect
+        """
+        row, column = divmod(index, self.columns)
+        return QRect(self.margin + column * (self.cell_width + self.spacing),
+                     self.margin + row * (self.cell_height + self.spacing),
+                     self.cell_width, self.cell_height)
+
+    def index_at(self, pos):
+        """Get the index of the item under a position.
+
+        :param pos: Position in widget coordinates
+        :type pos: QPoint
+
+        :return: Index of the item, -1 if there is no item under the position
+        """
+        x = pos.x() - self.margin
+        y = pos.y() - self.margin
+        if x < 0 or y < 0:
+            return -1
+
+        column, column_offset = divmod(x, self.cell_width + self.spacing)
+        row, row_offset = divmod(y, self.cell_height + self.spacing)
+        if column >= self.columns or column_offset >= self.cell_width or row_offset >= self.cell_height:
+            return -1
+
+        index = row * self.columns + column
+        return index if index < len(self.names) else -1
+
+    def paintEvent(self, event):
+        """Paint the item cells intersecting the update rectangle."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.font())
+        text_pen = QPen(self.font_colour)
+        checked_pen = QPen(Qt.black, 2)
+        exposed = event.rect()
+
+        row_height = self.cell_height + self.spacing
+        first_row = max(0, (exposed.top() - self.margin) // row_height)
+        last_row = (exposed.bottom() - self.margin) // row_height
+        first = first_row * self.columns
+        last = min(len(self.names), (last_row + 1) * self.columns)
+
+        for index in range(first, last):
+            rect = self.cell_rect(index)
+            if not rect.intersects(exposed):
+                continue
+
+            colours = self.light_colours if index == self.hover else self.colours
+            painter.setPen(checked_pen if self.checked[index] else Qt.NoPen)
+            painter.setBrush(colours[self.colour_index[index]])
+            painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 5, 5)
+            painter.setPen(text_pen)
+            painter.drawText(rect.adjusted(2, 2, -2, -2), Qt.AlignCenter, self.names[index])
+
+    def resizeEvent(self, event):
+        """Reflow the cells for the new width."""
+        super().resizeEvent(event)
+        self.reflow()
+
+    def mouseMoveEvent(self, event):
+        """Track the hovered item."""
+        index = self.index_at(event.pos())
+        if index != self.hover:
+            previous, self.hover = self.hover, index
+            for changed in (previous, index):
+                if changed >= 0:
+                    self.update(self.cell_rect(changed))
+
+    def leaveEvent(self, event):
+        """Clear the hovered item."""
+        if self.hover >= 0:
+            previous, self.hover = self.hover, -1
+            self.update(self.cell_rect(previous))
+
+    def mousePressEvent(self, event):
+        """Remember the pressed item."""
+        self.pressed = self.index_at(event.pos()) if event.button() == Qt.LeftButton else -1
+
+    def mouseReleaseEvent(self, event):
+        """Click the item if the mouse is released on the pressed item."""
+        index = self.index_at(event.pos())
+        if event.button() == Qt.LeftButton and index >= 0 and index == self.pressed:
+            self.on_click(self.names[index], KeypadCell(self, index))
+        self.pressed = -1
+
+
+class PaintedKeypadView:
+    """Shows the keypad items in a single PaintedKeypad in the category attribute layout."""
+
+    def __init__(self, attr_box, on_click):
+        """Constructor.
+
+        :param attr_box: Layout holding the keypad
+        :type attr_box: QVBoxLayout
+
+        :param on_click: Called with the item name and a KeypadCell when an item is clicked
+        :type on_click: callable
+        """
+        self.attr_box = attr_box
+        self.on_click = on_click
+        self.keypad = None
+
+    def populate(self, items, height, width, font, font_colour):
+        """Show the keypad items.
+
+        :param items: Keypad items, dictionaries with the item name and the category colour
+        :type items: list of dict
+
+        :param height: Cell height
+        :type height: int
+
+        :param width: Cell width
+        :type width: int
+
+        :param font: Cell font
+        :type font: QFont
+
+        :param font_colour: Cell font colour
+        :type font_colour: str
+        """
+        if self.keypad is None:
+            self.keypad = PaintedKeypad(self.on_click)
+            self.attr_box.addWidget(self.keypad)
+            self.attr_box.addStretch()
+        self.keypad.set_items(items, height, width, font, font_colour)
+
+    def clear(self):
+        """Remove the keypad."""
+        if self.keypad is None:
+            return
+
+        self.attr_box.takeAt(self.attr_box.count() - 1)
+        self.attr_box.removeWidget(self.keypad)
+        self.keypad.deleteLater()
+        self.keypad = None
@@ -0,0 +1,90 @@
+"""Compile the UI files of the plugin to Python form modules (<name>_ui.py), which form_loader.load_form
+imports instead of parsing the UI files when the plugin loads.
+
+Usage:
+    python scripts/compile_forms.py           compile the missing and outdated forms
+    python scripts/compile_forms.py --check   list the missing and outdated forms, exit with 1 if there are any
+"""
+import glob
+import hashlib
+import io
+import os
+import re
+import sys
+
+plugin_directory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# pyuic5 imports custom widgets from their header name, e.g. "from qgscolorbutton import QgsColorButton"
+custom_widget_import = re.compile(r"^from qgs\w+ import (\w+)$", re.MULTILINE)
+
+# hash of the UI file recorded in the compiled form, e.g. UI_HASH = "9f86d0..."
+ui_hash_assignment = re.compile(r'^UI_HASH = "(\w+)"$', re.MULTILINE)
+
+
+def get_ui_hash(ui_path):
+    """Get the hash of a UI file, as recorded in its compiled form and checked by form_loader.
+    Line endings are normalized, such that a checkout converting them does not outdate the forms.
+
+    :param ui_path: Path of the UI file
+    :type ui_path: str
+
+    :return: SHA-256 hex digest
+    """
+    with open(ui_path, "rb") as ui_file:
+        return hashlib.sha256(ui_file.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def get_outdated_forms():
+    """Get the UI files whose compiled form is missing or was compiled from another version of the UI file.
+
+    :return: List of UI file paths
+    """
+    outdated = []
+    for ui_path in sorted(glob.glob(os.path.join(plugin_directory, "*.ui"))):
+        compiled_path = f"{os.path.splitext(ui_path)[0]}_ui.py"
+        recorded_hash = None
+        if os.path.exists(compiled_path):
+            with open(compiled_path, "r", encoding="utf-8") as form_file:
+                match = ui_hash_assignment.search(form_file.read())
+            recorded_hash = match.group(1) if match else None
+        if recorded_hash != get_ui_hash(ui_path):
+            outdated.append(ui_path)
+    return outdated
+
+
+def compile_form(ui_path):
+    """Compile a UI file to its form module.
+
+    :param ui_path: Path of the UI file
+    :type ui_path: str
+    """
+    from PyQt5 import uic
+
+    output = io.StringIO()
+    with open(ui_path, "r", encoding="utf-8") as ui_file:
+        uic.compileUi(ui_file, output, from_imports=False)
+
+    # the header names the UI file, without the path of the machine the form was compiled on
+    source = output.getvalue().replace(ui_path, os.path.basename(ui_path), 1)
+    source = custom_widget_import.sub(r"from qgis.gui import \1", source)
+    source += ("\n\n# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs\n"
+               f'UI_HASH = "{get_ui_hash(ui_path)}"\n')
+    with open(f"{os.path.splitext(ui_path)[0]}_ui.py", "w", encoding="utf-8") as form_file:
+        form_file.write(source)
+
+
+def main(args):
+    outdated = get_outdated_forms()
+    if "--check" in args:
+        for ui_path in outdated:
+            print(f"outdated: {os.path.basename(ui_path)}")
+        return 1 if outdated else 0
+
+    for ui_path in outdated:
+        compile_form(ui_path)
+        print(f"compiled: {os.path.basename(ui_path)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,13 +1,12 @@
 
 from qgis.PyQt.QtWidgets import QDialog
-from qgis.PyQt import uic
 from qgis.core import QgsApplication
-import os
 
+from form_loader import load_form
 from helper import get_existing_enabled_layers
 
-# Load the UI file dynamically
-FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "select_existing_layer.ui"))
+# Load the compiled form of the UI file
+FORM_CLASS = load_form("select_existing_layer.ui")
 
 
 def add_items_to_combo_box(items, combo_box):
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'select_existing_layer.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_layerSelection(object):
+    def setupUi(self, layerSelection):
+        layerSelection.setObjectName("layerSelection")
+        layerSelection.resize(705, 235)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("icons/icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        layerSelection.setWindowIcon(icon)
+        self.gridLayout = QtWidgets.QGridLayout(layerSelection)
+        self.gridLayout.setContentsMargins(5, 5, 5, 5)
+        self.gridLayout.setObjectName("gridLayout")
+        self.frame_3 = QtWidgets.QFrame(layerSelection)
+        self.frame_3.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_3.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_3.setObjectName("frame_3")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.frame_3)
+        self.horizontalLayout_4.setContentsMargins(10, 1, 1, 1)
+        self.horizontalLayout_4.setSpacing(2)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label_3 = QtWidgets.QLabel(self.frame_3)
+        self.label_3.setMinimumSize(QtCore.QSize(120, 0))
+        self.label_3.setMaximumSize(QtCore.QSize(120, 16777215))
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_4.addWidget(self.label_3)
+        self.polygonsComboBox = QtWidgets.QComboBox(self.frame_3)
+        self.polygonsComboBox.setObjectName("polygonsComboBox")
+        self.horizontalLayout_4.addWidget(self.polygonsComboBox)
+        self.gridLayout.addWidget(self.frame_3, 2, 0, 1, 1)
+        self.frame_2 = QtWidgets.QFrame(layerSelection)
+        self.frame_2.setMinimumSize(QtCore.QSize(0, 45))
+        self.frame_2.setMaximumSize(QtCore.QSize(16777215, 45))
+        self.frame_2.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_2)
+        self.horizontalLayout_2.setContentsMargins(2, 2, 2, 2)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.rejectPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.rejectPushButton.setMinimumSize(QtCore.QSize(100, 40))
+        self.rejectPushButton.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.rejectPushButton.setFont(font)
+        self.rejectPushButton.setObjectName("rejectPushButton")
+        self.horizontalLayout_2.addWidget(self.rejectPushButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.confirmPushButton = QtWidgets.QPushButton(self.frame_2)
+        self.confirmPushButton.setMinimumSize(QtCore.QSize(100, 40))
+        self.confirmPushButton.setMaximumSize(QtCore.QSize(100, 40))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.confirmPushButton.setFont(font)
+        self.confirmPushButton.setObjectName("confirmPushButton")
+        self.horizontalLayout_2.addWidget(self.confirmPushButton)
+        self.gridLayout.addWidget(self.frame_2, 4, 0, 1, 1)
+        self.frame = QtWidgets.QFrame(layerSelection)
+        self.frame.setMinimumSize(QtCore.QSize(0, 35))
+        self.frame.setMaximumSize(QtCore.QSize(16777215, 40))
+        self.frame.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.frame)
+        self.horizontalLayout.setContentsMargins(10, 1, 1, 1)
+        self.horizontalLayout.setSpacing(2)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setMinimumSize(QtCore.QSize(120, 0))
+        self.label.setMaximumSize(QtCore.QSize(120, 16777215))
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.pointsComboBox = QtWidgets.QComboBox(self.frame)
+        self.pointsComboBox.setObjectName("pointsComboBox")
+        self.horizontalLayout.addWidget(self.pointsComboBox)
+        self.gridLayout.addWidget(self.frame, 1, 0, 1, 1)
+        self.frame_4 = QtWidgets.QFrame(layerSelection)
+        self.frame_4.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frame_4.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_4.setObjectName("frame_4")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.frame_4)
+        self.horizontalLayout_5.setContentsMargins(10, 1, 1, 1)
+        self.horizontalLayout_5.setSpacing(2)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.label_4 = QtWidgets.QLabel(self.frame_4)
+        self.label_4.setMinimumSize(QtCore.QSize(120, 0))
+        self.label_4.setMaximumSize(QtCore.QSize(120, 16777215))
+        self.label_4.setObjectName("label_4")
+        self.horizontalLayout_5.addWidget(self.label_4)
+        self.linesComboBox = QtWidgets.QComboBox(self.frame_4)
+        self.linesComboBox.setObjectName("linesComboBox")
+        self.horizontalLayout_5.addWidget(self.linesComboBox)
+        self.gridLayout.addWidget(self.frame_4, 3, 0, 1, 1)
+        self.infoLabel = QtWidgets.QLabel(layerSelection)
+        self.infoLabel.setEnabled(True)
+        self.infoLabel.setVisible(False)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        font.setBold(True)
+        font.setWeight(75)
+        self.infoLabel.setFont(font)
+        self.infoLabel.setObjectName("infoLabel")
+        self.gridLayout.addWidget(self.infoLabel, 0, 0, 1, 1)
+
+        self.retranslateUi(layerSelection)
+        QtCore.QMetaObject.connectSlotsByName(layerSelection)
+
+    def retranslateUi(self, layerSelection):
+        _translate = QtCore.QCoreApplication.translate
+        layerSelection.setWindowTitle(_translate("layerSelection", "Layer Selection"))
+        self.label_3.setText(_translate("layerSelection", "Polygon Layer:"))
+        self.rejectPushButton.setText(_translate("layerSelection", "Reject"))
+        self.confirmPushButton.setText(_translate("layerSelection", "Confirm"))
+        self.label.setText(_translate("layerSelection", "Point Layer:"))
+        self.label_4.setText(_translate("layerSelection", "Line Layer:"))
+        self.infoLabel.setText(_translate("layerSelection", "No sketch layers found. Layers created with an older version of the Sketch Tool may not be available."))
+
+
+# Hash of the UI file this form was compiled from, form_loader falls back to the UI file when it differs
+UI_HASH = "9e2198c0c26dc6d16c5ec86de5af16f0853f226af8a422f5c0a3480205646d8d"
@@ -0,0 +1,237 @@
+import json
+import os
+import struct
+import zlib
+
+from collections import OrderedDict
+
+
+class SketchJournal:
+    """Append-only journal of the sketch features not yet written to the sketch layers.
+    Each finished stroke is appended as a compact binary record (WKB plus attributes) on stylus up, in the map CRS
+    recorded with it, and each batch of features is appended in the layer CRS before it is written to the GeoPackage. A commit record is appended once a batch has
+    been written, or once a stroke has been saved as part of a batch or removed. Batches without a commit record
+    are the ones lost in a crash, and are replayed into the sketch layers on the next start.
+
+    Every record is framed as kind, payload length and CRC32 of the payload, such that a record torn by a
+    crash is detected and cut off when the journal is read back. The file is emptied whenever no batch is pending.
+    """
+
+    MAGIC = b'DSKJ\x01'
+    BATCH = 1
+    COMMIT = 2
+    STROKE = 3
+
+    _record_header = struct.Struct('<BII')
+    _uint = struct.Struct('<I')
+
+    def __init__(self, path):
+        """Constructor.
+
+        :param path: Path to the journal file.
+        :type path: str
+        """
+        self.path = path
+        self.file = None
+        self.pending = OrderedDict()
+        self.next_batch_id = 1
+
+    def open(self):
+        """Read the batches left pending by the previous session and open the journal for appending."""
+        self.pending = OrderedDict()
+        valid_length = self.read()
+
+        self.file = open(self.path, 'ab')
+        # drop the committed batches, or cut off a torn record so new records are not appended after it
+        self.file.truncate(valid_length if self.pending else 0)
+
+        if self.file.seek(0, os.SEEK_END) == 0:
+            self.file.write(self.MAGIC)
+            self.file.flush()
+
+    def read(self):
+        """Read the journal file into the pending batches.
+
+        :return: Length of the file up to the last complete record
+        """
+        if not os.path.exists(self.path):
+            return 0
+
+        with open(self.path, 'rb') as journal_file:
+            data = journal_file.read()
+
+        if not data.startswith(self.MAGIC):
+            return 0
+
+        offset = len(self.MAGIC)
+        while offset + self._record_header.size <= len(data):
+            kind, length, crc = self._record_header.unpack_from(data, offset)
+            start = offset + self._record_header.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+
+            if kind in (self.BATCH, self.STROKE):
+                crs = None
+                if kind == self.STROKE:
+                    # a stroke record is the CRS followed by a batch payload
+                    crs, batch_offset = self.decode_bytes(payload, 0)
+                    crs, payload = crs.decode('utf-8'), payload[batch_offset:]
+                batch_id, source, entries = self.decode_batch(payload)
+                self.pending[batch_id] = (source, entries, crs)
+                self.next_batch_id = max(self.next_batch_id, batch_id + 1)
+            elif kind == self.COMMIT:
+                self.pending.pop(self._uint.unpack(payload)[0], None)
+            offset = start + length
+
+        return offset
+
+    def append_batch(self, source, entries, replaces=(), crs=None):
+        """Append a batch of features to the journal.
+        The batches it replaces are committed in the same write, such that a crash never leaves both pending.
+
+        :param source: Data source of the sketch layer the batch is written to
+        :type source: str
+
+        :param entries: Features of the batch as (WKB, attributes) tuples
+        :type entries: list of tuple
+
+        :param replaces: IDs of the batches replaced by this batch, e.g. the strokes it saves
+        :type replaces: list of int, optional
+
+        :param crs: WKT of the CRS of a stroke in map coordinates, None for features in the layer CRS
+        :type crs: str, optional
+
+        :return: ID of the batch, None if the journal is not open
+        """
+        if self.file is None:
+            return None
+
+        batch_id = self.next_batch_id
+        self.next_batch_id += 1
+        if crs is None:
+            records = [self.encode_record(self.BATCH, self.encode_batch(batch_id, source, entries))]
+        else:
+            records = [self.encode_record(self.STROKE, self.encode_bytes(crs.encode('utf-8')) +
+                                          self.encode_batch(batch_id, source, entries))]
+        records += [self.encode_record(self.COMMIT, self._uint.pack(replaced)) for replaced in replaces
+                    if self.pending.pop(replaced, None) is not None]
+        self.write(b''.join(records))
+        self.pending[batch_id] = (source, entries, crs)
+        return batch_id
+
+    def commit(self, batch_id):
+        """Mark a batch as written to the sketch layer, or a stroke as discarded.
+        The journal is emptied once no batch is pending anymore.
+
+        :param batch_id: ID of the batch
+        :type batch_id: int
+        """
+        if self.file is None or self.pending.pop(batch_id, None) is None:
+            return
+
+        if self.pending:
+            self.write(self.encode_record(self.COMMIT, self._uint.pack(batch_id)))
+        else:
+            self.file.truncate(len(self.MAGIC))
+
+    def pending_batches(self):
+        """Get the batches that have not been written to the sketch layers.
+
+        :return: List of (batch ID, data source, entries, CRS) tuples, the CRS is None for features in the layer CRS
+        """
+        return [(batch_id, source, entries, crs) for batch_id, (source, entries, crs) in self.pending.items()]
+
+    def close(self):
+        """Close the journal file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def write(self, records):
+        """Append framed records to the journal.
+        The records are handed to the operating system right away, without waiting for them to reach the disk.
+
+        :param records: Framed records
+        :type records: bytes
+        """
+        self.file.write(records)
+        self.file.flush()
+
+    def encode_record(self, kind, payload):
+        """Frame a record with its kind, payload length and CRC32.
+
+        :param kind: Kind of the record, BATCH, STROKE or COMMIT
+        :type kind: int
+
+        :param payload: Record payload
+        :type payload: bytes
+
+        :return: Framed record
+        """
+        return self._record_header.pack(kind, len(payload), zlib.crc32(payload)) + payload
+
+    def encode_batch(self, batch_id, source, entries):
+        """Encode a batch record payload.
+
+        :param batch_id: ID of the batch
+        :type batch_id: int
+
+        :param source: Data source of the sketch layer
+        :type source: str
+
+        :param entries: Features of the batch as (WKB, attributes) tuples
+        :type entries: list of tuple
+
+        :return: Record payload
+        """
+        parts = [self._uint.pack(batch_id), self.encode_bytes(source.encode('utf-8')), self._uint.pack(len(entries))]
+        for wkb, attributes in entries:
+            parts.append(self.encode_bytes(bytes(wkb)))
+            parts.append(self.encode_bytes(json.dumps(attributes, separators=(',', ':'), default=str).encode('utf-8')))
+        return b''.join(parts)
+
+    def decode_batch(self, payload):
+        """Decode a batch record payload.
+
+        :param payload: Record payload
+        :type payload: bytes
+
+        :return: Tuple of batch ID, data source and entries
+        """
+        batch_id = self._uint.unpack_from(payload, 0)[0]
+        source, offset = self.decode_bytes(payload, self._uint.size)
+        count = self._uint.unpack_from(payload, offset)[0]
+        offset += self._uint.size
+
+        entries = []
+        for _ in range(count):
+            wkb, offset = self.decode_bytes(payload, offset)
+            attributes, offset = self.decode_bytes(payload, offset)
+            entries.append((wkb, json.loads(attributes.decode('utf-8'))))
+        return batch_id, source.decode('utf-8'), entries
+
+    def encode_bytes(self, value):
+        """Prefix a byte string with its length.
+
+        :param value: Byte string
+        :type value: bytes
+
+        :return: Length prefixed byte string
+        """
+        return self._uint.pack(len(value)) + value
+
+    def decode_bytes(self, payload, offset):
+        """Read a length prefixed byte string.
+
+        :param payload: Record payload
+        :type payload: bytes
+
+        :param offset: Offset of the length prefix
+        :type offset: int
+
+        :return: Tuple of the byte string and the offset after it
+        """
+        length = self._uint.unpack_from(payload, offset)[0]
+        start = offset + self._uint.size
+        return payload[start:start + length], start + length
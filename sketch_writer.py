@@ -0,0 +1,370 @@
+from collections import deque
+
+from qgis.PyQt.QtCore import QObject, pyqtSignal
+from qgis.core import (QgsApplication, QgsTask, QgsVectorLayer, QgsFeature, QgsGeometry, QgsProject,
+                       QgsCoordinateReferenceSystem, QgsCoordinateTransform, NULL)
+
+from helper import optimize_geometry, get_feature_location
+
+
+def feature_to_journal_entry(feature):
+    """Convert a feature to a journal entry.
+
+    :param feature: Feature to convert
+    :type feature: QgsFeature
+
+    :return: Tuple of the geometry as WKB and a dictionary of the non null attributes
+    """
+    attributes = {field.name(): value for field, value in zip(feature.fields(), feature.attributes())
+                  if value is not None and value != NULL}
+    return bytes(feature.geometry().asWkb()), attributes
+
+
+def journal_entry_to_feature(entry, fields):
+    """Convert a journal entry back to a feature.
+
+    :param entry: Tuple of the geometry as WKB and a dictionary of attributes
+    :type entry: tuple
+
+    :param fields: Fields of the layer the feature is added to
+    :type fields: QgsFields
+
+    :return: QgsFeature
+    """
+    wkb, attributes = entry
+    geometry = QgsGeometry()
+    geometry.fromWkb(wkb)
+    feature = QgsFeature(fields)
+    feature.setGeometry(geometry)
+    for name, value in attributes.items():
+        if fields.indexOf(name) >= 0:
+            feature.setAttribute(name, value)
+    return feature
+
+
+class SketchWriteTask(QgsTask):
+    """Task adding features to, or deleting features from, a sketch layer's GeoPackage off the GUI thread."""
+
+    def __init__(self, source, features=None, fids=None, entries=None, crs=None, simplify_tolerance=0,
+                 grid_precision=0):
+        """Constructor.
+
+        :param source: Data source of the sketch layer
+        :type source: str
+
+        :param features: Features to add
+        :type features: list of QgsFeature, optional
+
+        :param fids: IDs of the features to delete
+        :type fids: list of int, optional
+
+        :param entries: Journal entries to add as features, when replaying the journal
+        :type entries: list of tuple, optional
+
+        :param crs: WKT of the map CRS of journaled strokes, which are reprojected and optimized before they are added
+        :type crs: str, optional
+
+        :param simplify_tolerance: Simplification tolerance in metres applied to journaled strokes
+        :type simplify_tolerance: float, optional
+
+        :param grid_precision: Size of the coordinate grid in metres applied to journaled strokes
+        :type grid_precision: float, optional
+        """
+        super().__init__('Saving sketch features', QgsTask.Silent)
+        self.source = source
+        self.features = features if features is not None else []
+        self.fids = fids if fids is not None else []
+        self.entries = entries if entries is not None else []
+        self.crs = crs
+        self.simplify_tolerance = simplify_tolerance
+        self.grid_precision = grid_precision
+        # the transform context is read on the GUI thread, the project must not be used from the worker thread
+        self.transform_context = QgsProject.instance().transformContext() if crs else None
+        self.batch_id = None
+        self.added_features = []
+        self.error = None
+
+    def run(self):
+        """Writes the features with a provider owned by the worker thread.
+
+        :return: True if the features were written, False otherwise
+        """
+        layer = QgsVectorLayer(self.source, 'sketch_writer', 'ogr')
+        if not layer.isValid():
+            self.error = f'Could not open {self.source}'
+            return False
+
+        provider = layer.dataProvider()
+        if self.entries:
+            self.features = [journal_entry_to_feature(entry, provider.fields()) for entry in self.entries]
+            if self.crs:
+                self.features = self.prepare_strokes(self.features, layer.crs())
+
+        if self.features:
+            result, self.added_features = provider.addFeatures(self.features)
+            if not result:
+                self.error = provider.lastError()
+                return False
+
+        if self.fids and not provider.deleteFeatures(self.fids):
+            self.error = provider.lastError()
+            return False
+
+        return True
+
+    def prepare_strokes(self, features, layer_crs):
+        """Reproject journaled strokes from the map CRS to the layer CRS and optimize their geometries,
+        as the digitizing tools do when saving. The location attributes are updated from the new geometries.
+
+        :param features: Journaled strokes, in the map CRS
+        :type features: list of QgsFeature
+
+        :param layer_crs: CRS of the sketch layer
+        :type layer_crs: QgsCoordinateReferenceSystem
+
+        :return: Features in the layer CRS, a stroke that could not be reprojected is left out
+        """
+        map_crs = QgsCoordinateReferenceSystem.fromWkt(self.crs)
+        transform = QgsCoordinateTransform(map_crs, layer_crs, self.transform_context)
+        prepared = []
+        for feature in features:
+            geometry = feature.geometry()
+            if map_crs != layer_crs:
+                try:
+                    geometry.transform(transform)
+                except Exception as e:
+                    QgsApplication.messageLog().logMessage(f'Geometry transform failed: {e}', 'DigitalSketchPlugin')
+                    continue
+
+            geometry = optimize_geometry(geometry, layer_crs, self.simplify_tolerance, self.grid_precision)
+            feature.setGeometry(geometry)
+            lat, lon = get_feature_location(geometry, feature.attribute('shape'))
+            feature.setAttribute('LAT', f"{lat}")
+            feature.setAttribute('LON', f"{lon}")
+            prepared.append(feature)
+        return prepared
+
+
+class SketchWriter(QObject):
+    """Queues the writes of the digitizing tools and runs them one at a time as background tasks.
+    The sketch layers are reloaded and the result is reported through signals once a write has finished.
+    Added features are recorded in the journal before they are queued, and marked as committed once written.
+    The finished strokes of the digitizing tools are journaled on stylus up, and replaced by their batch on Done.
+    """
+
+    featuresWritten = pyqtSignal(object, list)
+    writeFailed = pyqtSignal(object, str)
+
+    def __init__(self, journal=None, parent=None):
+        """Constructor.
+
+        :param journal: Journal recording the features until they are written
+        :type journal: SketchJournal, optional
+
+        :param parent: Parent object
+        :type parent: QObject, optional
+        """
+        super().__init__(parent)
+        self.journal = journal
+        self.queue = deque()
+        self.active = None
+
+    def add_features(self, layer, features, strokes=()):
+        """Queue finished features to be added to a sketch layer.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param features: Features to add
+        :type features: list of QgsFeature
+
+        :param strokes: Journal IDs of the strokes saved as these features
+        :type strokes: list of int, optional
+        """
+        task = SketchWriteTask(layer.source(), features=features)
+        if self.journal is not None:
+            task.batch_id = self.journal.append_batch(layer.source(), [feature_to_journal_entry(feature)
+                                                                       for feature in features], strokes)
+        self.enqueue(layer, task)
+
+    def journal_stroke(self, layer, feature, crs):
+        """Record a finished stroke in the journal, such that it is recovered if QGIS closes before it is saved.
+        The stroke is recorded as drawn, it is only reprojected and optimized if it is replayed.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param feature: Stroke as a feature of the layer in map coordinates, with the attributes it would be saved with
+        :type feature: QgsFeature
+
+        :param crs: CRS of the map
+        :type crs: QgsCoordinateReferenceSystem
+
+        :return: Journal ID of the stroke, None if there is no journal
+        """
+        if self.journal is None:
+            return None
+        return self.journal.append_batch(layer.source(), [feature_to_journal_entry(feature)], crs=crs.toWkt())
+
+    def discard_strokes(self, strokes):
+        """Remove strokes removed by the user from the journal.
+
+        :param strokes: Journal IDs of the strokes
+        :type strokes: list of int
+        """
+        if self.journal is None:
+            return
+        for stroke in strokes:
+            self.journal.commit(stroke)
+
+    def delete_features(self, layer, fids):
+        """Queue features to be deleted from a sketch layer.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param fids: IDs of the features to delete
+        :type fids: list of int
+        """
+        self.enqueue(layer, SketchWriteTask(layer.source(), fids=fids))
+
+    def replay_journal(self, simplify_tolerance, grid_precision):
+        """Queue the journal batches left unwritten by a previous session, e.g. after a crash.
+
+        :param simplify_tolerance: Simplification tolerance in metres applied to the replayed strokes
+        :type simplify_tolerance: float
+
+        :param grid_precision: Size of the coordinate grid in metres applied to the replayed strokes
+        :type grid_precision: float
+
+        :return: Number of features replayed
+        """
+        if self.journal is None:
+            return 0
+
+        count = 0
+        for batch_id, source, entries, crs in self.journal.pending_batches():
+            task = SketchWriteTask(source, entries=entries, crs=crs, simplify_tolerance=simplify_tolerance,
+                                   grid_precision=grid_precision)
+            task.batch_id = batch_id
+            self.enqueue(None, task)
+            count += len(entries)
+        return count
+
+    def enqueue(self, layer, task):
+        """Queue a write task. Writes run in order, so a delete never overtakes the add of the same feature.
+
+        :param layer: Sketch layer, None when replaying the journal
+        :type layer: QgsVectorLayer
+
+        :param task: Write task
+        :type task: SketchWriteTask
+        """
+        self.queue.append((layer, task))
+        self.start_next()
+
+    def start_next(self):
+        """Start the next queued write if no write is running."""
+        if self.active is not None or not self.queue:
+            return
+
+        layer, task = self.queue.popleft()
+        self.active = (layer, task)
+        task.taskCompleted.connect(lambda: self.task_finished(layer, task, True))
+        task.taskTerminated.connect(lambda: self.task_finished(layer, task, False))
+        QgsApplication.taskManager().addTask(task)
+
+    def task_finished(self, layer, task, success):
+        """Reload the sketch layer and report the result of a finished write.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param task: Finished write task
+        :type task: SketchWriteTask
+
+        :param success: Whether the write succeeded
+        :type success: bool
+        """
+        self.active = None
+        self.report(layer, task, success)
+        self.start_next()
+
+    def report(self, layer, task, success):
+        """Emit the result signal of a write.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param task: Write task
+        :type task: SketchWriteTask
+
+        :param success: Whether the write succeeded
+        :type success: bool
+        """
+        if not success:
+            # a failed batch stays in the journal and is replayed on the next start
+            self.writeFailed.emit(layer, task.error or 'Saving sketch features was cancelled')
+            return
+
+        if self.journal is not None and task.batch_id is not None:
+            self.journal.commit(task.batch_id)
+
+        if layer is None:
+            # replayed batch, refresh the project layers reading the same data source
+            for project_layer in QgsProject.instance().mapLayers().values():
+                if project_layer.source() == task.source:
+                    project_layer.reload()
+                    project_layer.triggerRepaint()
+            return
+
+        layer.reload()
+        layer.triggerRepaint()
+        if task.added_features:
+            self.featuresWritten.emit(layer, task.added_features)
+
+    def is_busy(self):
+        """Checks if there are any writes running or queued.
+
+        :return: True if there are writes running or queued, False otherwise
+        """
+        return self.active is not None or len(self.queue) > 0
+
+    def flush(self, timeout=30000):
+        """Wait for the running write and run the queued writes on the calling thread.
+        Used when the plugin is unloaded, such that no finished sketch is lost. The running write is reported
+        here, as its finished signal would only be delivered after the plugin has gone away.
+
+        :param timeout: Time to wait for the running write in milliseconds
+        :type timeout: int
+
+        :return: True if every write has finished, False if the running write did not finish in time
+        """
+        if self.active is not None:
+            layer, task = self.active
+            if not task.waitForFinished(timeout):
+                # the running batch commits itself if it finishes later, the queued batches stay uncommitted in the
+                # journal and are replayed on the next start, rather than racing the running write on the GeoPackage
+                self.queue.clear()
+                return False
+
+            self.disconnect_task(task)
+            self.active = None
+            self.report(layer, task, task.status() == QgsTask.Complete)
+
+        while self.queue:
+            layer, task = self.queue.popleft()
+            self.report(layer, task, task.run())
+        return True
+
+    def disconnect_task(self, task):
+        """Disconnect the finished signals of a write task, such that it is not reported twice.
+
+        :param task: Write task
+        :type task: SketchWriteTask
+        """
+        for signal in (task.taskCompleted, task.taskTerminated):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass
@@ -0,0 +1,160 @@
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+_settings_group_ = "digital_sketch_mapping_tool"
+_default_budget_ms_ = 250
+_default_output_path_ = os.path.join(os.path.dirname(__file__), "data", "startup_profile.json")
+
+
+class StartupProfiler:
+    """Times the steps of the plugin startup, from classFactory to the end of initGui.
+    Profiling is enabled by the DIGITAL_SKETCH_PROFILE_STARTUP environment variable or the
+    digital_sketch_mapping_tool/profile_startup QSettings key. When it is disabled, steps are not timed.
+
+    The breakdown is written to the QGIS message log and to a JSON file, and a warning is logged when the total
+    startup time exceeds the budget set by the digital_sketch_mapping_tool/startup_budget_ms QSettings key.
+    """
+
+    def __init__(self, enabled=None):
+        """Constructor.
+
+        :param enabled: Whether to time the steps, read from the environment and settings if None
+        :type enabled: bool, optional
+        """
+        self.enabled = is_profiling_enabled() if enabled is None else enabled
+        self.steps = []
+        self.stack = []
+
+    def step(self, name):
+        """Time a startup step, used as a context manager. Steps may be nested.
+
+        :param name: Name of the step
+        :type name: str
+
+        :return: Context manager
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.timed_step(name)
+
+    def timed(self, name, finish=False):
+        """Decorator timing each call of a function as a startup step.
+
+        :param name: Name of the step
+        :type name: str
+
+        :param finish: Report the breakdown after the call, for the last startup step
+        :type finish: bool
+        """
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                try:
+                    with self.step(name):
+                        return function(*args, **kwargs)
+                finally:
+                    if finish:
+                        self.finish()
+            return wrapper
+        return decorator
+
+    @contextmanager
+    def timed_step(self, name):
+        """Context manager recording the duration of a step.
+
+        :param name: Name of the step
+        :type name: str
+        """
+        self.stack.append(name)
+        # the step is recorded when it starts, such that the steps are listed in call order
+        record = {"step": "/".join(self.stack), "depth": len(self.stack) - 1, "ms": 0.0}
+        self.steps.append(record)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["ms"] = round((time.perf_counter() - start) * 1000, 3)
+            self.stack.pop()
+
+    def total_ms(self):
+        """Get the total time of the top level steps.
+
+        :return: Total time in milliseconds
+        """
+        return round(sum(s["ms"] for s in self.steps if s["depth"] == 0), 3)
+
+    def breakdown(self):
+        """Get the recorded steps in call order, each step before the steps nested in it.
+
+        :return: List of dictionaries with the step path, depth and time in milliseconds
+        """
+        return list(self.steps)
+
+    def write_json(self, path, budget_ms):
+        """Write the breakdown to a JSON file.
+
+        :param path: Path to the JSON file
+        :type path: str
+
+        :param budget_ms: Startup budget in milliseconds
+        :type budget_ms: float
+        """
+        with open(path, "w", encoding="utf-8") as profile_file:
+            json.dump({"total_ms": self.total_ms(), "budget_ms": budget_ms, "steps": self.breakdown()},
+                      profile_file, indent=2)
+
+    def finish(self):
+        """Report the breakdown to the message log and the JSON file, then stop profiling.
+        The JSON file is data/startup_profile.json, unless DIGITAL_SKETCH_PROFILE_OUTPUT sets another path.
+        """
+        if not self.enabled or not self.steps:
+            return
+
+        from qgis.core import Qgis, QgsApplication
+
+        budget_ms = get_startup_budget_ms()
+        total_ms = self.total_ms()
+        lines = [f"startup: {total_ms:.1f} ms (budget {budget_ms:.0f} ms)"]
+        lines += [f"{'  ' * (s['depth'] + 1)}{s['step'].rsplit('/', 1)[-1]}: {s['ms']:.1f} ms" for s in self.breakdown()]
+        level = Qgis.Warning if total_ms > budget_ms else Qgis.Info
+        QgsApplication.messageLog().logMessage("\n".join(lines), "DigitalSketchPlugin", level)
+
+        output_path = os.environ.get("DIGITAL_SKETCH_PROFILE_OUTPUT", _default_output_path_)
+        try:
+            self.write_json(output_path, budget_ms)
+        except Exception as e:
+            QgsApplication.messageLog().logMessage(f"error: {e}", "DigitalSketchPlugin")
+
+        self.enabled = False
+
+
+def is_profiling_enabled():
+    """Checks if startup profiling is enabled by the environment variable or the settings key.
+
+    :return: True if profiling is enabled, False otherwise
+    """
+    value = os.environ.get("DIGITAL_SKETCH_PROFILE_STARTUP")
+    if value is not None:
+        return value.lower() in ("1", "true", "yes")
+
+    try:
+        from qgis.PyQt.QtCore import QSettings
+        return QSettings().value(f"{_settings_group_}/profile_startup", False, type=bool)
+    except Exception:
+        return False
+
+
+def get_startup_budget_ms():
+    """Get the startup time budget of the plugin.
+
+    :return: Budget in milliseconds
+    """
+    from qgis.PyQt.QtCore import QSettings
+    return QSettings().value(f"{_settings_group_}/startup_budget_ms", _default_budget_ms_, type=float)
+
+
+# profiler shared by classFactory and the plugin
+profiler = StartupProfiler()
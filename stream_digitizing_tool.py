@@ -4,11 +4,15 @@ from qgis.core import QgsWkbTypes, QgsPointXY, QgsFeature, QgsGeometry, QgsAppli
 from PyQt5.QtCore import Qt
 from qgis.PyQt.QtGui import QColor
 
-from helper import update_feature_attributes, reproject_to_destination_crs
+from frame_throttle import ThrottledRubberBand
+from helper import (update_feature_attributes, reproject_geometries, get_default_stream_tolerance,
+                    get_default_frame_rate, get_default_simplify_tolerance, get_default_grid_precision, optimize_geometry)
+from stream_simplifier import StreamSimplifier
+from stroke_buffer import StrokeBuffer
 
 
 class StreamDigitizingTool(QgsMapTool):
-    def __init__(self, iface, layer, layer_type):
+    def __init__(self, iface, layer, layer_type, writer, get_attributes):
         """Constructor
 
         :param iface: QGIS interface
@@ -19,17 +23,31 @@ class StreamDigitizingTool(QgsMapTool):
 
         :param layer_type: Type of layer, points/polygons
         :type layer_type: str
+
+        :param writer: Background writer saving the finished features to the layer
+        :type writer: SketchWriter
+
+        :param get_attributes: Returns the attributes the features would be saved with now, for the journal
+        :type get_attributes: callable
         """
         super().__init__(iface.mapCanvas())
-        self.number_of_items_to_update = 1
         self.iface = iface
         self.layer = layer
         self.layer_type = layer_type
-        self.stream_points = []
+        self.writer = writer
+        self.get_attributes = get_attributes
+        self.stream_points = StrokeBuffer()
         self.pending_features = []
+        self.pending_points = StrokeBuffer()
         self.pending_polygon_features = []
+        self.pending_strokes = []  # Journal IDs of the pending points or polygons, None if one was not journaled
         self.polygon_rubber_bands = []
         self.digitizing = False
+        self.stream_tolerance = get_default_stream_tolerance()
+        self.simplify_tolerance = get_default_simplify_tolerance()
+        self.grid_precision = get_default_grid_precision()
+        self.simplifier = StreamSimplifier()
+        self.throttle = ThrottledRubberBand(get_default_frame_rate())
         self.rubber_band = QgsRubberBand(self.iface.mapCanvas(),
                                          QgsWkbTypes.PointGeometry if layer_type == 'points' else QgsWkbTypes.PolygonGeometry)
         self.rubber_band.setColor(Qt.red)
@@ -38,6 +56,37 @@ class StreamDigitizingTool(QgsMapTool):
         self.rubber_band.setWidth(2)
 
 
+    def set_stream_tolerance(self, tolerance):
+        """Set the tolerance used to drop redundant vertices while streaming.
+
+        :param tolerance: Tolerance in screen pixels, 0 keeps every vertex.
+        :type tolerance: int
+        """
+        self.stream_tolerance = tolerance
+
+
+    def set_frame_rate(self, frame_rate):
+        """Set the maximum number of rubber band updates per second while streaming.
+
+        :param frame_rate: Rubber band updates per second
+        :type frame_rate: int
+        """
+        self.throttle.set_frame_rate(frame_rate)
+
+
+    def set_save_optimization(self, simplify_tolerance, grid_precision):
+        """Set the simplification and coordinate precision applied to the geometries when they are saved.
+
+        :param simplify_tolerance: Simplification tolerance in metres, 0 disables the simplification.
+        :type simplify_tolerance: float
+
+        :param grid_precision: Size of the coordinate grid in metres, 0 keeps full precision.
+        :type grid_precision: float
+        """
+        self.simplify_tolerance = simplify_tolerance
+        self.grid_precision = grid_precision
+
+
     def canvasPressEvent(self, event):
         """Start a new line segment on stylus down
 
@@ -78,25 +127,48 @@ class StreamDigitizingTool(QgsMapTool):
         :param event: The mouse event object containing details about the button press interaction on the map canvas
         :type event: QgsMapMouseEvent
         """
-        self.stream_points = [self.toMapCoordinates(event.pos())]
+        point = self.toMapCoordinates(event.pos())
+        self.stream_points = StrokeBuffer(point.x(), point.y())
+        self.simplifier.tolerance = self.stream_tolerance * self.canvas().mapUnitsPerPixel()
+        self.simplifier.start(point.x(), point.y())
         self.rubber_band = QgsRubberBand(self.iface.mapCanvas(),QgsWkbTypes.PolygonGeometry)
         self.rubber_band.setColor(Qt.red)
         self.rubber_band.setFillColor(QColor(255, 0, 0, 25))
         self.rubber_band.setWidth(2)
+        self.rubber_band.addPoint(point, True)
+        self.rubber_band.show()
+        self.throttle.start(self.rubber_band)
         self.digitizing = True
 
 
     def add_vertex(self, event):
         """Add a vertex to the rubber band.
         This method is called continuously while the stylus is pressed and is moving across the map canvas.
+        Vertices within the stream tolerance are dropped, or replace the last vertex, as they arrive.
+        The rubber band is updated by the frame throttle rather than on every move.
 
         :param event: The mouse event object contains details about the movement interaction on the map canvas
         :type event: QgsMapMouseEvent
         """
         point = self.toMapCoordinates(event.pos())
-        self.stream_points.append(point)
-        self.rubber_band.addPoint(point, True)
-        self.rubber_band.show()
+        self.apply_stream_action(self.simplifier.push(point.x(), point.y()), point)
+
+
+    def apply_stream_action(self, action, point):
+        """Apply the simplifier decision for a streamed vertex to the stream points and the rubber band.
+
+        :param action: Simplifier action, StreamSimplifier.APPEND, REPLACE or DROP
+        :type action: int
+
+        :param point: Streamed vertex in map coordinates
+        :type point: QgsPointXY
+        """
+        if action == StreamSimplifier.REPLACE:
+            self.stream_points.replace_last(point.x(), point.y())
+            self.throttle.move_last_point(point)
+        elif action == StreamSimplifier.APPEND:
+            self.stream_points.append(point.x(), point.y())
+            self.throttle.add_point(point)
 
 
     def finish_digitizing(self):
@@ -104,47 +176,70 @@ class StreamDigitizingTool(QgsMapTool):
         if not self.stream_points:
             return
 
-        if self.stream_points[0] != self.stream_points[-1]:
-            self.stream_points.append(self.stream_points[0])
+        action, tail = self.simplifier.finish()
+        if action != StreamSimplifier.DROP:
+            self.apply_stream_action(action, QgsPointXY(*tail))
+        self.throttle.stop()
+
+        self.stream_points.close()
 
-        # Finalize the rubber band
-        for pt in self.stream_points:
-            self.rubber_band.addPoint(pt, False)
+        # Finalize the rubber band, it already holds every stream point
         self.rubber_band.closePoints()
         self.rubber_band.show()
 
         # Store polygon and rubber band
-        self.pending_polygon_features.append(self.stream_points.copy())
+        self.pending_polygon_features.append(self.stream_points)
         self.polygon_rubber_bands.append(self.rubber_band)
+        self.pending_strokes.append(self.journal_stroke(QgsGeometry(self.stream_points.to_polygon())))
 
         # Reset for next polygon
-        self.stream_points = []
+        self.stream_points = StrokeBuffer()
         self.digitizing = False
 
 
-    def populate_feature_for_polygon(self):
-        """Populates the pending polygon features.
-        Loop through all pending polygon features and convert them to a QgsFeature.
-        If the layer is in a different CRS, reproject the geometry.
+    def populate_pending_features(self):
+        """Populates the pending features from the pending points or polygons.
+        Convert every pending point or polygon to a QgsFeature.
+        If the layer is in a different CRS, reproject the geometries as one batch,
+        then simplify them and snap them to the coordinate grid of the layer CRS.
+
+        :return: Journal IDs of the strokes of the populated features, a stroke whose geometry could not be
+            reprojected stays in the journal
         """
-        for polygon_feature in self.pending_polygon_features:
+        if self.layer_type == 'points':
+            geometries = [QgsGeometry.fromPointXY(QgsPointXY(x, y))
+                          for x, y in zip(self.pending_points.xs, self.pending_points.ys)]
+        else:
+            geometries = [QgsGeometry(polygon_feature.to_polygon()) for polygon_feature in self.pending_polygon_features]
 
-            geom = QgsGeometry.fromPolygonXY([polygon_feature])
+        canvas_crs = QgsProject.instance().crs()
+        layer_crs = self.layer.crs()
 
-            canvas_crs = QgsProject.instance().crs()
-            layer_crs = self.layer.crs()
+        if canvas_crs != layer_crs:
+            geometries = reproject_geometries(geometries, canvas_crs, layer_crs)
 
-            if canvas_crs != layer_crs:
-                geom = reproject_to_destination_crs(geom, canvas_crs, layer_crs)
+        geometries = [optimize_geometry(geom, layer_crs, self.simplify_tolerance, self.grid_precision)
+                      if geom is not None else None for geom in geometries]
+
+        fields = self.layer.fields()
+        strokes = []
+        # the journal IDs are kept in the order of the pending points or polygons, None if it was not journaled
+        for geom, stroke in zip(geometries, self.pending_strokes):
+            if geom is None:
+                self.iface.messageBar().pushMessage("Warning", "Geometry is None.", level=Qgis.Warning, duration=5)
+                continue
 
-            feature = QgsFeature(self.layer.fields())
+            feature = QgsFeature(fields)
             feature.setGeometry(geom)
             self.pending_features.append(feature)
+            if stroke is not None:
+                strokes.append(stroke)
+        return strokes
 
 
     def add_point(self, event):
         """Add a point to the rubber band.
-        If the canvas is in a different CRS compared to the layer, then reproject the point.
+        The point is kept in map coordinates and reprojected with the other pending points when saving.
 
         :param event: The mouse event object containing details about the button press interaction on the map canvas
         :type event: QgsMapMouseEvent
@@ -152,16 +247,25 @@ class StreamDigitizingTool(QgsMapTool):
         point = self.toMapCoordinates(event.pos())
         self.rubber_band.addPoint(point, True)
         self.rubber_band.show()
+        self.pending_points.append(point.x(), point.y())
+        self.pending_strokes.append(self.journal_stroke(QgsGeometry.fromPointXY(point)))
 
-        canvas_crs = QgsProject.instance().crs()
-        layer_crs = self.layer.crs()
-        geom = QgsGeometry.fromPointXY(point)
-        if canvas_crs != layer_crs:
-            geom = reproject_to_destination_crs(geom, canvas_crs, layer_crs)
 
+    def journal_stroke(self, geometry):
+        """Record a finished point or polygon in the sketch journal, with the attributes it would be saved with now,
+        such that it is recovered on the next start if QGIS closes before it is saved.
+        The geometry is journaled in map coordinates, it is only reprojected and optimized if it is replayed.
+
+        :param geometry: Geometry in map coordinates
+        :type geometry: QgsGeometry
+
+        :return: Journal ID of the stroke, None if it could not be journaled
+        """
         feature = QgsFeature(self.layer.fields())
-        feature.setGeometry(geom)
-        self.pending_features.append(feature)
+        feature.setGeometry(geometry)
+        return self.writer.journal_stroke(self.layer, update_feature_attributes(feature, self.layer_type,
+                                                                                self.get_attributes()),
+                                          QgsProject.instance().crs())
 
 
     def features_to_save(self):
@@ -170,53 +274,55 @@ class StreamDigitizingTool(QgsMapTool):
         :return: True if there are features to save, False otherwise.
         """
         if self.layer_type == 'points':
-            return len(self.pending_features) > 0
+            return len(self.pending_points) > 0
         else:
             return len(self.pending_polygon_features) > 0
 
 
     def save_feature(self, attributes):
-        """Saves the drawn polygon or point to the layer.
-        Loop thorough pending features and add them to the layer.
-        Check if a feature has geometry. If not, log a warning message to the Message Bar.
+        """Saves the drawn polygons or points to the layer.
+        Set the attributes on the pending features and hand them to the writer as one batch,
+        which writes them to the GeoPackage in the background so sketching can continue right away.
         Reset the arrays and rubber bands such that the drawn polygons/points are also not shown along with the saved features.
 
         :param attributes: Dictionary of attributes to add to the feature.
         :type attributes: dict
         """
-        if self.layer_type != 'points':
-            self.populate_feature_for_polygon()
+        strokes = self.populate_pending_features()
         if not self.pending_features:
             return
-        if not self.layer.isEditable():
-            self.layer.startEditing()
 
-        self.number_of_items_to_update = len(self.pending_features)
-        for feature in self.pending_features:
-            if feature.geometry() is None:
-                self.iface.messageBar().pushMessage("Warning", "Geometry is None.", level=Qgis.Warning, duration=5)
-                continue
-            self.layer.addFeature(update_feature_attributes(feature, self.layer_type, attributes))
+        features = [update_feature_attributes(feature, self.layer_type, attributes) for feature in self.pending_features]
+        self.writer.add_features(self.layer, features, strokes)
 
         self.pending_features = []
+        self.pending_points = StrokeBuffer()
         self.pending_polygon_features = []
+        self.pending_strokes = []
         for rubber_band in self.polygon_rubber_bands:
             rubber_band.reset(QgsWkbTypes.PolygonGeometry)
         self.polygon_rubber_bands = []
-        self.stream_points = []
-        self.layer.commitChanges()
-        self.layer.startEditing()
+        self.stream_points = StrokeBuffer()
         self.rubber_band.reset(QgsWkbTypes.PolygonGeometry if self.layer_type == 'polygons' else QgsWkbTypes.PointGeometry)
 
 
     def remove_feature(self):
         """Remove the last unsaved feature from the list and reset the rubber band."""
         if self.layer_type == 'points':
-            if len(self.pending_features) > 0:
-                self.pending_features.pop()
+            if len(self.pending_points) > 0:
+                self.pending_points.pop()
+                self.discard_last_stroke()
                 self.rubber_band.removeLastPoint()
                 self.rubber_band.show()
         else:
             if len(self.pending_polygon_features) > 0:
                 self.pending_polygon_features.pop()
-                self.polygon_rubber_bands.pop().reset(QgsWkbTypes.PolygonGeometry)
\ No newline at end of file
+                self.discard_last_stroke()
+                self.polygon_rubber_bands.pop().reset(QgsWkbTypes.PolygonGeometry)
+
+
+    def discard_last_stroke(self):
+        """Remove the last pending point or polygon from the journal."""
+        stroke = self.pending_strokes.pop()
+        if stroke is not None:
+            self.writer.discard_strokes([stroke])
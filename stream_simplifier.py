@@ -0,0 +1,158 @@
+import math
+
+
+def perpendicular_distance(px, py, ax, ay, bx, by):
+    """Distance of a point from the segment between two points.
+
+    :param px: X coordinate of the point
+    :param py: Y coordinate of the point
+    :param ax: X coordinate of the segment start
+    :param ay: Y coordinate of the segment start
+    :param bx: X coordinate of the segment end
+    :param by: Y coordinate of the segment end
+
+    :return: Distance from the point to the segment
+    """
+    dx = bx - ax
+    dy = by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        return math.hypot(px - ax, py - ay)
+
+    t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+class StreamSimplifier:
+    """Online vertex decimation for streamed strokes.
+
+    Every incoming vertex is first checked against the radial distance from the last kept vertex.
+    The last kept vertex is treated as floating: while the segment from the previous fixed vertex
+    to the incoming vertex stays within the tolerance of every vertex seen since, the floating vertex
+    is redundant and is replaced instead of a new vertex being appended (a one-pass Douglas-Peucker window).
+
+    The window also holds the vertices dropped near the floating vertex, as they have to stay within the tolerance
+    when it moves. Once the window is full, a dropped vertex widens the radius the last window vertex is checked
+    with instead, so every streamed vertex, kept or dropped, stays within the tolerance of the kept stroke.
+    """
+
+    APPEND = 0
+    REPLACE = 1
+    DROP = 2
+
+    def __init__(self, tolerance=0.0, max_window=32):
+        """Constructor.
+
+        :param tolerance: Tolerance in map units. A tolerance of 0 keeps every vertex.
+        :type tolerance: float
+
+        :param max_window: Maximum number of kept vertices checked against the window segment,
+            up to four times as many dropped vertices are checked with them.
+        :type max_window: int
+        """
+        self.tolerance = tolerance
+        self.max_window = max_window
+        self.anchor = None
+        self.floating = None
+        self.window = []  # (x, y, radius) of the window vertices
+        self.window_kept = 0
+        self.dropped = None
+
+    def start(self, x, y):
+        """Starts a new stroke from the given vertex.
+
+        :param x: X coordinate of the first vertex
+        :type x: float
+
+        :param y: Y coordinate of the first vertex
+        :type y: float
+        """
+        self.anchor = (x, y)
+        self.floating = None
+        self.window = []
+        self.window_kept = 0
+        self.dropped = None
+
+    def push(self, x, y):
+        """Pushes a streamed vertex.
+
+        :param x: X coordinate of the vertex
+        :type x: float
+
+        :param y: Y coordinate of the vertex
+        :type y: float
+
+        :return: APPEND if the vertex should be added, REPLACE if it replaces the last vertex, DROP if it is redundant
+        """
+        if self.anchor is None:
+            self.start(x, y)
+            return self.APPEND
+
+        if self.tolerance <= 0:
+            self.anchor = (x, y)
+            return self.APPEND
+
+        last_x, last_y = self.floating if self.floating is not None else self.anchor
+        if math.hypot(x - last_x, y - last_y) < self.tolerance:
+            self.dropped = (x, y)
+            # a vertex dropped near the anchor stays covered by it, one dropped near the floating vertex has to be
+            # checked again when the floating vertex moves
+            if self.floating is not None:
+                if len(self.window) < 4 * self.max_window:
+                    self.window.append((x, y, 0.0))
+                else:
+                    wx, wy, radius = self.window[-1]
+                    self.window[-1] = (wx, wy, max(radius, math.hypot(x - wx, y - wy)))
+            return self.DROP
+
+        self.dropped = None
+
+        if self.floating is not None and self.window_kept < self.max_window:
+            if self.window_covered_by(x, y):
+                self.window.append((x, y, 0.0))
+                self.window_kept += 1
+                self.floating = (x, y)
+                return self.REPLACE
+
+        if self.floating is not None:
+            self.anchor = self.floating
+        self.floating = (x, y)
+        self.window = [(x, y, 0.0)]
+        self.window_kept = 1
+        return self.APPEND
+
+    def window_covered_by(self, x, y):
+        """Checks if the segment from the anchor to a vertex stays within the tolerance of the window vertices
+        and of the vertices dropped near them.
+
+        :param x: X coordinate of the segment end
+        :type x: float
+
+        :param y: Y coordinate of the segment end
+        :type y: float
+
+        :return: True if the floating vertex can be moved to the vertex, False otherwise
+        """
+        ax, ay = self.anchor
+        return all(perpendicular_distance(px, py, ax, ay, x, y) + radius <= self.tolerance
+                   for px, py, radius in self.window)
+
+    def finish(self):
+        """Finishes the stroke.
+        The end of a stroke is kept even when it fell within the radial distance of the last vertex.
+
+        :return: A tuple of the action for the stroke end (APPEND, REPLACE or DROP) and its (x, y) coordinates
+        """
+        tail = self.dropped
+        action = self.DROP
+        if tail is not None:
+            action = self.APPEND
+            if self.floating is not None and self.window_covered_by(*tail):
+                action = self.REPLACE
+
+        self.anchor = None
+        self.floating = None
+        self.window = []
+        self.window_kept = 0
+        self.dropped = None
+        return action, tail
@@ -0,0 +1,85 @@
+from array import array
+
+from qgis.core import QgsLineString, QgsPolygon
+
+
+class StrokeBuffer:
+    """Compact store for the vertices of a sketched stroke.
+    The coordinates are held in contiguous x/y double arrays instead of one QgsPointXY per vertex,
+    and are passed to QgsLineString in a single call when the geometry is built.
+    """
+
+    __slots__ = ('xs', 'ys')
+
+    def __init__(self, x=None, y=None):
+        """Constructor.
+
+        :param x: X coordinate of the first vertex
+        :type x: float, optional
+
+        :param y: Y coordinate of the first vertex
+        :type y: float, optional
+        """
+        self.xs = array('d')
+        self.ys = array('d')
+        if x is not None and y is not None:
+            self.append(x, y)
+
+    def __len__(self):
+        """Returns the number of vertices in the stroke.
+
+        :return: Number of vertices
+        """
+        return len(self.xs)
+
+    def append(self, x, y):
+        """Appends a vertex to the stroke.
+
+        :param x: X coordinate of the vertex
+        :type x: float
+
+        :param y: Y coordinate of the vertex
+        :type y: float
+        """
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def replace_last(self, x, y):
+        """Replaces the last vertex of the stroke.
+
+        :param x: X coordinate of the vertex
+        :type x: float
+
+        :param y: Y coordinate of the vertex
+        :type y: float
+        """
+        self.xs[-1] = x
+        self.ys[-1] = y
+
+    def pop(self):
+        """Removes the last vertex of the stroke.
+
+        :return: The removed vertex as an (x, y) tuple
+        """
+        return self.xs.pop(), self.ys.pop()
+
+    def close(self):
+        """Closes the stroke by repeating the first vertex if the stroke does not end on it."""
+        if len(self.xs) > 0 and (self.xs[0] != self.xs[-1] or self.ys[0] != self.ys[-1]):
+            self.append(self.xs[0], self.ys[0])
+
+    def to_line_string(self):
+        """Builds a line string from the stroke vertices.
+
+        :return: QgsLineString
+        """
+        return QgsLineString(self.xs, self.ys)
+
+    def to_polygon(self):
+        """Builds a polygon with the stroke vertices as the exterior ring.
+
+        :return: QgsPolygon
+        """
+        polygon = QgsPolygon()
+        polygon.setExteriorRing(self.to_line_string())
+        return polygon
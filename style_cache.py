@@ -0,0 +1,82 @@
+import os
+
+from qgis.PyQt.QtXml import QDomDocument
+from qgis.core import QgsApplication, QgsAbstractVectorLayerLabeling, QgsFeatureRenderer, QgsReadWriteContext
+
+
+class StyleCache:
+    """Parses the QML styles of the sketch layers once per session into renderer and labeling objects,
+    which are cloned onto the layers instead of reading the QML file on every load.
+    A style is parsed again when the modification time of its file changes.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.styles = {}
+
+    def get_style(self, path):
+        """Get the parsed style of a QML file, parsing the file if it is not cached or has changed.
+
+        :param path: Path to the QML file
+        :type path: str
+
+        :return: Tuple of the renderer, the labeling (None if the style has no labeling) and the labels enabled flag
+        """
+        modified = os.path.getmtime(path)
+        cached = self.styles.get(path)
+        if cached is None or cached[0] != modified:
+            cached = (modified, *self.parse_style(path))
+            self.styles[path] = cached
+        return cached[1:]
+
+    def parse_style(self, path):
+        """Parse the renderer and labeling of a QML file.
+
+        :param path: Path to the QML file
+        :type path: str
+
+        :return: Tuple of the renderer, the labeling and the labels enabled flag
+        """
+        document = QDomDocument()
+        with open(path, 'rb') as style_file:
+            document.setContent(style_file.read())
+
+        root = document.documentElement()
+        context = QgsReadWriteContext()
+        renderer = QgsFeatureRenderer.load(root.firstChildElement('renderer-v2'), context)
+
+        labeling = None
+        labeling_element = root.firstChildElement('labeling')
+        if not labeling_element.isNull():
+            labeling = QgsAbstractVectorLayerLabeling.create(labeling_element, context)
+
+        return renderer, labeling, root.attribute('labelsEnabled') == '1'
+
+    def apply_style(self, layer, path):
+        """Apply a style to a layer from the cache.
+        If the style cannot be parsed, the QML file is loaded with loadNamedStyle instead.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param path: Path to the QML file
+        :type path: str
+        """
+        try:
+            renderer, labeling, labels_enabled = self.get_style(path)
+        except Exception as e:
+            QgsApplication.messageLog().logMessage(f"error: {e}", "DigitalSketchPlugin")
+            renderer = None
+
+        if renderer is None:
+            layer.loadNamedStyle(path)
+            return
+
+        layer.setRenderer(renderer.clone())
+        layer.setLabeling(labeling.clone() if labeling is not None else None)
+        layer.setLabelsEnabled(labels_enabled and labeling is not None)
+        layer.triggerRepaint()
+
+    def clear(self):
+        """Drop the parsed styles."""
+        self.styles.clear()
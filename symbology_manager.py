@@ -0,0 +1,92 @@
+from qgis.PyQt.QtGui import QColor
+from qgis.core import QgsSymbol, QgsRendererCategory, QgsCategorizedSymbolRenderer
+
+
+class SymbologyManager:
+    """Keeps the categorized colour renderer of the sketch polygon layers up to date.
+    The renderer is built once from the distinct colours of the layer, after that a category is only added
+    when a saved feature brings a colour that the layer has not seen yet, with one repaint per saved batch.
+    """
+
+    def __init__(self, iface):
+        """Constructor.
+
+        :param iface: QGIS interface
+        :type iface: QgsInterface
+        """
+        self.iface = iface
+        self.known_colours = {}
+
+    def forget(self, layer):
+        """Drop the known colours of a layer, e.g. when its style is reloaded.
+        The renderer is rebuilt from the layer on the next saved batch.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+        """
+        self.known_colours.pop(layer.id(), None)
+
+    def apply(self, layer):
+        """Build the categorized renderer from the distinct colours of the layer.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+        """
+        colours = {colour for colour in layer.uniqueValues(layer.fields().indexOf("colour")) if is_hex_colour(colour)}
+        categories = [self.create_category(layer, colour) for colour in colours]
+        layer.setRenderer(QgsCategorizedSymbolRenderer("colour", categories))
+        self.known_colours[layer.id()] = colours
+        layer.triggerRepaint()
+
+    def add_features(self, layer, features):
+        """Add a category for each colour first seen in a batch of saved features, then repaint the layer once.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param features: Saved features
+        :type features: list of QgsFeature
+        """
+        renderer = layer.renderer()
+        known_colours = self.known_colours.get(layer.id())
+        if (known_colours is None or not isinstance(renderer, QgsCategorizedSymbolRenderer)
+                or renderer.classAttribute() != "colour"):
+            # first batch for the layer, or the renderer was replaced outside the plugin
+            self.apply(layer)
+            return
+
+        new_colours = {feature["colour"] for feature in features if is_hex_colour(feature["colour"])} - known_colours
+        for colour in new_colours:
+            if renderer.categoryIndexForValue(colour) < 0:
+                renderer.addCategory(self.create_category(layer, colour))
+        known_colours.update(new_colours)
+
+        if new_colours:
+            layer.emitStyleChanged()
+            self.iface.layerTreeView().refreshLayerSymbology(layer.id())
+        layer.triggerRepaint()
+
+    def create_category(self, layer, colour):
+        """Create a renderer category for a colour.
+
+        :param layer: Sketch layer
+        :type layer: QgsVectorLayer
+
+        :param colour: Colour as a hex string
+        :type colour: str
+
+        :return: QgsRendererCategory
+        """
+        symbol = QgsSymbol.defaultSymbol(layer.geometryType())
+        symbol.setColor(QColor(colour))
+        return QgsRendererCategory(colour, symbol, colour)
+
+
+def is_hex_colour(value):
+    """Checks if an attribute value is a hex colour.
+
+    :param value: Attribute value
+
+    :return: True if the value is a hex colour string, False otherwise
+    """
+    return isinstance(value, str) and value.startswith("#")
@@ -0,0 +1,159 @@
+# coding=utf-8
+"""Keypad database handler test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'development@eskspatial.com.au'
+__date__ = '2026-10-18'
+__copyright__ = 'Copyright 2025, ESK Spatial'
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from data.db_handler import DbHandler
+from data.db_init import DbInit, data
+from data.db_migrations import SCHEMA_VERSION, get_schema_version
+
+
+class Row:
+    """Category or item row, hashed by identity like the keypad objects."""
+
+    def __init__(self, **columns):
+        self.__dict__.update(columns)
+
+
+class DbHandlerTest(unittest.TestCase):
+    """Test the keypad data is read and written through the handler connection."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "keypad_data.sqlite")
+        with redirect_stdout(StringIO()):
+            DbInit(self.db_path).init_db()
+        self.handler = DbHandler(self.db_path)
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.handler.close()
+        shutil.rmtree(self.directory)
+
+    def test_load_keypad_data(self):
+        """The default keypad is loaded in order."""
+        keypad = self.handler.load_keypad_data()
+        self.assertEqual([c["category"] for c in keypad], [c["category"] for c in data])
+        self.assertEqual([i["item"] for i in keypad[0]["items"]], data[0]["items"])
+
+    def test_load_category_without_items(self):
+        """A category without items is loaded with an empty item list."""
+        conn = self.handler.connection()
+        with conn:
+            conn.execute("INSERT INTO categories (category, selected, colour, sort_order) "
+                         "VALUES ('EMPTY', 0, '#000000', 100)")
+
+        keypad = self.handler.load_keypad_data()
+        self.assertEqual(keypad[-1]["category"], "EMPTY")
+        self.assertEqual(keypad[-1]["items"], [])
+        self.assertEqual(sum(len(c["items"]) for c in keypad), sum(len(c["items"]) for c in data))
+
+    def test_items_category_index(self):
+        """The items are indexed by category."""
+        indexes = [row[1] for row in self.handler.connection().execute("PRAGMA index_list(items)")]
+        self.assertIn("idx_items_category_sort_order", indexes)
+
+    def test_apply_changes(self):
+        """Only the changed rows are written, and the item IDs stay stable."""
+        keypad = self.handler.load_keypad_data()
+        first = Row(**keypad[0])
+        first.colour = "#000000"
+        renamed = Row(**first.items[1])
+        renamed.item = "Renamed"
+        new_item = Row(item_id=0, item="New", sort_order=100)
+        deleted_item_id = first.items[0]["item_id"]
+        deleted_category_id = keypad[1]["cat_id"]
+
+        changes = Row(categories={first}, items={renamed: first, new_item: first},
+                      deleted_categories={deleted_category_id}, deleted_items={deleted_item_id})
+        self.handler.apply_changes(changes)
+        self.assertTrue(new_item.item_id)
+
+        reloaded = self.handler.load_keypad_data()
+        self.assertEqual(len(reloaded), len(keypad) - 1)
+        self.assertNotIn(deleted_category_id, [c["cat_id"] for c in reloaded])
+        self.assertEqual(reloaded[0]["colour"], "#000000")
+        items = reloaded[0]["items"]
+        self.assertEqual([i["item_id"] for i in items],
+                         [i["item_id"] for i in keypad[0]["items"][1:]] + [new_item.item_id])
+        self.assertEqual(items[0]["item"], "Renamed")
+        self.assertEqual(items[-1]["item"], "New")
+        self.assertEqual(reloaded[1], keypad[2])
+
+    def test_legacy_database_upgraded(self):
+        """A database created before versioning is upgraded in place, keeping the IDs and the order of the rows."""
+        self.handler.close()
+        os.remove(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("CREATE TABLE categories (cat_id INTEGER PRIMARY KEY AUTOINCREMENT, category TEXT NOT NULL, "
+                         "selected BOOLEAN NOT NULL, colour TEXT NOT NULL)")
+            conn.execute("CREATE TABLE items (item_id INTEGER PRIMARY KEY AUTOINCREMENT, category_id INTEGER NOT NULL, "
+                         "item TEXT NOT NULL, FOREIGN KEY(category_id) REFERENCES categories(id))")
+            conn.executemany("INSERT INTO categories (category, selected, colour) VALUES (?, ?, ?)",
+                             [("BMAD", 1, "#FFC0CB"), ("DEAD", 0, "#FF9595")])
+            conn.executemany("INSERT INTO items (category_id, item) VALUES (?, ?)",
+                             [(1, "Stags"), (2, "D-tr_"), (1, "Other"), (9, "Orphan")])
+        conn.close()
+
+        keypad = self.handler.load_keypad_data()
+        self.assertEqual([(c["cat_id"], c["category"]) for c in keypad], [(1, "BMAD"), (2, "DEAD")])
+        self.assertEqual([(i["item_id"], i["item"]) for i in keypad[0]["items"]], [(1, "Stags"), (3, "Other")])
+
+        conn = self.handler.connection()
+        self.assertEqual(get_schema_version(conn), SCHEMA_VERSION)
+        self.assertEqual(conn.execute("SELECT count(*) FROM items").fetchone()[0], 3)
+        self.assertEqual(conn.execute("PRAGMA foreign_key_list(items)").fetchone()[3:5], ("category_id", "cat_id"))
+
+        # deleting a category deletes its items
+        self.handler.apply_changes(Row(categories=set(), items={}, deleted_categories={1}, deleted_items=set()))
+        self.assertEqual(conn.execute("SELECT item FROM items").fetchall(), [("D-tr_",)])
+
+    def test_data_version(self):
+        """The data version changes when another connection commits, not for the handler's own writes."""
+        version = self.handler.data_version()
+        first = Row(**self.handler.load_keypad_data()[0])
+        first.selected = True
+        self.handler.apply_changes(Row(categories={first}, items={}, deleted_categories=set(), deleted_items=set()))
+        self.assertEqual(self.handler.data_version(), version)
+
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("UPDATE categories SET selected = 0")
+        conn.close()
+        self.assertNotEqual(self.handler.data_version(), version)
+
+    def test_connection_is_reused(self):
+        """The thread connection is opened once, in WAL mode, and closed by close()."""
+        conn = self.handler.connection()
+        self.handler.load_keypad_data()
+        self.handler.data_version()
+        self.assertIs(self.handler.connection(), conn)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+        self.handler.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        self.assertIsNot(self.handler.connection(), conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
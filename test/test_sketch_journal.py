@@ -0,0 +1,97 @@
+# coding=utf-8
+"""Sketch journal test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'development@eskspatial.com.au'
+__date__ = '2026-10-18'
+__copyright__ = 'Copyright 2025, ESK Spatial'
+
+import os
+import tempfile
+import unittest
+
+from sketch_journal import SketchJournal
+
+POINT_WKB = bytes.fromhex('0101000000000000000000f03f0000000000000040')
+SOURCE = '/tmp/sketch.gpkg|layername=points'
+MAP_CRS = 'GEOGCRS["WGS 84",ID["EPSG",4326]]'
+
+
+class SketchJournalTest(unittest.TestCase):
+    """Test the append-only sketch journal."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sketch_journal.bin')
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.directory.cleanup()
+
+    def reopen(self):
+        """Open the journal as on the next start of the plugin."""
+        journal = SketchJournal(self.path)
+        journal.open()
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_uncommitted_batch_is_replayed(self):
+        """A batch without a commit record is pending after a restart."""
+        journal = self.reopen()
+        first = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'BMAD_L'})])
+        second = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'Poss_'})])
+        journal.commit(first)
+        journal.close()
+
+        pending = self.reopen().pending_batches()
+        self.assertEqual(pending, [(second, SOURCE, [(POINT_WKB, {'Code': 'Poss_'})], None)])
+
+    def test_journal_is_emptied_when_all_batches_are_committed(self):
+        """Committing the last pending batch empties the journal file."""
+        journal = self.reopen()
+        journal.commit(journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'BMAD_L'})]))
+        self.assertEqual(os.path.getsize(self.path), len(SketchJournal.MAGIC))
+        journal.close()
+        self.assertEqual(self.reopen().pending_batches(), [])
+
+    def test_saved_strokes_are_replaced_by_their_batch(self):
+        """Strokes saved as a batch are committed with it, and only unsaved strokes are pending after a restart."""
+        journal = self.reopen()
+        first = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': ''})], crs=MAP_CRS)
+        second = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': ''})], crs=MAP_CRS)
+        third = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': ''})], crs=MAP_CRS)
+        batch_id = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'BMAD_L'})] * 2, [first, second])
+        journal.commit(batch_id)
+        journal.close()
+
+        pending = self.reopen().pending_batches()
+        self.assertEqual(pending, [(third, SOURCE, [(POINT_WKB, {'Code': ''})], MAP_CRS)])
+
+    def test_torn_record_is_cut_off(self):
+        """A record torn by a crash is ignored and later records still replay."""
+        journal = self.reopen()
+        journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'BMAD_L'})])
+        journal.close()
+        with open(self.path, 'ab') as journal_file:
+            journal_file.write(b'\x01\xff\x00')
+
+        journal = self.reopen()
+        self.assertEqual(len(journal.pending_batches()), 1)
+        batch_id = journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'Poss_'})])
+        journal.close()
+
+        pending = self.reopen().pending_batches()
+        self.assertEqual([batch[0] for batch in pending], [1, batch_id])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(SketchJournalTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,87 @@
+# coding=utf-8
+"""Sketch writer test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'development@eskspatial.com.au'
+__date__ = '2026-10-18'
+__copyright__ = 'Copyright 2025, ESK Spatial'
+
+import os
+import tempfile
+import time
+import unittest
+
+from sketch_journal import SketchJournal
+from sketch_writer import SketchWriter, SketchWriteTask
+
+from utilities import get_qgis_app
+
+QGIS_APP = get_qgis_app()
+
+POINT_WKB = bytes.fromhex('0101000000000000000000f03f0000000000000040')
+SOURCE = '/tmp/sketch.gpkg|layername=points'
+
+
+class SlowWriteTask(SketchWriteTask):
+    """Write task that takes a while to finish without touching a GeoPackage."""
+
+    def __init__(self, source, duration):
+        super().__init__(source)
+        self.duration = duration
+
+    def run(self):
+        time.sleep(self.duration)
+        return True
+
+
+class SketchWriterTest(unittest.TestCase):
+    """Test the writer commits its batches when the plugin is unloaded."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sketch_journal.bin')
+        self.journal = SketchJournal(self.path)
+        self.journal.open()
+        self.writer = SketchWriter(self.journal)
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.journal.close()
+        self.directory.cleanup()
+
+    def enqueue(self, duration):
+        """Queue a journaled batch written by a slow task."""
+        task = SlowWriteTask(SOURCE, duration)
+        task.batch_id = self.journal.append_batch(SOURCE, [(POINT_WKB, {'Code': 'BMAD_L'})])
+        self.writer.enqueue(None, task)
+        return task
+
+    def test_flush_commits_running_batch(self):
+        """A batch in flight when the writer is flushed is committed before flush returns."""
+        self.enqueue(0.2)
+        self.enqueue(0)
+        self.assertIsNotNone(self.writer.active)
+
+        self.assertTrue(self.writer.flush())
+        self.assertFalse(self.writer.is_busy())
+        self.assertEqual(self.journal.pending_batches(), [])
+
+    def test_flush_timeout_leaves_batch_uncommitted(self):
+        """A batch still running when the flush times out stays in the journal to be replayed."""
+        task = self.enqueue(1)
+        self.assertFalse(self.writer.flush(timeout=10))
+        self.assertEqual(len(self.journal.pending_batches()), 1)
+        task.waitForFinished()
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(SketchWriterTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
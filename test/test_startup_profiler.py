@@ -0,0 +1,74 @@
+# coding=utf-8
+"""Startup profiler test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'development@eskspatial.com.au'
+__date__ = '2026-10-18'
+__copyright__ = 'Copyright 2025, ESK Spatial'
+
+import json
+import os
+import tempfile
+import unittest
+
+from startup_profiler import StartupProfiler
+
+
+class StartupProfilerTest(unittest.TestCase):
+    """Test the startup steps are timed and reported."""
+
+    def test_disabled_records_nothing(self):
+        """Steps are not recorded when profiling is disabled."""
+        profiler = StartupProfiler(enabled=False)
+        with profiler.step("classFactory"):
+            pass
+        self.assertEqual(profiler.steps, [])
+
+    def test_nested_steps_in_call_order(self):
+        """Nested steps are listed after their parent step, in call order."""
+        profiler = StartupProfiler(enabled=True)
+
+        @profiler.timed("__init__")
+        def construct():
+            with profiler.step("dock widget"):
+                pass
+            with profiler.step("KeypadManager"):
+                pass
+
+        with profiler.step("classFactory"):
+            with profiler.step("imports"):
+                pass
+            construct()
+        with profiler.step("initGui"):
+            pass
+
+        self.assertEqual([s["step"] for s in profiler.breakdown()],
+                         ["classFactory", "classFactory/imports", "classFactory/__init__",
+                          "classFactory/__init__/dock widget", "classFactory/__init__/KeypadManager", "initGui"])
+        self.assertEqual(profiler.total_ms(), round(profiler.steps[0]["ms"] + profiler.steps[-1]["ms"], 3))
+
+    def test_write_json(self):
+        """The breakdown is written with the total and the budget."""
+        profiler = StartupProfiler(enabled=True)
+        with profiler.step("initGui"):
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "startup_profile.json")
+            profiler.write_json(path, 250)
+            with open(path, encoding="utf-8") as profile_file:
+                profile = json.load(profile_file)
+
+        self.assertEqual(profile["budget_ms"], 250)
+        self.assertEqual(profile["steps"][0]["step"], "initGui")
+        self.assertEqual(profile["total_ms"], profiler.total_ms())
+
+
+if __name__ == "__main__":
+    unittest.main()
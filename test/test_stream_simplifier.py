@@ -0,0 +1,111 @@
+# coding=utf-8
+"""Stream simplifier test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'development@eskspatial.com.au'
+__date__ = '2026-10-18'
+__copyright__ = 'Copyright 2025, ESK Spatial'
+
+import math
+import random
+import unittest
+
+from stream_simplifier import StreamSimplifier, perpendicular_distance
+
+
+def simplify(points, tolerance):
+    """Run the points through the simplifier and collect the kept vertices."""
+    simplifier = StreamSimplifier(tolerance)
+    simplifier.start(*points[0])
+    kept = [points[0]]
+    for x, y in points[1:]:
+        action = simplifier.push(x, y)
+        if action == StreamSimplifier.APPEND:
+            kept.append((x, y))
+        elif action == StreamSimplifier.REPLACE:
+            kept[-1] = (x, y)
+    action, tail = simplifier.finish()
+    if action == StreamSimplifier.APPEND:
+        kept.append(tail)
+    elif action == StreamSimplifier.REPLACE:
+        kept[-1] = tail
+    return kept
+
+
+def max_deviation(points, kept):
+    """Largest distance of the streamed points from the kept polyline."""
+    if len(kept) == 1:
+        kept = kept * 2
+    segments = list(zip(kept, kept[1:]))
+    return max(min(perpendicular_distance(px, py, ax, ay, bx, by) for (ax, ay), (bx, by) in segments)
+               for px, py in points)
+
+
+class StreamSimplifierTest(unittest.TestCase):
+    """Test the online vertex decimation."""
+
+    def test_zero_tolerance_keeps_every_vertex(self):
+        """A tolerance of 0 keeps every streamed vertex."""
+        points = [(i, i % 2) for i in range(10)]
+        self.assertEqual(simplify(points, 0), points)
+
+    def test_collinear_vertices_are_dropped(self):
+        """A straight stroke collapses to its end points."""
+        points = [(i * 0.1, 0.0) for i in range(100)]
+        self.assertEqual(simplify(points, 0.5), [points[0], points[-1]])
+
+    def test_corner_is_kept(self):
+        """A right angle keeps a vertex within the tolerance of the corner."""
+        points = [(i * 0.1, 0.0) for i in range(51)] + [(5.0, i * 0.1) for i in range(1, 51)]
+        kept = simplify(points, 0.2)
+        self.assertEqual(len(kept), 3)
+        self.assertAlmostEqual(kept[1][0], 5.0)
+        self.assertLessEqual(kept[1][1], 0.2)
+        self.assertEqual(kept[-1], points[-1])
+
+    def test_points_stay_within_tolerance(self):
+        """Every streamed vertex, kept or dropped, stays within the tolerance of the kept stroke."""
+        rng = random.Random(20261018)
+        for tolerance in (0.05, 0.2, 1.0):
+            for _ in range(50):
+                # a wandering stroke with slow, jittery stretches, as from a hand held stylus
+                x, y, heading = 0.0, 0.0, 0.0
+                points = [(x, y)]
+                for _ in range(rng.randint(2, 400)):
+                    heading += rng.uniform(-0.6, 0.6)
+                    step = rng.choice((0.01, 0.05, 0.3))
+                    x += step * rng.uniform(0.2, 1.0) * (1 if rng.random() < 0.9 else -1) * math.cos(heading)
+                    y += step * rng.uniform(0.2, 1.0) * math.sin(heading)
+                    points.append((x, y))
+
+                kept = simplify(points, tolerance)
+                self.assertLessEqual(max_deviation(points, kept), tolerance + 1e-9)
+                self.assertEqual(kept[0], points[0])
+
+    def test_radial_distance_drops_close_vertices(self):
+        """Vertices within the tolerance of the last vertex are dropped."""
+        simplifier = StreamSimplifier(1.0)
+        simplifier.start(0, 0)
+        self.assertEqual(simplifier.push(0.5, 0.5), StreamSimplifier.DROP)
+        self.assertEqual(simplifier.push(2.0, 0.0), StreamSimplifier.APPEND)
+
+    def test_finish_keeps_stroke_end(self):
+        """The last streamed vertex is returned on finish when it was dropped."""
+        simplifier = StreamSimplifier(1.0)
+        simplifier.start(0, 0)
+        simplifier.push(2.0, 0.0)
+        simplifier.push(2.5, 0.0)
+        self.assertEqual(simplifier.finish(), (StreamSimplifier.REPLACE, (2.5, 0.0)))
+        self.assertEqual(simplifier.finish(), (StreamSimplifier.DROP, None))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(StreamSimplifierTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)